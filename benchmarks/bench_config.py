@@ -0,0 +1,38 @@
+import json
+
+import yaml
+
+from wimsey.config import collect_tests, read_config
+
+from benchmarks.common import COLUMNS, make_contract
+
+
+class ReadConfig:
+    """Read and parse contracts of a few tests per column from file"""
+
+    params = (COLUMNS, ["json", "yaml"])
+    param_names = ["columns", "format"]
+
+    def setup(self, columns: int, format: str) -> None:
+        contract = make_contract(columns)
+        self.path = f"contract-{columns}.{format}"
+        with open(self.path, "w") as file:
+            file.write(
+                json.dumps(contract) if format == "json" else yaml.dump(contract)
+            )
+
+    def time_read_config(self, columns: int, format: str) -> None:
+        read_config(self.path)
+
+
+class CollectTests:
+    """Build test functions from an already parsed contract"""
+
+    params = COLUMNS
+    param_names = ["columns"]
+
+    def setup(self, columns: int) -> None:
+        self.contract = make_contract(columns)
+
+    def time_collect_tests(self, columns: int) -> None:
+        collect_tests(self.contract)
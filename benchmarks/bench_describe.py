@@ -0,0 +1,184 @@
+import narwhals.stable.v1 as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from wimsey import arrow, parquet
+from wimsey.dataframe import (
+    _describe_query,
+    describe,
+    parallel_describe,
+    partial_describe,
+)
+
+from benchmarks.common import BACKENDS, COLUMNS, ROWS, make_frame
+
+
+class Describe:
+    """Describe dataframes of each backend, across row and column counts"""
+
+    params = (BACKENDS, ROWS, COLUMNS)
+    param_names = ["backend", "rows", "columns"]
+    timeout = 600
+
+    def setup(self, backend: str, rows: int, columns: int) -> None:
+        self.df = make_frame(backend, rows, columns)
+
+    def time_describe(self, backend: str, rows: int, columns: int) -> None:
+        describe(self.df)
+
+    def peakmem_describe(self, backend: str, rows: int, columns: int) -> None:
+        describe(self.df)
+
+
+class LazyDescribe:
+    """
+    Describe a lazily scanned parquet file, peak memory should track the number
+    of metrics calculated rather than the number of rows in the file.
+    """
+
+    params = [10_000, 1_000_000, 10_000_000]
+    param_names = ["rows"]
+
+    def setup_cache(self) -> dict[int, str]:
+        paths = {}
+        for rows in self.params:
+            path = f"lazy-describe-{rows}.parquet"
+            pl.DataFrame(
+                {f"column_{i}": np.random.rand(rows) for i in range(20)}
+            ).write_parquet(path)
+            paths[rows] = path
+        return paths
+
+    def time_describe(self, paths: dict[int, str], rows: int) -> None:
+        describe(pl.scan_parquet(paths[rows]), columns=["column_0", "column_1"])
+
+    def peakmem_describe(self, paths: dict[int, str], rows: int) -> None:
+        describe(pl.scan_parquet(paths[rows]), columns=["column_0", "column_1"])
+
+
+class ParallelDescribe:
+    """
+    Describe a large eager pandas dataframe split across a number of workers,
+    on a machine with enough cores this should scale close to linearly.
+    """
+
+    params = ([1, 2, 4, 8, 16], [False, True])
+    param_names = ["workers", "processes"]
+    timeout = 600
+
+    def setup(self, workers: int, processes: bool) -> None:
+        self.df = pd.DataFrame(
+            {f"column_{i}": np.random.rand(10_000_000) for i in range(10)}
+        )
+
+    def time_parallel_describe(self, workers: int, processes: bool) -> None:
+        parallel_describe(self.df, workers=workers, processes=processes)
+
+
+class WideDescribe:
+    """
+    Describe very wide lazy dataframes, in a single query, or in batches of
+    columns. Planning tracks only the time taken to build the query.
+    """
+
+    params = ([100, 1_000, 5_000], [None, 250, 1_000])
+    param_names = ["columns", "column_batch_size"]
+    timeout = 600
+
+    def setup(self, columns: int, column_batch_size: int | None) -> None:
+        self.df = pl.LazyFrame(
+            {f"column_{i}": np.random.rand(1_000) for i in range(columns)}
+        )
+
+    def time_planning(self, columns: int, column_batch_size: int | None) -> None:
+        df = nw.from_native(self.df)
+        size = column_batch_size or columns
+        for i in range(0, columns, size):
+            _describe_query(
+                df, [f"column_{j}" for j in range(i, min(i + size, columns))]
+            )
+
+    def time_describe(self, columns: int, column_batch_size: int | None) -> None:
+        describe(self.df, column_batch_size=column_batch_size)
+
+
+class ParquetMetadataDescribe:
+    """
+    Describe parquet files from footer statistics, compared to scanning them,
+    for metrics parquet statistics can answer.
+    """
+
+    params = [1_000_000, 10_000_000]
+    param_names = ["rows"]
+    metrics = ["min", "max", "null", "length"]
+
+    def setup_cache(self) -> dict[int, str]:
+        paths = {}
+        for rows in self.params:
+            path = f"parquet-metadata-{rows}.parquet"
+            make_frame("polars", rows, 20).write_parquet(path)
+            paths[rows] = path
+        return paths
+
+    def time_metadata_describe(self, paths: dict[int, str], rows: int) -> None:
+        parquet.describe(paths[rows], metrics=self.metrics)
+
+    def time_scan_describe(self, paths: dict[int, str], rows: int) -> None:
+        describe(pl.scan_parquet(paths[rows]), metrics=self.metrics)
+
+
+class ApproximateDescribe:
+    """
+    Describe approximate quantiles and distinct counts, sketched in a single
+    pass over batches of rows, and the mergeable sketches of a partial
+    describe, peak memory should be bounded by the columns sketched rather than
+    the whole dataframe.
+    """
+
+    params = (
+        ["quantiles", "distinct_count"],
+        [10_000, 1_000_000],
+        ["pandas", "polars", "polars-lazy"],
+    )
+    param_names = ["metric", "rows", "backend"]
+    timeout = 600
+
+    def setup(self, metric: str, rows: int, backend: str) -> None:
+        self.df = make_frame(backend, rows, 10)
+
+    def time_describe(self, metric: str, rows: int, backend: str) -> None:
+        describe(self.df, metrics=[metric])
+
+    def peakmem_describe(self, metric: str, rows: int, backend: str) -> None:
+        describe(self.df, metrics=[metric])
+
+    def time_partial_describe(self, metric: str, rows: int, backend: str) -> None:
+        partial_describe(self.df, metrics=[metric])
+
+
+class ArrowDescribe:
+    """
+    Describe pandas, polars and pyarrow dataframes through arrow, with
+    `pyarrow.compute`, against the usual narwhals path.
+    """
+
+    params = (["pandas", "polars", "pyarrow"], [10_000, 1_000_000], [10, 100])
+    param_names = ["backend", "rows", "columns"]
+    timeout = 600
+
+    def setup(self, backend: str, rows: int, columns: int) -> None:
+        df = make_frame("polars" if backend == "pyarrow" else backend, rows, columns)
+        self.df = df.to_arrow() if backend == "pyarrow" else df
+
+    def time_describe(self, backend: str, rows: int, columns: int) -> None:
+        describe(self.df)
+
+    def time_arrow_describe(self, backend: str, rows: int, columns: int) -> None:
+        arrow.describe(self.df)
+
+    def peakmem_describe(self, backend: str, rows: int, columns: int) -> None:
+        describe(self.df)
+
+    def peakmem_arrow_describe(self, backend: str, rows: int, columns: int) -> None:
+        arrow.describe(self.df)
@@ -0,0 +1,208 @@
+import numpy as np
+import polars as pl
+
+from wimsey.config import collect_tests, compile_contract
+from wimsey.execution import _evaluate_tests, run_all_tests, test, test_many
+
+from benchmarks.common import BACKENDS, COLUMNS, ROWS, make_contract, make_frame
+
+
+class RunAllTests:
+    """
+    Run a contract of a few tests per column, across backends, row and
+    column counts.
+    """
+
+    params = (BACKENDS, ROWS, COLUMNS)
+    param_names = ["backend", "rows", "columns"]
+    timeout = 600
+
+    def setup(self, backend: str, rows: int, columns: int) -> None:
+        self.df = make_frame(backend, rows, columns)
+        self.tests = collect_tests(make_contract(columns))
+
+    def time_run_all_tests(self, backend: str, rows: int, columns: int) -> None:
+        run_all_tests(self.df, self.tests)
+
+    def peakmem_run_all_tests(self, backend: str, rows: int, columns: int) -> None:
+        run_all_tests(self.df, self.tests)
+
+
+class ManySmallTables:
+    """
+    Test a couple of hundred small polars dataframes, one by one, or together
+    with `test_many`.
+    """
+
+    params = [10, 200]
+    param_names = ["tables"]
+
+    def setup(self, tables: int) -> None:
+        contract = [
+            {"test": "max_should", "column": "column_0", "be_less_than": 2},
+            {"test": "null_count_should", "column": "column_1", "be_exactly": 0},
+            {"test": "row_count_should", "be_greater_than": 0},
+        ]
+        self.frames = {
+            f"table_{i}": (
+                pl.DataFrame(
+                    {f"column_{j}": np.random.rand(10_000) for j in range(10)}
+                ),
+                contract,
+            )
+            for i in range(tables)
+        }
+
+    def time_test_individually(self, tables: int) -> None:
+        for df, contract in self.frames.values():
+            test(df, contract)
+
+    def time_test_many(self, tables: int) -> None:
+        test_many(self.frames)
+
+
+class SchemaOnlyContract:
+    """
+    Test a contract of only column and type checks against a lazily scanned
+    parquet file, which should only ever read the file's metadata, regardless
+    of the number of rows.
+    """
+
+    params = [10_000, 10_000_000]
+    param_names = ["rows"]
+
+    def setup_cache(self) -> dict[int, str]:
+        paths = {}
+        for rows in self.params:
+            path = f"schema-only-{rows}.parquet"
+            make_frame("polars", rows, 10).write_parquet(path)
+            paths[rows] = path
+        return paths
+
+    def setup(self, paths: dict[int, str], rows: int) -> None:
+        self.tests = collect_tests(
+            [
+                {"test": "columns_should", "have": ["column_0", "column_1"]},
+                {"test": "type_should", "column": "column_0", "be": "float64"},
+            ]
+        )
+
+    def time_schema_only_contract(self, paths: dict[int, str], rows: int) -> None:
+        run_all_tests(pl.scan_parquet(paths[rows]), self.tests)
+
+    def peakmem_schema_only_contract(self, paths: dict[int, str], rows: int) -> None:
+        run_all_tests(pl.scan_parquet(paths[rows]), self.tests)
+
+
+class RowChecks:
+    """
+    Run increasing numbers of row checks, time should grow far slower than the
+    number of checks, as all are counted in a single pass.
+    """
+
+    params = (BACKENDS, [1, 10, 50])
+    param_names = ["backend", "checks"]
+    timeout = 600
+
+    def setup(self, backend: str, checks: int) -> None:
+        self.df = make_frame(backend, 1_000_000, 3)
+        self.contract = [
+            {"test": "values_should", "column": "column_1", "be_less_than": i * 20}
+            for i in range(checks)
+        ]
+
+    def time_row_checks(self, backend: str, checks: int) -> None:
+        test(self.df, self.contract)
+
+
+class MixedMetricContract:
+    """
+    Run a contract asking for a maximum of numeric columns and null count of
+    string columns, only the exact (column, metric) pairs in the contract's
+    plan should be calculated.
+    """
+
+    params = COLUMNS
+    param_names = ["columns"]
+    timeout = 600
+
+    def setup(self, columns: int) -> None:
+        self.df = make_frame("polars", 1_000_000, columns)
+        self.contract = compile_contract(
+            [
+                {
+                    "test": "max_should" if i % 3 != 2 else "null_count_should",
+                    "column": f"column_{i}",
+                    "be_less_than": 10,
+                }
+                for i in range(columns)
+            ]
+        )
+
+    def time_mixed_metric_contract(self, columns: int) -> None:
+        run_all_tests(self.df, self.contract)
+
+    def track_plan_size(self, columns: int) -> int:
+        return len(self.contract.plan)
+
+
+class ManyResults:
+    """
+    Evaluate tens of thousands of tests against a ready-made description, one
+    by one, or all at once from a compiled contract, and export or filter their
+    results, as for generated starter test contracts.
+    """
+
+    params = [1_000, 20_000]
+    param_names = ["tests"]
+
+    def setup(self, tests: int) -> None:
+        self.tests = collect_tests(
+            [
+                {"test": "max_should", "column": f"column_{i}", "be_less_than": 0.5}
+                for i in range(tests)
+            ]
+        )
+        self.contract = compile_contract(self.tests)
+        self.description = {f"max_column_{i}": i / tests for i in range(tests)}
+        self.results = _evaluate_tests(self.tests, self.description).results
+
+    def time_evaluate_tests(self, tests: int) -> None:
+        _evaluate_tests(self.tests, self.description)
+
+    def time_evaluate_compiled_contract(self, tests: int) -> None:
+        _evaluate_tests(self.contract, self.description)
+
+    def peakmem_evaluate_tests(self, tests: int) -> None:
+        _evaluate_tests(self.tests, self.description)
+
+    def time_failures(self, tests: int) -> None:
+        self.results.failures()
+
+    def time_to_arrow(self, tests: int) -> None:
+        self.results.to_arrow()
+
+
+class SampledContract:
+    """
+    Evaluate mean, standard deviation and null percentage tests against the
+    full dataframe, or a sample.
+    """
+
+    params = (BACKENDS, [None, 10_000])
+    param_names = ["backend", "sample"]
+    timeout = 600
+
+    def setup(self, backend: str, sample: int | None) -> None:
+        self.df = make_frame(backend, 1_000_000, 10)
+        self.contract = compile_contract(
+            [
+                {"test": test, "column": f"column_{i}", "be_less_than": 1_000}
+                for i in range(10)
+                if i % 3 != 2
+                for test in ["mean_should", "std_should", "null_percentage_should"]
+            ]
+        )
+
+    def time_sampled_contract(self, backend: str, sample: int | None) -> None:
+        test(self.df, self.contract, sample=sample, escalate=False)
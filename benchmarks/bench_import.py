@@ -0,0 +1,38 @@
+"""
+Import time of wimsey, run in a fresh interpreter for each measurement, as
+imports are cached after the first.
+"""
+
+import subprocess
+import sys
+
+
+def import_time_us(statement: str = "import wimsey") -> int:
+    """Cumulative import time of wimsey in microseconds, from -X importtime"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    for line in output.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "wimsey":
+            return int(cumulative)
+    msg = "wimsey wasn't imported"
+    raise ValueError(msg)
+
+
+class Import:
+    """Import wimsey, and its public API, in a fresh interpreter"""
+
+    def timeraw_import_wimsey(self) -> str:
+        return "import wimsey"
+
+    def timeraw_import_validate(self) -> str:
+        return "from wimsey import validate"
+
+    def track_import_time_us(self) -> int:
+        return import_time_us()
+
+    track_import_time_us.unit = "microseconds"
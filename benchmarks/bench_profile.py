@@ -0,0 +1,77 @@
+import numpy as np
+
+from wimsey.dataframe import describe, profile_from_sampling
+from wimsey.profile import _starter_tests_from_sample_describes, _stat_starter_tests
+
+from benchmarks.common import COLUMNS, ROWS, make_frame
+
+
+class ProfileFromSampling:
+    """
+    Describe bootstrap samples of eager dataframes, sized as a number of rows
+    (so drawing fewer or as many rows as a million row dataframe holds), or a
+    tenth of the dataframe
+    """
+
+    params = (["pandas", "polars"], ROWS, COLUMNS, [False, True], [1_000, 10_000, 0.1])
+    param_names = ["backend", "rows", "columns", "batched", "size"]
+    timeout = 600
+
+    def setup(
+        self, backend: str, rows: int, columns: int, batched: bool, size: float
+    ) -> None:
+        self.df = make_frame(backend, rows, columns)
+        if backend == "pandas" and not batched:
+            msg = "unbatched sampling relies on polars' sample signature"
+            raise NotImplementedError(msg)
+        self.size = {"fraction": size} if isinstance(size, float) else {"n": size}
+
+    def time_profile_from_sampling(
+        self, backend: str, rows: int, columns: int, batched: bool, size: float
+    ) -> None:
+        profile_from_sampling(self.df, samples=100, batched=batched, **self.size)
+
+    def peakmem_profile_from_sampling(
+        self, backend: str, rows: int, columns: int, batched: bool, size: float
+    ) -> None:
+        profile_from_sampling(self.df, samples=100, batched=batched, **self.size)
+
+
+class StarterTestsFromSampleDescribes:
+    """Build starter tests from already calculated sample describes"""
+
+    params = (COLUMNS, [10, 100])
+    param_names = ["columns", "samples"]
+
+    def setup(self, columns: int, samples: int) -> None:
+        df = make_frame("polars", 1_000, columns)
+        self.describes = [
+            describe(df.sample(fraction=1.0, with_replacement=True))
+            for _ in range(samples)
+        ]
+
+    def time_starter_tests_from_sample_describes(
+        self, columns: int, samples: int
+    ) -> None:
+        _starter_tests_from_sample_describes(self.describes)
+
+
+class StatStarterTests:
+    """
+    Build statistical starter tests of float columns whose values differ
+    across samples, so each needs its standard deviation for a margin
+    """
+
+    params = (COLUMNS, [10, 100])
+    param_names = ["columns", "samples"]
+
+    def setup(self, columns: int, samples: int) -> None:
+        rng = np.random.default_rng(42)
+        self.columns = [f"column_{i}" for i in range(columns)]
+        self.describes = [
+            dict(zip([f"mean_{i}" for i in self.columns], rng.random(columns).tolist()))
+            for _ in range(samples)
+        ]
+
+    def time_stat_starter_tests(self, columns: int, samples: int) -> None:
+        _stat_starter_tests("mean", self.describes, self.columns, margin=1)
@@ -0,0 +1,75 @@
+"""
+Shared helpers for building benchmark dataframes and contracts.
+
+Benchmarks are parameterised over backends, rows and columns. Combinations
+with more cells than `WIMSEY_BENCHMARK_MAX_CELLS` (default 100 million) are
+skipped, so the full matrix can be run on machines with enough memory by
+raising it.
+"""
+
+import os
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import polars as pl
+
+BACKENDS: list[str] = ["pandas", "polars", "polars-lazy", "dask"]
+ROWS: list[int] = [10_000, 1_000_000, 100_000_000]
+COLUMNS: list[int] = [10, 100, 2_000]
+MAX_CELLS: int = int(os.environ.get("WIMSEY_BENCHMARK_MAX_CELLS", 100_000_000))
+
+
+def skip_if_too_large(rows: int, columns: int) -> None:
+    """Raising NotImplementedError in setup tells asv to skip a benchmark"""
+    if rows * columns > MAX_CELLS:
+        msg = f"{rows} x {columns} exceeds WIMSEY_BENCHMARK_MAX_CELLS"
+        raise NotImplementedError(msg)
+
+
+def make_frame(backend: str, rows: int, columns: int):
+    """
+    Build a dataframe of the given backend, alternating float, integer and
+    string columns, with some nulls in the float columns.
+    """
+    skip_if_too_large(rows, columns)
+    rng = np.random.default_rng(42)
+    data: dict = {}
+    for i in range(columns):
+        if i % 3 == 0:
+            values = rng.random(rows)
+            values[rng.random(rows) < 0.01] = np.nan
+            data[f"column_{i}"] = values
+        elif i % 3 == 1:
+            data[f"column_{i}"] = rng.integers(0, 1_000, rows)
+        else:
+            data[f"column_{i}"] = rng.choice(["hat", "bat", "cat"], rows)
+    if backend == "pandas":
+        return pd.DataFrame(data)
+    if backend == "dask":
+        return dd.from_pandas(pd.DataFrame(data), npartitions=os.cpu_count() or 1)
+    df = pl.DataFrame(data).fill_nan(None)
+    return df.lazy() if backend == "polars-lazy" else df
+
+
+def make_contract(columns: int) -> list[dict]:
+    """Build a contract with a handful of tests per column"""
+    contract: list[dict] = [
+        {"test": "row_count_should", "be_greater_than": 0},
+        {"test": "columns_should", "have": [f"column_{i}" for i in range(columns)]},
+    ]
+    for i in range(columns):
+        column = f"column_{i}"
+        contract.append(
+            {"test": "null_percentage_should", "column": column, "be_less_than": 0.5}
+        )
+        if i % 3 == 2:
+            contract.append({"test": "type_should", "column": column, "be": "string"})
+        else:
+            contract.append(
+                {"test": "max_should", "column": column, "be_less_than": 1_000}
+            )
+            contract.append(
+                {"test": "mean_should", "column": column, "be_greater_than": 0}
+            )
+    return contract
@@ -8,6 +8,7 @@ from wimsey.tests import possible_tests
 arg_examples = {
     "column": "column_a",
     "other_column": "column_b",
+    "quantile": 0.9,
     "be_less_than": 500,
     "be_less_than_or_equal_to": 300,
     "be_exactly": 300,
@@ -18,6 +19,11 @@ arg_examples = {
     "be": ["column_a", "column_b"],
     "not_be": ["column_a", "column_b", "column_c"],
     "be_one_of": ["int64", "float64"],
+    "not_be_one_of": ["unknown"],
+    "match_regex": "^[a-z]+$",
+    "not_be_null": True,
+    "max_failing_fraction": 0.01,
+    "sample_failing_rows": 5,
 }
 
 
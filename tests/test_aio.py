@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import polars as pl
+import pytest
+from fsspec.asyn import AsyncFileSystem
+from fsspec.registry import register_implementation
+
+from wimsey import aio
+from wimsey import config
+from wimsey.execution import DataValidationException
+
+
+class DictFileSystem(AsyncFileSystem):
+    """Minimal asynchronous filesystem, holding files in a dictionary"""
+
+    protocol = "asyncdict"
+    files: dict[str, bytes] = {}
+    reads: int = 0
+
+    async def _info(self, path, **kwargs):
+        return {"name": path, "size": len(self.files[path]), "etag": hash(path)}
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        type(self).reads += 1
+        return self.files[path]
+
+
+register_implementation("asyncdict", DictFileSystem, clobber=True)
+
+
+@pytest.fixture
+def contract_path() -> str:
+    DictFileSystem.files["/contract.json"] = json.dumps(
+        [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    ).encode()
+    config.clear_contract_cache()
+    return "asyncdict:///contract.json"
+
+
+def test_acompile_contract_reads_async_filesystems_once(contract_path):
+    DictFileSystem.reads = 0
+
+    async def compile_twice():
+        first = await aio.acompile_contract(contract_path)
+        second = await aio.acompile_contract(contract_path)
+        return first, second
+
+    first, second = asyncio.run(compile_twice())
+    assert first is second
+    assert DictFileSystem.reads == 1
+
+
+def test_atest_and_avalidate_match_synchronous_versions(contract_path):
+    passing = pl.DataFrame({"a": [1, 2]})
+    failing = pl.DataFrame({"a": [1, 20]})
+    assert asyncio.run(aio.atest(passing, contract_path)).success
+    assert not asyncio.run(aio.atest(failing, contract_path)).success
+    assert asyncio.run(aio.avalidate(passing, contract_path)) is passing
+    with pytest.raises(DataValidationException):
+        asyncio.run(aio.avalidate(failing, contract_path))
+
+
+def test_atest_many_limits_concurrent_describes(contract_path, monkeypatch):
+    running, most_running = 0, 0
+    original_test = aio.test
+
+    def counting_test(*args, **kwargs):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        try:
+            return original_test(*args, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(aio, "test", counting_test)
+    frames = {str(i): (pl.DataFrame({"a": [i]}), contract_path) for i in range(12)}
+
+    async def run():
+        return await aio.atest_many(frames, semaphore=asyncio.Semaphore(2))
+
+    actual = asyncio.run(run())
+    assert not actual.success
+    assert [i for i, j in actual.results.items() if not j.success] == ["10", "11"]
+    assert most_running <= 2
@@ -0,0 +1,74 @@
+import math
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from wimsey import arrow
+from wimsey import dataframe
+from wimsey import execution
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.table(
+        {
+            "a": [1, 2, None, 4, None],
+            "b": ["x", None, "y", "z", "q"],
+            "c": [1.5, 2.5, 3.5, None, None],
+            "d": [True, False, None, True, True],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "to_source", [lambda i: i, lambda i: i.to_reader(), lambda i: pl.from_arrow(i)]
+)
+def test_describe_matches_dataframe_describe(table, to_source):
+    actual = arrow.describe(to_source(table))
+    expected = dataframe.describe(table)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert math.isclose(actual[key], value)
+        else:
+            assert actual[key] == value
+
+
+def test_describe_calculates_only_planned_metrics(table):
+    plan = dataframe.Plan(frozenset({("a", "mean"), ("b", "null_percentage")}))
+    actual = arrow.describe(table, plan=plan)
+    assert actual == {
+        "columns": "a_^&^_b_^&^_c_^&^_d",
+        "mean_a": 7 / 3,
+        "null_percentage_b": 0.2,
+    }
+
+
+def test_streams_are_arrow_sources_but_dataframes_are_not(table):
+    assert arrow.is_arrow_source(table)
+    assert arrow.is_arrow_source(table.to_reader())
+    assert not arrow.is_arrow_source(pl.from_arrow(table))
+    assert not arrow.is_arrow_source(table.to_pandas())
+    assert not arrow.is_arrow_source("data.parquet")
+
+
+def test_testing_arrow_streams_with_row_checks_and_sketches(table):
+    contract = [
+        {"test": "mean_should", "column": "a", "be_less_than": 3},
+        {"test": "distinct_count_should", "column": "b", "be_exactly": 4},
+        {"test": "values_should", "column": "c", "be_less_than": 3},
+        {"test": "type_should", "column": "b", "be": "String"},
+    ]
+    actual = execution.test(table.to_reader(), contract)
+    assert [i.success for i in actual.results] == [True, True, False, True]
+    assert actual.results[2].failing_count == 1
+
+
+def test_duckdb_relations_are_described_through_arrow(table):
+    duckdb = pytest.importorskip("duckdb")
+    relation = duckdb.from_arrow(table)
+    assert arrow.is_arrow_source(relation)
+    assert arrow.describe(relation) == arrow.describe(table)
+    contract = [{"test": "row_count_should", "be_exactly": table.num_rows}]
+    assert execution.test(relation, contract).success
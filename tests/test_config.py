@@ -1,4 +1,5 @@
 import json
+import os
 from collections.abc import Callable
 
 import pytest
@@ -56,7 +57,7 @@ def test_read_config_parses_yaml(monkeypatch, test_suite):
     def open_file_patch(*args, **kwargs):
         return DummyOpenFile()
 
-    monkeypatch.setattr(config.fsspec, "open", open_file_patch)
+    monkeypatch.setattr("fsspec.open", open_file_patch)
     actual = config.read_config("file.yaml")
     assert all(isinstance(i, Callable) for i in actual)
 
@@ -75,7 +76,7 @@ def test_read_config_parses_json(monkeypatch, test_suite):
     def open_file_patch(*args, **kwargs):
         return DummyOpenFile()
 
-    monkeypatch.setattr(config.fsspec, "open", open_file_patch)
+    monkeypatch.setattr("fsspec.open", open_file_patch)
     actual = config.read_config("file.json")
     assert all(isinstance(i, Callable) for i in actual)
 
@@ -94,7 +95,7 @@ def test_friendly_message_is_raised_when_yaml_is_unimportable(test_suite, monkey
     def open_file_patch(*args, **kwargs):
         return DummyOpenFile()
 
-    monkeypatch.setattr(config.fsspec, "open", open_file_patch)
+    monkeypatch.setattr("fsspec.open", open_file_patch)
     monkeypatch.setattr(config, "collect_tests", throw_import_error)
     with pytest.raises(ImportError, match="pip install pyyaml"):
         config.read_config("file.yaml")
@@ -116,6 +117,55 @@ def test_friendly_message_is_raised_when_yaml_does_not_return_contents(
     def open_file_patch(*args, **kwargs):
         return DummyOpenFile()
 
-    monkeypatch.setattr(config.fsspec, "open", open_file_patch)
+    monkeypatch.setattr("fsspec.open", open_file_patch)
     with pytest.raises(ValueError, match="json/yaml"):
         config.read_config("file.yaml")
+
+
+def test_compile_contract_precomputes_required_columns_and_metrics(test_suite):
+    actual = config.compile_contract(test_suite)
+    assert actual.columns == ["a", "y"]
+    assert actual.metrics == ["mean", "type"]
+    assert len(actual.tests) == 2
+
+
+def test_compile_contract_falls_back_to_everything_for_undeclared_tests(test_suite):
+    actual = config.compile_contract(
+        config.collect_tests(test_suite) + [lambda description: None]
+    )
+    assert actual.columns is None
+    assert actual.metrics is None
+
+
+def test_compile_contract_caches_until_file_changes(tmp_path, monkeypatch, test_suite):
+    path = tmp_path / "contract.json"
+    path.write_text(json.dumps(test_suite))
+    config.clear_contract_cache()
+    first = config.compile_contract(str(path))
+    monkeypatch.setattr(config, "read_config", throw_import_error)
+    assert config.compile_contract(str(path)) is first
+    monkeypatch.undo()
+    path.write_text(json.dumps(test_suite[:1] + test_suite[:1] + test_suite[1:]))
+    os.utime(path, (0, 0))
+    assert len(config.compile_contract(str(path)).tests) == 3
+    assert len(config.compile_contract(str(path), cache=False).tests) == 3
+
+
+def test_contract_stages_are_ordered_by_cost(test_suite):
+    contract = config.compile_contract(
+        test_suite + [{"test": "row_count_should", "be_exactly": 3}]
+    )
+    actual = contract.stages()
+    assert [i.metrics for i in actual] == [["type"], ["length"], ["mean"]]
+
+
+def test_contract_plan_holds_exact_column_metric_pairs():
+    contract = config.compile_contract(
+        [
+            {"test": "mean_should", "column": "a", "be_less_than": 1},
+            {"test": "std_should", "column": "b", "be_less_than": 1},
+            {"test": "row_count_should", "be_less_than": 1},
+        ]
+    )
+    assert contract.plan.pairs == {("a", "mean"), ("b", "std"), (None, "length")}
+    assert contract.metrics == ["length", "mean", "std"]
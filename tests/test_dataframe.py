@@ -1,3 +1,10 @@
+import warnings
+
+import narwhals.stable.v1 as nw
+import pytest
+import pyarrow as pa
+import dask.dataframe as dd
+import pandas as pd
 import polars as pl
 
 from wimsey import dataframe
@@ -56,3 +63,278 @@ def test_that_profile_from_samples_returns_list_of_dicts_of_expected_length() ->
     assert len(actual) == 20
     assert actual[10]["mean_a"] == 1.3
     assert actual[4]["columns"] == "a_^&^_b"
+
+
+def test_that_batched_profile_by_sampling_matches_describe_keys() -> None:
+    df = pl.DataFrame({"a": [1.2, 1.3, 1.4], "b": ["one", "two", None]})
+    batched = dataframe.profile_from_sampling(df, samples=5, n=2)
+    unbatched = dataframe.profile_from_sampling(df, samples=5, n=2, batched=False)
+    assert len(batched) == 5
+    assert list(batched[0]) == list(unbatched[0])
+    assert list(batched[0]) == list(dataframe.describe(df))
+
+
+def test_that_batched_profile_by_sampling_gives_expected_values() -> None:
+    df = pl.DataFrame({"a": [2, 2, 2, 2], "b": [None, None, None, None]})
+    actual = dataframe.profile_from_sampling(df, samples=3, fraction=0.5)
+    for description in actual:
+        assert description["mean_a"] == 2
+        assert description["length"] == 2
+        assert description["null_count_b"] == 2
+        assert description["null_percentage_b"] == 1
+
+
+def test_that_profile_by_sampling_supports_pandas() -> None:
+    df = pd.DataFrame({"a": [1.2, 1.3, 1.4], "b": ["one", "two", None]})
+    actual = dataframe.profile_from_sampling(df, samples=10, n=1)
+    assert len(actual) == 10
+    assert actual[0]["mean_a"] in [1.2, 1.3, 1.4]
+    assert actual[4]["columns"] == "a_^&^_b"
+
+
+def test_that_describe_only_scans_required_columns_of_lazy_frames() -> None:
+    def fail_if_scanned(series: pl.Series) -> pl.Series:
+        raise RuntimeError("column b should not be scanned")
+
+    df = pl.LazyFrame({"a": [1, 2]}).with_columns(
+        b=pl.col("a").map_batches(fail_if_scanned, return_dtype=pl.Int64)
+    )
+    actual = dataframe.describe(df, columns=["a"])
+    assert actual["mean_a"] == 1.5
+    assert actual["type_a"] == "Int64"
+    assert actual["columns"] == "a_^&^_b"
+
+
+def test_that_describe_supports_dask() -> None:
+    df = dd.from_pandas(pd.DataFrame({"a": [1.0, 2.0, None]}), npartitions=2)
+    actual = dataframe.describe(df)
+    assert actual["mean_a"] == 1.5
+    assert actual["null_count_a"] == 1
+    assert actual["length"] == 3
+
+
+def test_that_merged_partial_describes_match_describe_of_whole() -> None:
+    df = pl.DataFrame(
+        {"a": [1.2, None, 1.4, 3.0, -2.0], "b": ["one", "two", None, "x", "y"]}
+    )
+    partials = [dataframe.partial_describe(df[i : i + 2]) for i in range(0, 5, 2)]
+    merged = partials[0]
+    for partial in partials[1:]:
+        merged = dataframe.merge_partial_describes(merged, partial)
+    actual = dataframe.finalise_partial_describe(merged)
+    expected = dataframe.describe(df)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert abs(actual[key] - value) < 1e-9
+        else:
+            assert actual[key] == value
+
+
+def test_that_partial_describe_accepts_record_batches() -> None:
+    batch = pa.RecordBatch.from_pydict({"a": [1, 2, None]})
+    actual = dataframe.finalise_partial_describe(dataframe.partial_describe(batch))
+    assert actual["mean_a"] == 1.5
+    assert actual["null_count_a"] == 1
+
+
+def test_that_parallel_describe_matches_describe() -> None:
+    df = pd.DataFrame(
+        {"a": [1.2, None, 1.4, 3.0, -2.0, 8.0, 1.0], "b": list("abcdefg")}
+    )
+    actual = dataframe.parallel_describe(df, workers=3)
+    expected = dataframe.describe(df)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float) and value == value:
+            assert abs(actual[key] - value) < 1e-9
+        elif not isinstance(value, float):
+            assert actual[key] == value
+
+
+def test_that_describe_in_column_batches_matches_describe() -> None:
+    df = pl.DataFrame({f"a{i}": [1.0, 2.0, None] for i in range(7)} | {"b": ["x"] * 3})
+    expected = dataframe.describe(df)
+    for native in [df, df.lazy(), df.to_pandas()]:
+        actual = dataframe.describe(native, column_batch_size=3, workers=2)
+        assert actual.keys() == expected.keys()
+        assert actual["mean_a6"] == expected["mean_a6"]
+        assert actual["null_count_b"] == expected["null_count_b"]
+        assert actual["length"] == expected["length"]
+
+
+def test_that_describe_columnar_groups_metrics_by_column() -> None:
+    df = pl.DataFrame({"a": [1.2, 1.3, 1.4], "b": ["one", "two", None]})
+    actual = dataframe.describe_columnar(df, metrics=["mean", "null", "length"])
+    assert actual["columns"] == ["a", "b"]
+    assert actual["length"] == 3
+    assert actual["mean"] == {"a": 1.3, "b": None}
+    assert actual["null_count"] == {"a": 0, "b": 1}
+    assert "std" not in actual
+
+
+def test_that_describe_schema_does_not_scan_data() -> None:
+    def fail_if_scanned(series: pl.Series) -> pl.Series:
+        raise RuntimeError("data should not be scanned")
+
+    df = pl.LazyFrame({"a": [1, 2]}).with_columns(
+        b=pl.col("a").map_batches(fail_if_scanned, return_dtype=pl.String)
+    )
+    actual = dataframe.describe_schema(df, columns=["b"])
+    assert actual == {"columns": "a_^&^_b", "type_b": "String"}
+    assert dataframe.describe(df, metrics=["type"]) == {
+        "columns": "a_^&^_b",
+        "type_a": "Int64",
+        "type_b": "String",
+    }
+
+
+def test_describe_gives_approximate_metrics_only_when_required() -> None:
+    df = pl.DataFrame({"a": list(range(1_000)), "b": ["x", "y"] * 500})
+    actual = dataframe.describe(df, metrics=["quantiles", "distinct_count"])
+    assert abs(actual["quantiles_a"].quantile(0.5) - 500) < 20
+    assert actual["quantiles_b"] is None
+    assert abs(actual["distinct_count_a"] - 1_000) < 30
+    assert actual["distinct_count_b"] == 2
+    assert "quantiles_a" not in dataframe.describe(df)
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas", "dask"])
+def test_describe_sketches_in_batches(backend, monkeypatch) -> None:
+    monkeypatch.setattr(dataframe, "_SKETCH_CHUNK_SIZE", 300)
+    data = {
+        "a": [float(i) for i in range(1_000)] + [None],
+        "b": ["x", "y"] * 500 + [None],
+    }
+    df = {
+        "polars": lambda: pl.DataFrame(data),
+        "pandas": lambda: pd.DataFrame(data),
+        "dask": lambda: dd.from_pandas(pd.DataFrame(data), npartitions=2),
+    }[backend]()
+    actual = dataframe.describe(df, metrics=["quantiles", "distinct_count"])
+    assert actual["quantiles_a"].count == 1_000
+    assert abs(actual["quantiles_a"].quantile(0.5) - 500) < 20
+    assert abs(actual["distinct_count_a"] - 1_000) < 30
+    assert actual["distinct_count_b"] == 2
+
+
+def test_partial_describe_merges_approximate_metrics() -> None:
+    metrics = ["quantiles", "distinct_count"]
+    left = dataframe.partial_describe(
+        pl.DataFrame({"a": list(range(500))}), metrics=metrics
+    )
+    right = dataframe.partial_describe(
+        pl.DataFrame({"a": list(range(250, 1_000))}), metrics=metrics
+    )
+    actual = dataframe.finalise_partial_describe(
+        dataframe.merge_partial_describes(left, right)
+    )
+    assert abs(actual["distinct_count_a"] - 1_000) < 30
+    assert 400 < actual["quantiles_a"].quantile(0.5) < 600
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas", "dask"])
+def test_describe_counts_and_samples_failing_rows(backend) -> None:
+    data = {"a": [1, 2, None, 4], "b": ["x", "y", "z", None]}
+    df = {
+        "polars": pl.DataFrame(data),
+        "pandas": pd.DataFrame(data),
+        "dask": dd.from_pandas(pd.DataFrame(data), npartitions=2),
+    }[backend]
+    expressions = {
+        "under_three": (nw.col("a").is_null() | (nw.col("a") < 3), 5),
+        "is_x": (nw.col("b").is_null() | nw.col("b").is_in(["x"]), 0),
+    }
+    actual = dataframe.describe(df, metrics=["length"], expressions=expressions)
+    assert actual["failing_count_under_three"] == 1
+    assert actual["failing_count_is_x"] == 2
+    assert [i["a"] for i in actual["failing_rows_under_three"]] == [4]
+    assert "failing_rows_is_x" not in actual
+
+
+def test_describe_with_plan_calculates_only_given_pairs() -> None:
+    df = pl.DataFrame({"a": [1, None, 3], "b": [1.0, None, None], "c": ["x"] * 3})
+    plan = dataframe.Plan(
+        frozenset({("a", "mean"), ("b", "std"), ("b", "null_percentage")})
+    )
+    actual = dataframe.describe(df, plan=plan)
+    assert actual == {
+        "columns": "a_^&^_b_^&^_c",
+        "mean_a": 2.0,
+        "std_b": None,
+        "null_percentage_b": 2 / 3,
+    }
+
+
+def test_plan_shares_aggregations_between_metrics() -> None:
+    plan = dataframe.Plan(
+        frozenset(
+            {
+                ("a", "count"),
+                ("a", "null_count"),
+                ("a", "null_percentage"),
+                ("b", "null_count"),
+                (None, "length"),
+            }
+        )
+    )
+    assert plan.aggregations() == ["count_a", "__wimsey_group_length__", "null_count_b"]
+    assert len(plan) == 3
+
+
+def test_describe_adds_constants_without_widening_pandas_frames() -> None:
+    df = pd.DataFrame(
+        {f"a{i}": [1.0, None, 3.0] for i in range(150)} | {"b": ["x"] * 3}
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        actual = dataframe.describe(df)
+    assert actual["type_b"] == "String"
+    assert actual["mean_b"] is None
+    assert actual["null_count_a0"] == 1
+    assert actual["null_percentage_a149"] == 1 / 3
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas"])
+# Fewer rows drawn than the dataframe holds are gathered by the backend
+@pytest.mark.parametrize("samples", [20, 1])
+def test_batched_profile_by_sampling_matches_describe_of_each_sample(
+    backend, samples, monkeypatch
+) -> None:
+    np = pytest.importorskip("numpy")
+    df = pl.DataFrame(
+        {
+            "a": [1, None, 3, 4, 10, None],
+            "b": [0.5, 1.5, None, 2.5, 3.5, 4.5],
+            "c": ["x", None, "y", "z", None, "x"],
+            "d": [None] * 6,
+        },
+        schema_overrides={"d": pl.Int64},
+    )
+    default_rng = np.random.default_rng
+    monkeypatch.setattr(np.random, "default_rng", lambda: default_rng(0))
+    frame = (
+        df if backend == "polars" else df.to_pandas(use_pyarrow_extension_array=False)
+    )
+    actual = dataframe.profile_from_sampling(frame, samples=samples, n=3)
+    indexes = default_rng(0).integers(0, 6, (samples, 3))
+    assert len(actual) == samples
+    for description, rows in zip(actual, indexes):
+        sample = nw.from_native(frame, eager_only=True)[rows.tolist()]
+        expected = dataframe.describe(nw.to_native(sample))
+        assert list(description) == list(expected)
+        for key, value in expected.items():
+            # Pandas gives nan for metrics of no values, rather than None
+            if dataframe._is_missing(value):
+                assert dataframe._is_missing(description[key]), key
+            elif isinstance(value, float):
+                assert description[key] == pytest.approx(value), key
+            else:
+                assert description[key] == value, key
+
+
+def test_profile_by_sampling_needs_a_sample_size() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    for batched in (True, False):
+        with pytest.raises(ValueError):
+            dataframe.profile_from_sampling(df, samples=2, batched=batched)
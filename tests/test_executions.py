@@ -1,5 +1,10 @@
+from datetime import date
+
+import pandas as pd
+import pytest
 import polars as pl
 
+from wimsey import config
 from wimsey import execution
 from wimsey import tests
 
@@ -15,3 +20,324 @@ def test_run_all_tests_produces_expected_result_object():
     assert actual.success is True
     for result in actual.results:
         assert result.success is True
+
+
+def test_run_all_tests_accepts_compiled_contract_for_multiple_dataframes():
+    contract = config.compile_contract(
+        [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    )
+    passing = execution.test(pl.DataFrame({"a": [1, 2, 3]}), contract)
+    failing = execution.test(pl.DataFrame({"a": [1, 20, 3]}), contract)
+    assert passing.success
+    assert not failing.success
+
+
+def test_test_stream_evaluates_tests_over_all_chunks():
+    chunks = [pl.DataFrame({"a": [1, 2]}), pl.DataFrame({"a": [3, 40]})]
+    contract = [
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+        {"test": "row_count_should", "be_exactly": 4},
+    ]
+    actual = execution.test_stream(iter(chunks), contract)
+    assert not actual.success
+    assert actual.results[0].unexpected == 40
+    assert actual.results[1].success
+
+
+def test_iter_test_stream_yields_result_per_chunk():
+    chunks = [pl.DataFrame({"a": [1, 2]}), pl.DataFrame({"a": [3, 40]})]
+    contract = [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    actual = [i.success for i in execution.iter_test_stream(chunks, contract)]
+    assert actual == [True, False]
+
+
+def test_validate_stream_raises_on_failure():
+    chunks = [pl.DataFrame({"a": [1, 2]}), pl.DataFrame({"a": [3, 40]})]
+    contract = [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    with pytest.raises(execution.DataValidationException, match="max-of-a"):
+        execution.validate_stream(chunks, contract)
+
+
+def test_test_with_workers_matches_single_threaded_result():
+    df = pd.DataFrame({"a": range(100), "b": ["x"] * 100})
+    contract = [
+        {"test": "mean_should", "column": "a", "be_exactly": 49.5},
+        {"test": "row_count_should", "be_exactly": 100},
+        {"test": "type_should", "column": "b", "be": "string"},
+    ]
+    actual = execution.test(df, contract, workers=4)
+    assert actual.success
+    assert actual == execution.test(df, contract)
+
+
+def test_test_with_state_evaluates_tests_over_all_appended_data(tmp_path):
+    state = str(tmp_path / "state.json")
+    contract = [
+        {"test": "row_count_should", "be_less_than_or_equal_to": 4},
+        {"test": "mean_should", "column": "a", "be_exactly": 2.5},
+    ]
+    first = execution.test(pl.DataFrame({"a": [1, 2]}), contract[:1], state=state)
+    second = execution.test(pl.DataFrame({"a": [3, 4]}), contract, state=state)
+    third = execution.test(pl.DataFrame({"a": [5]}), contract, state=state)
+    assert first.success
+    assert second.success
+    assert not third.success
+    assert third.results[0].unexpected == 5
+
+
+def test_test_with_state_does_not_update_state_on_failure(tmp_path):
+    state = str(tmp_path / "state.json")
+    contract = [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    assert not execution.test(
+        pl.DataFrame({"a": [1, 20]}), contract, state=state
+    ).success
+    assert execution.test(pl.DataFrame({"a": [1, 2]}), contract, state=state).success
+
+
+def test_test_with_state_saves_failing_rows_of_any_type(tmp_path):
+    state = str(tmp_path / "state.json")
+    df = pl.DataFrame({"a": [1, 5], "d": [date(2024, 1, 1), date(2024, 1, 2)]})
+    contract = [
+        {
+            "test": "values_should",
+            "column": "a",
+            "be_less_than": 3,
+            "max_failing_fraction": 0.5,
+            "sample_failing_rows": 1,
+        }
+    ]
+    first = execution.test(df, contract, state=state)
+    second = execution.test(df, contract, state=state)
+    assert first.results[0].failing_rows == [{"a": 5, "d": date(2024, 1, 2)}]
+    assert second.results[0].failing_count == 2
+    assert second.success
+
+
+def test_test_with_state_raises_if_sketches_are_added_to_contract(tmp_path):
+    state = str(tmp_path / "state.json")
+    contract = [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    assert execution.test(pl.DataFrame({"a": [1, 2]}), contract, state=state).success
+    for test in [
+        {"test": "quantile_should", "column": "a", "quantile": 0.5, "be_less_than": 3},
+        {"test": "distinct_count_should", "column": "a", "be_less_than": 3},
+    ]:
+        with pytest.raises(ValueError, match="distinct_count of a|quantiles of a"):
+            execution.test(pl.DataFrame({"a": [3]}), [*contract, test], state=state)
+
+
+def test_test_many_returns_result_per_dataframe():
+    contract = [{"test": "max_should", "column": "a", "be_less_than": 10}]
+    actual = execution.test_many(
+        {
+            "eager": (pl.DataFrame({"a": [1, 2]}), contract),
+            "lazy": (pl.LazyFrame({"a": [1, 20]}), contract),
+            "pandas": (pd.DataFrame({"a": [3, 4]}), contract),
+        }
+    )
+    assert not actual.success
+    assert actual.results["eager"].success
+    assert not actual.results["lazy"].success
+    assert actual.results["pandas"].success
+    assert set(actual.timings) == {"eager", "lazy", "pandas"}
+    assert actual.total_time >= actual.shared_time
+
+
+def test_test_many_calculates_approximate_metrics():
+    contract = [
+        {"test": "distinct_count_should", "column": "a", "be_less_than": 3},
+        {"test": "quantile_should", "column": "a", "quantile": 1, "be_exactly": 2},
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+    ]
+    actual = execution.test_many(
+        {
+            "eager": (pl.DataFrame({"a": [1, 2, 2]}), contract),
+            "lazy": (pl.LazyFrame({"a": [1, 2, 3]}), contract),
+            "pandas": (pd.DataFrame({"a": [1, 1, 2]}), contract),
+        }
+    )
+    assert actual.results["eager"].success
+    assert [i.success for i in actual.results["lazy"].results] == [False, False, True]
+    assert actual.results["pandas"].success
+
+
+def test_fail_fast_stops_before_calculating_aggregates(monkeypatch):
+    described_metrics: list = []
+
+    def describe_spy(df, columns, metrics, *args, **kwargs):
+        described_metrics.append(metrics)
+        return execution.describe(df, columns=columns, metrics=metrics)
+
+    monkeypatch.setattr(execution, "_describe", describe_spy)
+    df = pl.DataFrame({"a": [1, 2]})
+    contract = [
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+        {"test": "type_should", "column": "a", "be": "string"},
+        {"test": "columns_should", "have": ["a"]},
+    ]
+    actual = execution.test(df, contract, fail_fast=True)
+    assert not actual.success
+    assert [i.name for i in actual.results] == ["type-of-a", "columns"]
+    assert described_metrics == [["type"]]
+
+
+def test_schema_only_contracts_do_not_scan_data():
+    def fail_if_scanned(series: pl.Series) -> pl.Series:
+        raise RuntimeError("data should not be scanned")
+
+    df = pl.LazyFrame({"a": [1, 2]}).with_columns(
+        pl.col("a").map_batches(fail_if_scanned, return_dtype=pl.Int64)
+    )
+    contract = [
+        {"test": "type_should", "column": "a", "be": "int64"},
+        {"test": "columns_should", "be": ["a"]},
+    ]
+    assert execution.test(df, contract).success
+    fail_fast_contract = contract + [{"test": "max_should", "column": "a"}]
+    fail_fast_contract[0]["be"] = "string"
+    assert not execution.test(df, fail_fast_contract, fail_fast=True).success
+
+
+def test_fail_fast_carries_out_all_tests_when_passing():
+    df = pl.DataFrame({"a": [1, 2]})
+    contract = [
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+        {"test": "row_count_should", "be_exactly": 2},
+        {"test": "columns_should", "have": ["a"]},
+    ]
+    actual = execution.test(df, contract, fail_fast=True)
+    assert actual.success
+    assert [i.name for i in actual.results] == ["columns", "row-count", "max-of-a"]
+
+
+def test_null_count_tests_are_calculated_from_required_metrics():
+    df = pl.DataFrame({"a": [1, None, None]})
+    contract = [{"test": "null_count_should", "column": "a", "be_exactly": 2}]
+    assert execution.test(df, contract).success
+    assert execution.test_stream(iter([df, df]), contract).success is False
+
+
+def test_approximate_tests_over_stream_and_dataframe_agree():
+    chunks = [pl.DataFrame({"a": list(range(i, i + 500))}) for i in (0, 500)]
+    contract = [
+        {"test": "distinct_count_should", "column": "a", "be_greater_than": 950},
+        {"test": "quantile_should", "column": "a", "be_less_than": 550},
+    ]
+    assert execution.test(pl.concat(chunks), contract).success
+    assert execution.test_stream(iter(chunks), contract).success
+
+
+def test_row_checks_give_failing_counts_and_rows_for_dataframes_and_streams():
+    df = pl.DataFrame({"a": [1, 5, None], "b": [2, 2, 2], "c": ["x", "y", None]})
+    contract = [
+        {"test": "values_should", "column": "a", "be_less_than": 3},
+        {"test": "values_should", "column": "c", "match_regex": "^x"},
+        {
+            "test": "difference_from_other_column_should",
+            "column": "a",
+            "other_column": "b",
+            "be_less_than_or_equal_to": 0,
+            "sample_failing_rows": 1,
+        },
+    ]
+    actual = execution.test(df, contract)
+    streamed = execution.test_stream(iter([df, df]), contract)
+    assert [i.failing_count for i in actual.results] == [1, 1, 1]
+    assert [i.failing_count for i in streamed.results] == [2, 2, 2]
+    assert actual.results[2].failing_rows == [{"a": 5, "b": 2, "c": "y"}]
+    assert streamed.results[2].failing_rows == [{"a": 5, "b": 2, "c": "y"}]
+
+
+@pytest.mark.parametrize(
+    "to_frame", [lambda i: i, lambda i: i.lazy(), lambda i: i.to_pandas()]
+)
+def test_group_by_evaluates_every_test_for_each_group(to_frame):
+    df = pl.DataFrame(
+        {"shop": ["a", "a", "b", "b"], "x": [1, 2, None, 4], "y": [1.0, 2, 3, 40]}
+    )
+    contract = [
+        {"test": "null_percentage_should", "column": "x", "be_less_than": 0.1},
+        {"test": "max_should", "column": "y", "be_less_than": 10},
+        {"test": "columns_should", "have": ["shop", "x", "y"]},
+        {"test": "values_should", "column": "y", "be_less_than": 10},
+    ]
+    actual = execution.test(to_frame(df), contract, group_by="shop")
+    assert not actual.success
+    assert [i.group for i in actual.results] == [("a",)] * 4 + [("b",)] * 4
+    assert [i.success for i in actual.results] == [True] * 4 + [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert actual.results[4].unexpected == 0.5
+    assert actual.results[7].failing_count == 1
+
+
+@pytest.mark.parametrize(
+    "to_frame", [lambda i: i, lambda i: i.lazy(), lambda i: i.to_pandas()]
+)
+def test_group_by_gives_null_group_keys_as_none(to_frame):
+    df = pl.DataFrame({"shop": ["a", None, None], "x": [1, 2, 4]})
+    contract = [
+        {
+            "test": "values_should",
+            "column": "x",
+            "be_less_than": 3,
+            "sample_failing_rows": 1,
+        }
+    ]
+    actual = execution.test(to_frame(df), contract, group_by="shop")
+    assert [i.group for i in actual.results] == [(None,), ("a",)]
+    assert actual.results[0].failing_rows[0]["x"] == 4
+
+
+@pytest.mark.parametrize(
+    "to_frame", [lambda i: i, lambda i: i.lazy(), lambda i: i.to_pandas()]
+)
+def test_group_by_describes_group_columns(to_frame):
+    df = pl.DataFrame({"shop": [1, 1, None, None], "x": [1, 2, 3, 4]})
+    contract = [
+        {"test": "null_count_should", "column": "shop", "be_exactly": 0},
+        {"test": "max_should", "column": "shop", "be_exactly": 1},
+        {"test": "std_should", "column": "shop", "be_exactly": 0},
+        {"test": "distinct_count_should", "column": "shop", "be_exactly": 1},
+    ]
+    actual = execution.test(to_frame(df), contract, group_by="shop")
+    assert [i.group for i in actual.results] == [(None,)] * 4 + [(1,)] * 4
+    assert [i.success for i in actual.results] == [False] * 4 + [True] * 4
+    assert actual.results[0].unexpected == 2
+
+
+def test_group_by_reports_failing_groups_and_rejects_state(tmp_path):
+    df = pl.DataFrame({"shop": ["a", "b", "b"], "region": ["x", "y", "y"]})
+    contract = [{"test": "row_count_should", "be_greater_than": 1}]
+    with pytest.raises(execution.DataValidationException, match=r"\('a', 'x'\)"):
+        execution.validate(df, contract, group_by=["shop", "region"])
+    with pytest.raises(ValueError):
+        execution.test(df, contract, group_by="shop", state=str(tmp_path / "s"))
+
+
+def test_identical_row_checks_each_get_their_own_sample_of_failing_rows():
+    df = pl.DataFrame({"a": [5, 6, 7, 1]})
+    contract = [
+        {"test": "values_should", "column": "a", "be_less_than": 3},
+        {
+            "test": "values_should",
+            "column": "a",
+            "be_less_than": 3,
+            "sample_failing_rows": 2,
+        },
+        {
+            "test": "values_should",
+            "column": "a",
+            "be_less_than": 3,
+            "sample_failing_rows": 1,
+        },
+    ]
+    actual = execution.test(df, contract)
+    assert [i.failing_count for i in actual.results] == [3, 3, 3]
+    assert [i.failing_rows for i in actual.results] == [
+        None,
+        [{"a": 5}, {"a": 6}],
+        [{"a": 5}],
+    ]
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import wimsey
+
+# Cumulative microseconds `import wimsey` should stay under, as reported by
+# `python -X importtime`
+IMPORT_BUDGET_US = 50_000
+
+
+def import_time_us() -> int:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import wimsey"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    for line in output.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "wimsey":
+            return int(cumulative)
+    raise AssertionError("wimsey wasn't imported")
+
+
+def test_import_defers_dataframe_and_filesystem_libraries():
+    statement = (
+        "import sys, wimsey; "
+        "print(sorted(i for i in ('narwhals', 'fsspec', 'yaml', 'wimsey.execution') "
+        "if i in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", statement], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_import_is_within_budget():
+    assert import_time_us() < IMPORT_BUDGET_US
+
+
+def test_public_api_is_loaded_on_first_use():
+    from wimsey.execution import validate
+
+    assert wimsey.validate is validate
+    assert "compile_contract" in dir(wimsey)
+    assert set(wimsey.__all__) <= set(dir(wimsey))
+
+
+def test_submodules_are_loaded_on_first_use():
+    statement = (
+        "import wimsey; "
+        "print([i.__name__ for i in (wimsey.tests, wimsey.config, wimsey.dataframe)])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", statement], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "['wimsey.tests', 'wimsey.config', 'wimsey.dataframe']"
+
+
+def test_unknown_attributes_raise_attribute_error():
+    with pytest.raises(AttributeError, match="not_a_function"):
+        wimsey.not_a_function
@@ -0,0 +1,172 @@
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import pytest
+
+from wimsey import execution
+from wimsey import instrumentation
+
+
+@pytest.fixture
+def captured_spans():
+    captured = []
+    instrumentation.set_span_hook(captured.append)
+    yield captured
+    instrumentation.set_span_hook(None)
+
+
+def test_record_does_nothing_without_list_of_spans(captured_spans):
+    with instrumentation.record("describe", None, columns=2) as attributes:
+        attributes["extra"] = 1
+    assert captured_spans == []
+
+
+def test_record_appends_span_and_calls_hook(captured_spans):
+    spans = []
+    with instrumentation.record("describe", spans, columns=2) as attributes:
+        attributes["extra"] = 1
+        list(range(10_000))
+    assert len(spans) == 1
+    assert captured_spans == spans
+    recorded = spans[0]
+    assert recorded.name == "describe"
+    assert recorded.attributes == {"columns": 2, "extra": 1}
+    assert recorded.end_time >= recorded.start_time
+    assert recorded.wall_time >= 0
+    assert recorded.peak_memory > 0
+
+
+def test_test_records_spans_and_counts_when_instrumented():
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    contract = [
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+        {"test": "values_should", "column": "b", "be_one_of": ["x", "y", "z"]},
+    ]
+    actual = execution.test(df, contract, instrument=True)
+    assert actual.success
+    # Phases of describing end, so are recorded, before describing itself
+    assert [i.name for i in actual.spans] == [
+        "compile_contract",
+        "plan",
+        "collect",
+        "failing_rows",
+        "describe",
+        "evaluate",
+    ]
+    assert actual.spans[4].attributes["backend"] == "polars"
+    assert actual.counts == {"tests": 2, "columns": 2, "expressions": 3}
+
+
+@pytest.mark.parametrize("column_batch_size", [None, 1])
+def test_test_records_spans_for_sketches_and_batches(column_batch_size):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": [1.0, 2.0, 3.0]})
+    contract = [
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+        {"test": "quantile_should", "column": "b", "be_less_than": 10},
+    ]
+    actual = execution.test(
+        df, contract, column_batch_size=column_batch_size, instrument=True
+    )
+    assert [i.name for i in actual.spans] == [
+        "compile_contract",
+        "plan",
+        "collect",
+        "sketches",
+        "describe",
+        "evaluate",
+    ]
+    if column_batch_size:
+        assert actual.spans[2].attributes == {"batches": 2}
+
+
+def test_test_has_no_spans_by_default():
+    actual = execution.test(
+        pl.DataFrame({"a": [1]}),
+        [{"test": "max_should", "column": "a", "be_less_than": 10}],
+    )
+    assert actual.spans is None
+    assert actual.counts is None
+
+
+def test_fail_fast_records_spans_for_each_stage():
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    contract = [
+        {"test": "columns_should", "have": ["a"]},
+        {"test": "max_should", "column": "a", "be_less_than": 10},
+    ]
+    actual = execution.test(df, contract, fail_fast=True, instrument=True)
+    describes = [i for i in actual.spans if i.name == "describe"]
+    assert [i.attributes["stage"] for i in describes] == [0, 1]
+
+
+def test_opentelemetry_hook_exports_span_to_tracer():
+    class FakeSpan:
+        def __init__(self, name, start_time):
+            self.name = name
+            self.start_time = start_time
+            self.attributes = {}
+
+        def set_attributes(self, attributes):
+            self.attributes |= attributes
+
+        def end(self, end_time):
+            self.end_time = end_time
+
+    class FakeTracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, start_time):
+            self.spans.append(FakeSpan(name, start_time))
+            return self.spans[-1]
+
+    tracer = FakeTracer()
+    hook = instrumentation.opentelemetry_hook(tracer)
+    hook(
+        instrumentation.span(
+            name="describe",
+            start_time=1,
+            end_time=5,
+            wall_time=4e-9,
+            cpu_time=3e-9,
+            peak_memory=100,
+            attributes={"backend": "polars", "unexported": [1, 2]},
+        )
+    )
+    (exported,) = tracer.spans
+    assert exported.name == "wimsey.describe"
+    assert (exported.start_time, exported.end_time) == (1, 5)
+    assert exported.attributes == {
+        "wimsey.cpu_time": 3e-9,
+        "wimsey.peak_memory": 100,
+        "wimsey.backend": "polars",
+    }
+
+
+def test_concurrent_spans_share_memory_tracing():
+    spans = []
+
+    def work():
+        with instrumentation.record("describe", spans):
+            list(range(10_000))
+            time.sleep(0.01)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: work(), range(8)))
+    assert len(spans) == 8
+    assert all(i.peak_memory > 0 for i in spans)
+    assert not tracemalloc.is_tracing()
+
+
+def test_record_leaves_outside_memory_tracing_alone():
+    spans = []
+    tracemalloc.start()
+    try:
+        with instrumentation.record("describe", spans):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert spans[0].peak_memory is None
@@ -0,0 +1,115 @@
+import polars as pl
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from wimsey import execution
+from wimsey import dataframe
+from wimsey import parquet
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.table(
+        {
+            "a": [1, 2, None, 4, None],
+            "b": ["x", None, "y", "z", "q"],
+            "c": [1.5, 2.5, 3.5, None, None],
+        }
+    )
+
+
+@pytest.mark.parametrize("write_statistics", [True, False])
+def test_describe_matches_dataframe_describe(tmp_path, table, write_statistics):
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2, write_statistics=write_statistics)
+    actual = parquet.describe(path)
+    expected = dataframe.describe(pl.from_arrow(table))
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert abs(actual[key] - value) < 1e-9
+        else:
+            assert actual[key] == value
+
+
+def test_describe_reads_only_metadata_for_statistics_metrics(
+    tmp_path, table, monkeypatch
+):
+    def fail_if_scanned(*args, **kwargs):
+        raise RuntimeError("data should not be scanned")
+
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2)
+    monkeypatch.setattr(parquet, "partial_describe", fail_if_scanned)
+    actual = parquet.describe(path, metrics=["min", "max", "null", "length"])
+    assert actual["max_a"] == 4
+    assert actual["min_c"] == 1.5
+    assert actual["null_count_b"] == 1
+    assert actual["length"] == 5
+
+
+def test_schema_only_contracts_never_scan_parquet(tmp_path, table, monkeypatch):
+    def fail_if_scanned(*args, **kwargs):
+        raise RuntimeError("data should not be scanned")
+
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2)
+    monkeypatch.setattr(parquet, "partial_describe", fail_if_scanned)
+    assert parquet.describe(path, metrics=[]) == {"columns": "a_^&^_b_^&^_c"}
+    monkeypatch.setattr(parquet, "describe", fail_if_scanned)
+    contract = [
+        {"test": "columns_should", "have": ["a", "b"]},
+        {"test": "type_should", "column": "b", "be": "string"},
+    ]
+    assert execution.test(path, contract).success
+    assert execution.test(path, contract, fail_fast=True).success
+
+
+def test_test_accepts_parquet_paths_and_datasets(tmp_path, table):
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2)
+    contract = [
+        {"test": "row_count_should", "be_exactly": 5},
+        {"test": "max_should", "column": "a", "be_less_than": 4},
+        {"test": "type_should", "column": "b", "be": "string"},
+    ]
+    for source in [path, ds.dataset(path)]:
+        actual = execution.test(source, contract)
+        assert [i.success for i in actual.results] == [True, False, True]
+
+
+def test_describe_scans_for_approximate_metrics(tmp_path, table):
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2)
+    actual = parquet.describe(path, metrics=["quantiles", "distinct_count", "max"])
+    assert actual["quantiles_a"].quantile(1) == 4
+    assert actual["quantiles_b"] is None
+    assert actual["distinct_count_b"] == 4
+    assert actual["max_a"] == 4
+
+
+def test_row_checks_on_parquet_files(tmp_path, table):
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(table, path, row_group_size=2)
+    contract = [{"test": "values_should", "column": "b", "be_one_of": ["x", "y"]}]
+    actual = execution.test(path, contract)
+    assert actual.results[0].failing_count == 2
+
+
+def test_only_parquet_paths_are_parquet_sources(tmp_path, table):
+    folder = tmp_path / "data"
+    folder.mkdir()
+    pq.write_table(table, str(folder / "part-0.parquet"))
+    pq.write_table(table, str(folder / "part-1.parquet"))
+    (tmp_path / "empty").mkdir()
+    assert parquet.is_parquet_source(str(folder))
+    assert parquet.is_parquet_source(str(folder / "*.parquet"))
+    assert not parquet.is_parquet_source(str(tmp_path / "empty"))
+    assert not parquet.is_parquet_source("contract.yaml")
+    contract = [{"test": "row_count_should", "be_exactly": 10}]
+    assert execution.test(str(folder), contract).success
+    assert execution.test(str(folder / "*.parquet"), contract).success
+    with pytest.raises(ValueError, match="parquet"):
+        execution.test("contract.yaml", contract)
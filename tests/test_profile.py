@@ -1,4 +1,8 @@
+from statistics import StatisticsError, stdev
+
+import numpy as np
 import polars as pl
+import pytest
 
 from wimsey import profile
 from wimsey import execution
@@ -77,3 +81,55 @@ def test_save_tests_from_samples_creates_expected_and_runnable_file(tmp_path) ->
     )
     result = execution.test(df, str(tmp_path / "cool.json"))
     assert result.success
+
+
+def test_stat_starter_tests_match_statistics_module() -> None:
+    # Floats for which numpy's standard deviation differs in the last bit
+    d = [0.844, 0.758, 0.421, 0.259, 0.511]
+    samples = [
+        {"max_a": 1, "max_b": 3, "max_c": None, "max_d": d[0]},
+        {"max_a": 4, "max_b": 3, "max_c": None, "max_d": d[1]},
+        {"max_a": 2, "max_b": 3, "max_c": None, "max_d": d[2]},
+        {"max_a": None, "max_b": 3, "max_c": None, "max_d": d[3]},
+        {"max_a": None, "max_b": 3, "max_c": None, "max_d": d[4]},
+    ]
+    tests = profile._stat_starter_tests("max", samples, ["a", "b", "c", "d"], margin=2)
+    assert tests[0]["be_less_than_or_equal_to"] == 4 + stdev([1, 4, 2]) * 2
+    assert tests[0]["be_greater_than_or_equal_to"] == 1 - stdev([1, 4, 2]) * 2
+    assert tests[1] == {"column": "b", "test": "max_should", "be_exactly": 3}
+    assert tests[2]["be_less_than_or_equal_to"] == max(d) + stdev(d) * 2
+    assert tests[2]["be_greater_than_or_equal_to"] == min(d) - stdev(d) * 2
+    assert isinstance(tests[1]["be_exactly"], int)
+
+
+def test_stdevs_are_rounded_as_statistics_module() -> None:
+    rng = np.random.default_rng(0)
+    rows = (
+        [rng.random(100) for _ in range(500)]
+        + [np.round(rng.random(5), 3) for _ in range(500)]
+        + [1.0 + rng.integers(0, 4, 20) * 2.0**-52 for _ in range(100)]
+    )
+    actual = profile._stdevs(
+        np,
+        np.array([np.pad(i, (0, 100 - len(i)), constant_values=np.nan) for i in rows]),
+    )
+    assert actual.tolist() == [stdev(i.tolist()) for i in rows]
+    # Left to statistics.stdev where they can't be calculated exactly
+    huge = np.array([[1e200, 2e200], [1.0, 2.0]])
+    assert np.isnan(profile._stdevs(np, huge)[0])
+
+
+def test_stat_starter_tests_need_two_values_as_before() -> None:
+    samples = [{"max_a": 1}, {"max_a": None}]
+    with pytest.raises(StatisticsError):
+        profile._stat_starter_tests("max", samples, ["a"], margin=1)
+
+
+def test_type_starter_tests_from_sample_describes() -> None:
+    samples = [
+        {"type_a": "Int64", "type_b": "String"},
+        {"type_a": "Float64", "type_b": "String"},
+    ]
+    tests = profile._type_starter_tests(samples, ["a", "b"])
+    assert sorted(tests[0]["be_one_of"]) == ["Float64", "Int64"]
+    assert tests[1] == {"column": "b", "test": "type_should", "be": "String"}
@@ -0,0 +1,128 @@
+import dask.dataframe as dd
+import numpy as np
+import polars as pl
+import pytest
+
+from wimsey import config
+from wimsey import execution
+from wimsey import sampling
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(42)
+    rows = 200_000
+    return pl.DataFrame(
+        {
+            "a": rng.normal(10, 2, rows),
+            "b": np.where(rng.random(rows) < 0.1, np.nan, 1.0),
+            "c": rng.choice(["x", "y"], rows),
+        }
+    ).fill_nan(None)
+
+
+def test_outcome_of_interval_against_bounds():
+    assert sampling._outcome({"be_less_than": 10}, 1, 9) is True
+    assert sampling._outcome({"be_less_than": 10}, 10, 12) is False
+    assert sampling._outcome({"be_less_than": 10}, 9, 11) is None
+    assert sampling._outcome({"be_less_than_or_equal_to": 10}, 9, 10) is True
+    assert sampling._outcome({"be_greater_than_or_equal_to": 10}, 8, 9.9) is False
+    assert sampling._outcome({"be_exactly": 10}, 9, 11) is None
+    assert sampling._outcome({"be_exactly": 10}, 11, 12) is False
+    assert sampling._outcome({}, 11, 12) is True
+
+
+def test_sample_size_from_rows_or_fraction():
+    assert sampling.sample_size(100, 1_000) == 100
+    assert sampling.sample_size(0.1, 1_000) == 100
+    with pytest.raises(ValueError):
+        sampling.sample_size(1.5, 1_000)
+
+
+def test_sampled_tests_carry_confidence_intervals(df):
+    contract = [
+        {"test": "mean_should", "column": "a", "be_greater_than": 9},
+        {"test": "std_should", "column": "a", "be_less_than": 3},
+        {"test": "null_percentage_should", "column": "b", "be_less_than": 0.2},
+        {"test": "row_count_should", "be_exactly": 200_000},
+        {"test": "type_should", "column": "c", "be": "String"},
+        {"test": "max_should", "column": "a", "be_less_than": 100},
+    ]
+    actual = execution.test(df, contract, sample=2_000, seed=42)
+    assert actual.success
+    low, high = actual.results[0].confidence_interval
+    assert low < 10 < high
+    low, high = actual.results[1].confidence_interval
+    assert low < 2 < high
+    low, high = actual.results[2].confidence_interval
+    assert low < 0.1 < high
+    assert [i.confidence_interval for i in actual.results[3:]] == [None] * 3
+
+
+def test_sampled_tests_fail_when_interval_is_out_of_bounds(df):
+    contract = [{"test": "mean_should", "column": "a", "be_greater_than": 11}]
+    actual = execution.test(df, contract, sample=0.01, seed=42)
+    assert not actual.success
+    assert not actual.results[0].inconclusive
+    assert actual.results[0].unexpected < 11
+
+
+def test_inconclusive_tests_escalate_to_full_dataframe(df):
+    mean = df["a"].mean()
+    contract = [{"test": "mean_should", "column": "a", "be_greater_than": mean - 1e-6}]
+    without_escalation = execution.test(
+        df, contract, sample=1_000, seed=42, escalate=False
+    )
+    assert without_escalation.results[0].inconclusive
+    assert not without_escalation.success
+    actual = execution.test(df, contract, sample=1_000, seed=42)
+    assert actual.success
+    assert actual.results[0].confidence_interval is None
+
+
+def test_sampling_lazy_frames(df):
+    contract = [{"test": "mean_should", "column": "a", "be_less_than": 11}]
+    actual = execution.test(df.lazy(), contract, sample=2_000, escalate=False, seed=42)
+    assert actual.success
+    assert actual.results[0].confidence_interval is not None
+
+
+@pytest.mark.parametrize(
+    "to_frame",
+    [lambda i: i, lambda i: i.lazy(), lambda i: dd.from_pandas(i.to_pandas(), 4)],
+    ids=["polars", "lazy", "dask"],
+)
+def test_seeded_samples_are_repeatable(df, to_frame):
+    contract = [{"test": "mean_should", "column": "a", "be_less_than": 11}]
+    frame = to_frame(df)
+    intervals = [
+        execution.test(frame, contract, sample=1_000, escalate=False, seed=seed)
+        .results[0]
+        .confidence_interval
+        for seed in (1, 1, 2)
+    ]
+    assert intervals[0] == intervals[1]
+    assert intervals[0] != intervals[2]
+
+
+def test_sampling_cannot_be_combined_with_state(df, tmp_path):
+    with pytest.raises(ValueError):
+        execution.test(
+            df,
+            [{"test": "mean_should", "column": "a"}],
+            sample=100,
+            state=str(tmp_path / "state.json"),
+        )
+
+
+def test_split_contract_always_calculates_row_count():
+    contract = config.compile_contract(
+        [
+            {"test": "mean_should", "column": "a", "be_less_than": 11},
+            {"test": "type_should", "column": "a", "be": "Float64"},
+        ]
+    )
+    full, sampled = sampling.split_contract(contract)
+    assert len(sampled) == 1
+    assert (None, "length") in full.plan.pairs
+    assert "length" in full.metrics
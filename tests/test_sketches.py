@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pytest
+
+from wimsey import sketches
+
+
+def test_kll_sketch_quantiles_are_within_error_bound() -> None:
+    sketch = sketches.KLLSketch(error=0.01, seed=0).update(range(100_000))
+    assert sketch.count == 100_000
+    assert len([i for level in sketch.levels for i in level]) < 2_000
+    for quantile in (0.1, 0.5, 0.9):
+        assert abs(sketch.quantile(quantile) - quantile * 100_000) < 2_000
+
+
+def test_kll_sketch_ignores_nulls_and_is_none_when_empty() -> None:
+    assert sketches.KLLSketch().update([None, float("nan")]).quantile(0.5) is None
+
+
+def test_merged_kll_sketches_match_single_sketch() -> None:
+    left = sketches.KLLSketch(seed=0).update(range(0, 50_000))
+    right = sketches.KLLSketch(seed=1).update(range(50_000, 100_000))
+    merged = left.merge(right)
+    assert merged.count == 100_000
+    assert abs(merged.quantile(0.5) - 50_000) < 2_000
+
+
+def test_hyperloglog_estimate_is_within_error_bound() -> None:
+    sketch = sketches.HyperLogLog(error=0.01).update(i % 20_000 for i in range(60_000))
+    assert abs(sketch.estimate() - 20_000) < 20_000 * 0.03
+
+
+def test_hyperloglog_is_exact_for_small_counts_and_ignores_nulls() -> None:
+    assert sketches.HyperLogLog().update(["a", "b", "a", None]).estimate() == 2
+
+
+def test_merged_hyperloglogs_count_overlapping_values_once() -> None:
+    left = sketches.HyperLogLog().update(range(0, 6_000))
+    right = sketches.HyperLogLog().update(range(4_000, 10_000))
+    assert abs(left.merge(right).estimate() - 10_000) < 300
+
+
+def test_hyperloglog_hashes_numeric_arrays_as_values() -> None:
+    values = np.random.default_rng(0).random(10_000)
+    values[:100] = np.arange(100)
+    expected = sketches.HyperLogLog().update(values.tolist() + list(range(100)))
+    actual = sketches.HyperLogLog().update_numeric(values)
+    assert actual.registers == expected.registers
+
+
+def test_hyperloglogs_with_different_errors_cannot_merge() -> None:
+    with pytest.raises(ValueError):
+        sketches.HyperLogLog(error=0.01).merge(sketches.HyperLogLog(error=0.05))
+
+
+def test_sketches_round_trip_through_json() -> None:
+    kll = sketches.KLLSketch().update(range(1_000))
+    hll = sketches.HyperLogLog().update(range(1_000))
+    kll_copy = sketches.KLLSketch.from_dict(json.loads(json.dumps(kll.to_dict())))
+    hll_copy = sketches.HyperLogLog.from_dict(json.loads(json.dumps(hll.to_dict())))
+    assert kll_copy.quantile(0.5) == kll.quantile(0.5)
+    assert hll_copy.estimate() == hll.estimate()
+
+
+def test_kll_sketch_from_every_other_sorted_value() -> None:
+    values = list(range(100_000))
+    sketch = sketches.KLLSketch(error=0.01)
+    level = sketch.compaction_level(len(values))
+    assert level > 0
+    step = 2**level
+    sketch.update_sorted(values[step // 2 :: step], len(values), level)
+    assert sum(len(i) for i in sketch.levels) < sketch.k
+    for quantile in (0, 0.1, 0.5, 0.9, 1):
+        assert abs(sketch.quantile(quantile) - quantile * 100_000) <= 1_000
+    merged = sketch.merge(sketches.KLLSketch(error=0.01).update(range(100_000)))
+    assert abs(merged.quantile(0.5) - 50_000) <= 2_000
@@ -0,0 +1,193 @@
+import math
+import sqlite3
+import statistics
+import sys
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+
+from wimsey import dataframe
+from wimsey import execution
+from wimsey import sql
+
+
+class StandardDeviation:
+    def __init__(self):
+        self.values = []
+
+    def step(self, value):
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.create_aggregate("STDDEV_SAMP", 1, StandardDeviation)
+    connection.execute("CREATE TABLE sales (a INTEGER, b TEXT, c REAL)")
+    connection.executemany(
+        "INSERT INTO sales VALUES (?, ?, ?)",
+        [(1, "x", 1.5), (2, None, 2.5), (None, "y", 3.5), (4, "z", None)],
+    )
+    return connection
+
+
+def test_describe_matches_dataframe_describe(connection):
+    actual = sql.describe(sql.Table(connection, "sales"))
+    expected = dataframe.describe(
+        pl.DataFrame(
+            {
+                "a": [1, 2, None, 4],
+                "b": ["x", None, "y", "z"],
+                "c": [1.5, 2.5, 3.5, None],
+            }
+        )
+    )
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert math.isclose(actual[key], value)
+        else:
+            assert actual[key] == value
+
+
+def test_describe_runs_a_single_aggregate_query(connection):
+    queries = []
+    connection.set_trace_callback(queries.append)
+    plan = dataframe.Plan(frozenset({(None, "length"), ("a", "max"), ("b", "min")}))
+    actual = sql.describe(sql.Table(connection, "sales"), plan=plan)
+    assert actual == {
+        "columns": "a_^&^_b_^&^_c",
+        "length": 4,
+        "max_a": 4,
+        "min_b": None,
+    }
+    assert [i for i in queries if "COUNT(*)" in i] == [
+        'SELECT COUNT(*), MAX("a") FROM "sales"'
+    ]
+
+
+def test_describe_queries_with_typeof(connection):
+    table = sql.Table(
+        connection, query="SELECT a, b FROM sales WHERE a > 1 ORDER BY a DESC"
+    )
+    first_row_null = sql.Table(connection, query="SELECT b FROM sales WHERE a = 2")
+    actual = sql.describe(table, metrics=["type", "count", "distinct_count"])
+    assert actual == {
+        "columns": "a_^&^_b",
+        "type_a": "Int64",
+        "type_b": "String",
+        "count_a": 2,
+        "count_b": 1,
+        "distinct_count_a": 2,
+        "distinct_count_b": 1,
+    }
+    queries = []
+    connection.set_trace_callback(queries.append)
+    assert sql.describe(first_row_null, metrics=["type"])["type_b"] is None
+    assert not [i for i in queries if "COUNT" in i]
+
+
+def test_testing_sql_tables(connection):
+    contract = [
+        {"test": "row_count_should", "be_exactly": 4},
+        {"test": "mean_should", "column": "c", "be_less_than": 3},
+        {"test": "null_percentage_should", "column": "b", "be_less_than": 0.2},
+        {"test": "type_should", "column": "b", "be": "String"},
+        {"test": "quantile_should", "column": "a", "quantile": 1, "be_exactly": 4},
+    ]
+    actual = execution.test(sql.Table(connection, "sales"), contract)
+    assert [i.success for i in actual.results] == [True, True, False, True, True]
+    with pytest.raises(ValueError):
+        execution.test(
+            sql.Table(connection, "sales"),
+            [{"test": "values_should", "column": "a", "be_less_than": 3}],
+        )
+
+
+def test_tables_need_a_name_or_query(connection):
+    with pytest.raises(ValueError):
+        sql.Table(connection)
+    with pytest.raises(ValueError):
+        sql.Table(connection, "sales", "SELECT * FROM sales")
+
+
+def test_sql_tables_cannot_be_tested_against_state(connection, tmp_path):
+    with pytest.raises(ValueError):
+        execution.test(
+            sql.Table(connection, "sales"),
+            [{"test": "row_count_should", "be_greater_than": 1}],
+            state=str(tmp_path / "state.json"),
+        )
+
+
+class TypeObject:
+    """A DB-API type object, comparing equal to each of its type codes"""
+
+    def __init__(self, *codes):
+        self.codes = codes
+
+    def __eq__(self, other):
+        return other in self.codes
+
+
+class Cursor:
+    """A cursor giving integer type codes, and without typeof, as psycopg does"""
+
+    type_codes = {"a": 23, "b": 25, "c": 701}
+
+    def __init__(self, connection, queries):
+        self.cursor = connection.cursor()
+        self.queries = queries
+
+    def execute(self, query):
+        self.queries.append(query)
+        if "typeof" in query or "information_schema" in query:
+            raise sqlite3.OperationalError(query)
+        self.cursor.execute(query)
+
+    @property
+    def description(self):
+        return [(i[0], self.type_codes[i[0]]) for i in self.cursor.description]
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+
+class Connection:
+    __module__ = "fakedb"
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.queries = []
+
+    def cursor(self):
+        return Cursor(self.connection, self.queries)
+
+
+def test_describe_reads_types_from_cursor_description(connection, monkeypatch):
+    monkeypatch.setitem(
+        sys.modules,
+        "fakedb",
+        SimpleNamespace(NUMBER=TypeObject(23, 701), STRING=TypeObject(25)),
+    )
+    fake = Connection(connection)
+    for table in (
+        sql.Table(fake, "sales"),
+        sql.Table(fake, query="SELECT * FROM sales"),
+    ):
+        actual = sql.describe(table, metrics=["type", "mean"])
+        assert actual["type_a"] == "NUMBER"
+        assert actual["type_b"] == "String"
+        assert actual["mean_a"] == 7 / 3
+        assert actual["mean_b"] is None
+    catalog_queries = [i for i in fake.queries if "information_schema" in i]
+    assert catalog_queries == [
+        "SELECT column_name, data_type FROM information_schema.columns "
+        "WHERE table_name = 'sales' AND table_schema = current_schema()"
+    ]
+    assert not [i for i in fake.queries if "typeof" in i]
@@ -1,6 +1,6 @@
 from typing import Callable
 
-from wimsey import tests
+from wimsey import sketches, tests
 
 
 def test_that_all_possible_tests_are_functions_that_return_partials() -> None:
@@ -23,3 +23,86 @@ def test_average_ratio_to_other_column_should_matches_expected() -> None:
     failing_result = test({"mean_a": 13, "mean_b": 160})
     assert passing_result.success
     assert not failing_result.success
+
+
+def test_row_count_should_be_exactly() -> None:
+    test = tests.row_count_should(be_exactly=3)
+    assert test({"length": 3}).success
+    assert not test({"length": 999}).success
+
+
+def test_quantile_should_tests_value_at_quantile() -> None:
+    sketch = sketches.KLLSketch().update(range(101))
+    test = tests.quantile_should("a", quantile=0.9, be_greater_than=80)
+    assert test({"quantiles_a": sketch}).success
+    assert not tests.quantile_should("a", be_greater_than=80)(
+        {"quantiles_a": sketch}
+    ).success
+
+
+def test_quantile_should_fails_without_quantiles() -> None:
+    test = tests.quantile_should("a", be_greater_than=80)
+    assert not test({"quantiles_a": None}).success
+    assert not test({"quantiles_a": sketches.KLLSketch().update([None])}).success
+
+
+def test_row_checks_share_keys_only_when_identical() -> None:
+    first = tests.values_should("a", be_one_of=[1, 2])
+    second = tests.values_should("a", be_one_of=[1, 2], sample_failing_rows=3)
+    third = tests.values_should("a", be_one_of=[1, 3])
+    assert first.required_expressions.keys() == second.required_expressions.keys()
+    assert first.required_expressions.keys() != third.required_expressions.keys()
+
+
+def test_row_checks_allow_failures_up_to_max_failing_fraction() -> None:
+    test = tests.values_should("a", not_be_null=True, max_failing_fraction=0.1)
+    (key,) = test.required_expressions
+    passing = test({f"failing_count_{key}": 1, "length": 10})
+    failing = test({f"failing_count_{key}": 2, "length": 10})
+    assert passing.success and passing.failing_count == 1
+    assert not failing.success and failing.unexpected == 2
+
+
+def test_result_table_behaves_as_list_of_results():
+    results = [
+        tests.result(name="a", success=True),
+        tests.result(name="b", success=False, unexpected=3),
+        tests.result(name="c", success=False, failing_count=1, failing_rows=[{"x": 1}]),
+    ]
+    table = tests.result_table.from_results(results)
+    assert len(table) == 3
+    assert table == results
+    assert table[1] == results[1]
+    assert table[-1].failing_rows == [{"x": 1}]
+    assert list(table[1:]) == results[1:]
+    assert table + [tests.result(name="d", success=True)] == results + [
+        tests.result(name="d", success=True)
+    ]
+    assert not table.success
+    assert table.to_dict()["name"] == ["a", "b", "c"]
+    assert [i.name for i in table.failures()] == ["b", "c"]
+
+
+def test_result_table_filters_and_exports_failures():
+    table = tests.result_table(
+        {
+            "name": ["a", "b", "c"],
+            "success": [True, False, False],
+            "unexpected": [None, 3, "x"],
+        }
+    )
+    failures = table.failures()
+    assert [i.name for i in failures] == ["b", "c"]
+    assert failures.to_dict() == {
+        "name": ["b", "c"],
+        "success": [False, False],
+        "unexpected": [3, "x"],
+        "failing_count": [None, None],
+        "failing_rows": [None, None],
+        "confidence_interval": [None, None],
+        "inconclusive": [False, False],
+        "group": [None, None],
+    }
+    arrow = table.to_arrow()
+    assert arrow.column("unexpected").to_pylist() == [None, "3", "x"]
+    assert arrow.column("success").to_pylist() == [True, False, False]
@@ -0,0 +1,97 @@
+import math
+
+import pytest
+
+from wimsey import config
+from wimsey import tests
+from wimsey import vectorise
+
+
+def _results_of_calling_each(contract, description):
+    return [i(description) for i in contract.tests]
+
+
+def test_evaluate_matches_calling_each_test():
+    contract = config.compile_contract(
+        [
+            {"test": "max_should", "column": "a", "be_less_than": 10},
+            {"test": "min_should", "column": "a", "be_greater_than_or_equal_to": 2},
+            {"test": "mean_should", "column": "a", "be_exactly": 3},
+            {"test": "columns_should", "have": ["a"]},
+            {"test": "min_should", "column": "b", "be_less_than": "m"},
+            {"test": "std_should", "column": "c", "be_less_than": 1},
+            {"test": "max_should", "column": "d", "be_exactly": 2**60 + 1},
+            {"test": "row_count_should", "be_greater_than": 2},
+            {"test": "null_count_should", "column": "a"},
+            {
+                "test": "average_difference_from_other_column_should",
+                "column": "a",
+                "other_column": "c",
+                "be_greater_than": 1,
+            },
+            {
+                "test": "average_ratio_to_other_column_should",
+                "column": "c",
+                "other_column": "a",
+                "be_less_than": 0.1,
+            },
+        ]
+    )
+    description = {
+        "columns": "a_^&^_b_^&^_c_^&^_d",
+        "length": 3,
+        "max_a": 12,
+        "min_a": 2,
+        "mean_a": 3.0,
+        "null_count_a": 0,
+        "min_b": "hat",
+        "std_c": math.nan,
+        "max_c": None,
+        "mean_c": 0.5,
+        "max_d": 2**60 + 1,
+    }
+    assert contract.range_checks is not None
+    assert len(contract.range_checks) == 8
+    actual = vectorise.evaluate(contract.tests, contract.range_checks, description)
+    assert actual == _results_of_calling_each(contract, description)
+    assert [i.name for i in actual.failures()] == [
+        "max-of-a",
+        "std-of-c",
+        "average-ratio-between-c-and-a",
+    ]
+
+
+def test_evaluate_leaves_unevaluable_tests_to_raise():
+    contract = config.compile_contract(
+        [
+            {
+                "test": "average_ratio_to_other_column_should",
+                "column": "a",
+                "other_column": "b",
+                "be_less_than": 1,
+            },
+        ]
+    )
+    with pytest.raises(ZeroDivisionError):
+        vectorise.evaluate(
+            contract.tests, contract.range_checks, {"mean_a": 1, "mean_b": 0}
+        )
+    contract = config.compile_contract(
+        [{"test": "max_should", "column": "a", "be_less_than": 1}]
+    )
+    with pytest.raises(TypeError):
+        vectorise.evaluate(contract.tests, contract.range_checks, {"max_a": None})
+
+
+def test_compile_range_checks_skips_other_tests():
+    contract = config.compile_contract([{"test": "columns_should", "have": ["a"]}])
+    assert contract.range_checks is None
+
+
+def test_average_difference_does_not_change_description():
+    description = {"mean_a": 5, "mean_b": 3}
+    test = tests.average_difference_from_other_column_should(
+        column="a", other_column="b", be_exactly=2
+    )
+    assert test(description).success
+    assert description == {"mean_a": 5, "mean_b": 3}
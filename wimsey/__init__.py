@@ -1,2 +1,57 @@
-from wimsey.execution import DataValidationException, test, validate  # noqa
+"""
+Public API of wimsey, imported on first use (see PEP 562), so that importing
+wimsey itself doesn't pull in narwhals or fsspec until they're needed.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from wimsey._version import __version__  # noqa
+
+_EXPORTS: dict[str, str] = {
+    "DataValidationException": "wimsey.execution",
+    "test": "wimsey.execution",
+    "test_many": "wimsey.execution",
+    "test_stream": "wimsey.execution",
+    "validate": "wimsey.execution",
+    "validate_stream": "wimsey.execution",
+    "Contract": "wimsey.config",
+    "compile_contract": "wimsey.config",
+    "atest": "wimsey.aio",
+    "atest_many": "wimsey.aio",
+    "avalidate": "wimsey.aio",
+}
+
+__all__ = [*_EXPORTS, "__version__"]
+
+if TYPE_CHECKING:
+    from wimsey.execution import (  # noqa
+        DataValidationException,
+        test,
+        test_many,
+        test_stream,
+        validate,
+        validate_stream,
+    )
+    from wimsey.config import Contract, compile_contract  # noqa
+    from wimsey.aio import atest, atest_many, avalidate  # noqa
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        # Submodules, such as wimsey.tests, were once all imported alongside
+        # wimsey, so are still given as attributes, but only once used
+        try:
+            return import_module(f"wimsey.{name}")
+        except ModuleNotFoundError as exception:
+            if exception.name != f"wimsey.{name}":
+                raise
+        msg = f"module 'wimsey' has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,168 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from narwhals.stable.v1.typing import FrameT
+
+from wimsey.config import (
+    Contract,
+    _cache_contract,
+    _cache_key,
+    _cached_contract,
+    _file_version,
+    _tests_from_contents,
+    compile_contract,
+)
+from wimsey.execution import batch_result, final_result, _raise_on_failure, test
+
+DEFAULT_CONCURRENCY: int = 4
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+
+
+def _default_semaphore() -> asyncio.Semaphore:
+    """
+    Internal function, get the semaphore limiting concurrent describes for the
+    running event loop, allowing up to `DEFAULT_CONCURRENCY` at once.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+    return _semaphores[loop]
+
+
+async def _in_executor(executor: Executor | None, func: Callable, *args) -> Any:
+    """Internal function, run func in executor without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, partial(func, *args)
+    )
+
+
+async def acompile_contract(
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+    cache: bool = True,
+    executor: Executor | None = None,
+) -> Contract:
+    """
+    Asynchronous version of `wimsey.config.compile_contract`, sharing its cache.
+
+    Where contract is a path on a filesystem with an asynchronous implementation
+    in fsspec (such as S3, GCS or HTTP), it's read without blocking the event
+    loop, otherwise, it's read in `executor` (the event loop's default executor
+    if not given).
+    """
+    if not isinstance(contract, str):
+        return compile_contract(contract)
+    import fsspec  # type: ignore[import-untyped]
+
+    storage_options = storage_options or {}
+    fs, path = fsspec.core.url_to_fs(contract, **storage_options)
+    if not getattr(fs, "async_impl", False):
+        return await _in_executor(
+            executor, compile_contract, contract, storage_options, cache
+        )
+    fs, path = fsspec.core.url_to_fs(contract, asynchronous=True, **storage_options)
+    key: tuple | None = None
+    if cache:
+        try:
+            version = _file_version(await fs._info(path))
+        except Exception:
+            version = None
+        if version is not None:
+            key = _cache_key(contract, version, storage_options)
+            cached = _cached_contract(key)
+            if cached is not None:
+                return cached
+    contents = await fs._cat_file(path)
+    compiled = Contract.from_tests(_tests_from_contents(contract, contents.decode()))
+    if key is not None:
+        _cache_contract(key, compiled)
+    return compiled
+
+
+async def atest(
+    df: FrameT,
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+    executor: Executor | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    **kwargs,
+) -> final_result:
+    """
+    Asynchronous version of `wimsey.test`, for use within an event loop.
+
+    Contracts are loaded using `acompile_contract`, and dataframes described in
+    `executor` (the event loop's default executor if not given). At most
+    `DEFAULT_CONCURRENCY` dataframes are described at once, unless a different
+    `semaphore` is given. Any other keywords, such as `workers` or `fail_fast`,
+    are passed to `wimsey.test`.
+    """
+    compiled = await acompile_contract(contract, storage_options, executor=executor)
+    async with semaphore or _default_semaphore():
+        return await _in_executor(
+            executor,
+            partial(test, storage_options=storage_options, **kwargs),
+            df,
+            compiled,
+        )
+
+
+async def avalidate(
+    df: FrameT,
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+    executor: Executor | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    **kwargs,
+) -> FrameT:
+    """
+    Asynchronous version of `wimsey.validate`, returning original dataframe if
+    tests are successful, and raising a DataValidationException in case of
+    failure. See `atest` for details.
+    """
+    results = await atest(df, contract, storage_options, executor, semaphore, **kwargs)
+    _raise_on_failure(results)
+    return df
+
+
+async def atest_many(
+    frames: dict[str, tuple[FrameT, str | list[dict] | dict | Contract]],
+    storage_options: dict | None = None,
+    executor: Executor | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    **kwargs,
+) -> batch_result:
+    """
+    Carry out tests on multiple dataframes concurrently, given as a dictionary
+    of names to dataframe and contract pairs, returning a 'batch_result' object,
+    holding the 'final_result' for each name.
+
+    Each dataframe is tested with `atest`, so a slow contract read, or a large
+    dataframe, won't hold up the others. Timings give the time taken for each
+    dataframe, including time waiting for others, so may overlap.
+    """
+    start = perf_counter()
+
+    async def timed_test(df: FrameT, contract: Any) -> tuple[final_result, float]:
+        table_start = perf_counter()
+        results = await atest(
+            df, contract, storage_options, executor, semaphore, **kwargs
+        )
+        return results, perf_counter() - table_start
+
+    outcomes = await asyncio.gather(
+        *[timed_test(df, contract) for df, contract in frames.values()]
+    )
+    results = {name: i for name, (i, _) in zip(frames, outcomes)}
+    return batch_result(
+        success=all(i.success for i in results.values()),
+        results=results,
+        timings={name: i for name, (_, i) in zip(frames, outcomes)},
+        shared_time=0.0,
+        total_time=perf_counter() - start,
+    )
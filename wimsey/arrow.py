@@ -0,0 +1,151 @@
+"""
+Describing arrow data (pyarrow tables, any object exposing the Arrow PyCapsule
+stream interface, or DuckDB relations) with `pyarrow.compute`, directly on
+its buffers, rather than through a dataframe backend.
+"""
+
+import math
+import sys
+from typing import Any
+
+import narwhals.stable.v1 as nw
+
+from wimsey.dataframe import (
+    Plan,
+    _DEFAULT_METRICS,
+    _SKETCH_METRICS,
+    _describe_sketches,
+    _failing_rows,
+    _first_row,
+)
+
+
+def _is_duckdb_relation(source: Any) -> bool:
+    """Internal function, check whether source is a DuckDB relation"""
+    duckdb = sys.modules.get("duckdb")
+    return duckdb is not None and isinstance(source, duckdb.DuckDBPyRelation)
+
+
+def is_arrow_source(source: Any) -> bool:
+    """
+    Check whether source is a pyarrow table, or something narwhals can't read
+    as a dataframe, but that can be read as a stream of arrow record batches
+    (such as a DuckDB relation, or pyarrow `RecordBatchReader`).
+    """
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(source, pyarrow.Table):
+        return True
+    # Narwhals reads DuckDB relations as (interchange-only) dataframes, which
+    # can't be described, so they're always read as arrow
+    if _is_duckdb_relation(source):
+        return True
+    if not hasattr(source, "__arrow_c_stream__"):
+        return False
+    return nw.from_native(source, strict=False) is source
+
+
+def to_table(source: Any) -> Any:
+    """
+    Read source as a pyarrow table, without copying any buffers where source
+    exposes them through the Arrow PyCapsule interface.
+    """
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+    except ImportError as exception:
+        msg = (
+            "It looks like you're trying to test an arrow table or stream. "
+            "This is supported but requires an additional install of pyarrow "
+            "(`pip install pyarrow`)"
+        )
+        raise ImportError(msg) from exception
+    if isinstance(source, pa.Table):
+        return source
+    if _is_duckdb_relation(source):
+        # Relations give a table in older versions of DuckDB, but a record
+        # batch reader in newer ones
+        arrow = source.arrow()
+        return arrow if isinstance(arrow, pa.Table) else arrow.read_all()
+    return pa.table(source)
+
+
+def _column_metric(column: Any, metric: str, numeric: bool) -> Any:
+    """Internal function, calculate a single metric of a chunked array"""
+    import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+    if metric == "count":
+        return len(column) - column.null_count
+    if metric == "null_count":
+        return column.null_count
+    if not numeric:
+        return None
+    if metric == "mean":
+        return pc.mean(column).as_py()
+    if metric == "std":
+        return pc.stddev(column, ddof=1).as_py()
+    return getattr(pc, metric)(column).as_py()
+
+
+def describe(
+    source: Any,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    sketch_error: float | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: Plan | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same dictionary as `wimsey.dataframe.describe` for an arrow
+    source (see `is_arrow_source`), or any dataframe that can be read as arrow,
+    calculating each metric with `pyarrow.compute`.
+
+    Counts, null counts and length are read from array metadata, so cost
+    nothing to calculate. Row check `expressions` and sketch metrics are
+    calculated through narwhals' pyarrow backend.
+    """
+    table = to_table(source)
+    frame = nw.from_native(table, eager_only=True)
+    schema = frame.schema
+    if not schema:
+        return {}
+    if plan is None:
+        columns_to_check = [i for i in (columns or list(schema)) if i in schema]
+        plan = Plan.from_columns_and_metrics(
+            columns_to_check, metrics or _DEFAULT_METRICS
+        )
+    else:
+        plan = Plan(frozenset(i for i in plan.pairs if i[0] is None or i[0] in schema))
+    length = table.num_rows
+    description: dict[str, Any] = {"columns": "_^&^_".join(schema)}
+    for column, metric in sorted(plan.pairs, key=lambda i: (i[1], i[0] or "")):
+        if column is None:
+            if metric == "length":
+                description["length"] = length
+            continue
+        key = f"{metric}_{column}"
+        if metric == "type":
+            description[key] = str(schema[column])
+        elif metric == "null_percentage":
+            null_count = table.column(column).null_count
+            description[key] = null_count / length if length else math.nan
+        elif metric not in _SKETCH_METRICS:
+            description[key] = _column_metric(
+                table.column(column), metric, schema[column].is_numeric()
+            )
+    sketch_columns = {
+        metric: [c for c, m in plan.pairs if m == metric and c is not None]
+        for metric in _SKETCH_METRICS
+    }
+    description |= _describe_sketches(
+        frame, {k: v for k, v in sketch_columns.items() if v}, sketch_error
+    )
+    if expressions:
+        description |= _first_row(
+            frame.select(
+                *[
+                    (~expression).sum().alias(f"failing_count_{key}")
+                    for key, (expression, _) in expressions.items()
+                ]
+            )
+        )
+        description |= _failing_rows(frame, expressions, description)
+    return description
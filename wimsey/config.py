@@ -1,9 +1,79 @@
 import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
-import fsspec
-
+from wimsey.dataframe import Plan
 from wimsey.tests import possible_tests
+from wimsey.vectorise import RangeChecks, compile_range_checks
+
+CONTRACT_CACHE_SIZE: int = 128
+_contract_cache: OrderedDict[tuple, "Contract"] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class Contract:
+    """
+    A parsed contract, holding its test callables alongside the columns and
+    metrics `describe` will need to calculate in order to evaluate them. A
+    columns or metrics value of None means everything should be calculated.
+
+    Row checks, such as `values_should`, are held in `expressions` as a
+    dictionary of keys to their narwhals expression and number of failing rows
+    to sample.
+
+    The exact metrics needed for each column are held in `plan`, which can be
+    inspected before testing any data, see `wimsey.dataframe.Plan`.
+
+    Range-style tests are compiled to arrays in `range_checks`, so they can be
+    evaluated all at once, see `wimsey.vectorise`.
+    """
+
+    tests: list[Callable]
+    columns: list[str] | None = None
+    metrics: list[str] | None = None
+    expressions: dict[str, tuple[Any, int]] | None = None
+    plan: Plan | None = None
+    range_checks: RangeChecks | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_tests(cls, tests: list[Callable]) -> "Contract":
+        columns, metrics = required_columns_and_metrics(tests)
+        return cls(
+            tests=tests,
+            columns=columns,
+            metrics=metrics,
+            expressions=required_expressions(tests),
+            plan=required_plan(tests),
+            range_checks=compile_range_checks(tests),
+        )
+
+    def stages(self) -> list["Contract"]:
+        """
+        Split contract into smaller contracts, ordered by the cost of calculating
+        their metrics, tests needing only the schema first, then the row count,
+        then anything requiring aggregations over the data.
+        """
+        costs = [_test_cost(i) for i in self.tests]
+        return [
+            Contract.from_tests([i for i, cost in zip(self.tests, costs) if cost == c])
+            for c in sorted(set(costs))
+        ]
+
+
+def _test_cost(test: Callable) -> int:
+    """
+    Internal function, rank a test by the cost of calculating its required
+    metrics, 0 for the schema only, 1 for row count and 2 for anything else.
+    """
+    metrics: set[str] | None = getattr(test, "required_metrics", None)
+    if metrics is None or getattr(test, "required_expressions", None):
+        return 2
+    if metrics <= {"type"}:
+        return 0
+    if metrics <= {"length"}:
+        return 1
+    return 2
 
 
 def collect_tests(config: list[dict] | dict | list[Callable]) -> list[Callable]:
@@ -35,10 +105,20 @@ def read_config(path: str, storage_options: dict | None = None) -> list[Callable
     """
     Read a json or yaml configuration, and return list of test callables
     """
+    import fsspec  # type: ignore[import-untyped]
+
     storage_options_dict: dict = storage_options or {}
-    config: dict
     with fsspec.open(path, "rt", **storage_options_dict) as file:
         contents = file.read()
+    return _tests_from_contents(path, contents)
+
+
+def _tests_from_contents(path: str, contents: str) -> list[Callable]:
+    """
+    Internal function, parse the contents of a json or yaml configuration read
+    from path, and return list of test callables
+    """
+    config: dict
     if path.endswith(".yaml") or path.endswith(".yml"):
         try:
             import yaml
@@ -70,3 +150,145 @@ def parse_contents(contents: Any) -> list[dict] | dict:
         "or a key/value pair with a 'tests' key relating to a list of tests"
     )
     raise ValueError(msg)
+
+
+def _as_set(val: Any) -> set:
+    """
+    Internal function, if val is none, return empty set,
+    otherwise return set of just val
+    """
+    return {val} if val is not None else set()
+
+
+def required_columns_and_metrics(
+    tests: list[Callable],
+) -> tuple[list[str] | None, list[str] | None]:
+    """
+    Find the columns and metrics required to evaluate tests, if any test
+    doesn't declare its requirements, None is returned for both, meaning
+    everything should be calculated.
+    """
+    columns: set[str] = set()
+    metrics: set[str] = set()
+    for test in tests:
+        try:
+            metrics |= test.required_metrics  # type: ignore[attr-defined]
+            columns |= _as_set(test.keywords.get("column"))  # type: ignore[attr-defined]
+            columns |= _as_set(test.keywords.get("other_column"))  # type: ignore[attr-defined]
+        except AttributeError:
+            return None, None
+    return sorted(columns), sorted(metrics)
+
+
+def required_plan(tests: list[Callable]) -> Plan | None:
+    """
+    Find the exact (column, metric) pairs required to evaluate tests, if any
+    test doesn't declare its requirements, None is returned, meaning everything
+    should be calculated.
+    """
+    pairs: set[tuple[str | None, str]] = set()
+    for test in tests:
+        try:
+            metrics: set[str] = test.required_metrics  # type: ignore[attr-defined]
+            columns = _as_set(test.keywords.get("column"))  # type: ignore[attr-defined]
+            columns |= _as_set(test.keywords.get("other_column"))  # type: ignore[attr-defined]
+        except AttributeError:
+            return None
+        for metric in metrics:
+            pairs |= (
+                {(None, metric)}
+                if metric == "length"
+                else {(c, metric) for c in columns}
+            )
+    return Plan(frozenset(pairs))
+
+
+def required_expressions(tests: list[Callable]) -> dict[str, tuple[Any, int]]:
+    """
+    Find the row check expressions required to evaluate tests, keyed so that
+    identical checks are only calculated once, sampling the most failing rows
+    any of them asks for.
+    """
+    expressions: dict[str, tuple[Any, int]] = {}
+    for test in tests:
+        for key, (expression, sample_size) in getattr(
+            test, "required_expressions", {}
+        ).items():
+            if key in expressions:
+                sample_size = max(sample_size, expressions[key][1])
+            expressions[key] = (expression, sample_size)
+    return expressions
+
+
+def _file_version(info: dict) -> str | None:
+    """
+    Internal function, return a string identifying the version of a file
+    from its fsspec info, or None if the filesystem gives nothing to go on.
+    """
+    for key in ("ETag", "etag", "md5Hash", "mtime", "LastModified", "updated"):
+        if info.get(key) is not None:
+            return f"{key}:{info[key]}:{info.get('size')}"
+    return None
+
+
+def compile_contract(
+    contract: str | list[dict] | dict | list[Callable] | Contract,
+    storage_options: dict | None = None,
+    cache: bool = True,
+) -> Contract:
+    """
+    Parse a contract once, for reuse across multiple dataframes.
+
+    Where contract is a path, and `cache` is True, parsed contracts are held in
+    an LRU cache keyed on the path and the file's ETag or modified time, so
+    repeated calls only need to look up file metadata, rather than reading and
+    parsing the file again.
+    """
+    if isinstance(contract, Contract):
+        return contract
+    if not isinstance(contract, str):
+        return Contract.from_tests(collect_tests(contract))
+    storage_options = storage_options or {}
+    version: str | None = None
+    if cache:
+        import fsspec
+
+        try:
+            fs, fs_path = fsspec.core.url_to_fs(contract, **storage_options)
+            version = _file_version(fs.info(fs_path))
+        except Exception:
+            version = None
+    if version is None:
+        return Contract.from_tests(read_config(contract, storage_options))
+    key = _cache_key(contract, version, storage_options)
+    cached = _cached_contract(key)
+    if cached is not None:
+        return cached
+    compiled = Contract.from_tests(read_config(contract, storage_options))
+    _cache_contract(key, compiled)
+    return compiled
+
+
+def _cache_key(path: str, version: str, storage_options: dict) -> tuple:
+    """Internal function, key for a contract in the cache of compiled contracts"""
+    return (path, version, repr(sorted(storage_options.items())))
+
+
+def _cached_contract(key: tuple) -> Contract | None:
+    """Internal function, get contract from cache, if present"""
+    if key in _contract_cache:
+        _contract_cache.move_to_end(key)
+        return _contract_cache[key]
+    return None
+
+
+def _cache_contract(key: tuple, compiled: Contract) -> None:
+    """Internal function, add contract to cache, evicting the oldest if full"""
+    _contract_cache[key] = compiled
+    if len(_contract_cache) > CONTRACT_CACHE_SIZE:
+        _contract_cache.popitem(last=False)
+
+
+def clear_contract_cache() -> None:
+    """Empty the cache of contracts compiled from paths"""
+    _contract_cache.clear()
@@ -1,99 +1,798 @@
+import math
+import operator
+import warnings
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, reduce
+from itertools import repeat
+from typing import Any, Callable, Iterable, Iterator
+
 import narwhals.stable.v1 as nw
+from narwhals.dependencies import (
+    get_dask,
+    get_numpy,
+    get_polars,
+    get_pyarrow,
+    is_dask_dataframe,
+    is_polars_dataframe,
+    is_polars_lazyframe,
+)
 from narwhals.stable.v1.typing import FrameT
 
+from wimsey import sketches
+from wimsey.instrumentation import record, span
+
+_DEFAULT_METRICS: list[str] = [
+    "mean",
+    "std",
+    "min",
+    "max",
+    "type",
+    "count",
+    "null",
+    "null_percentage",
+    "length",
+]
+_COLUMN_METRICS: list[str] = [
+    "mean",
+    "std",
+    "min",
+    "max",
+    "type",
+    "count",
+    "null_count",
+    "null_percentage",
+    "quantiles",
+    "distinct_count",
+]
+_SKETCH_METRICS: list[str] = ["quantiles", "distinct_count"]
+_SKETCH_CHUNK_SIZE: int = 100_000
+# Most row indexes drawn at once when describing bootstrap samples
+_BOOTSTRAP_BLOCK_SIZE: int = 1_000_000
+_INTEGER_TYPES: tuple = (
+    nw.Int8,
+    nw.Int16,
+    nw.Int32,
+    nw.Int64,
+    nw.UInt8,
+    nw.UInt16,
+    nw.UInt32,
+    nw.UInt64,
+)
+# Types whose values distinct count sketches can hash at once with numpy
+_HASHABLE: tuple = (*_INTEGER_TYPES, nw.Float32, nw.Float64)
+_GROUP_LENGTH: str = "__wimsey_group_length__"
+_FAILING: str = "__wimsey_failing__"
+
 
 @nw.narwhalify
 def describe(
     df: FrameT,
     columns: list[str] | None = None,
     metrics: list[str] | None = None,
+    column_batch_size: int | None = None,
+    workers: int | None = None,
+    sketch_error: float | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: "Plan | None" = None,
+    spans: list[span] | None = None,
 ) -> dict[str, float]:
     """
     Outputs a dictionary for use in testing, mimicking polars 'describe' method.
 
+    Lazy frames are described in a single query, selecting only the columns
+    required, and collected with polars' streaming engine where available, so
+    only the one row of metrics is ever materialised.
+
+    For very wide dataframes, `column_batch_size` will split columns into groups
+    described by separate, smaller queries. Polars and dask queries are run
+    together, other backends will be run across a thread pool of `workers`.
+
+    Approximate "quantiles" and "distinct_count" metrics are only calculated
+    when asked for, using sketches from `wimsey.sketches` with a relative error
+    of `sketch_error` (defaulting to `wimsey.sketches.DEFAULT_ERROR`), built in
+    a single pass over batches of rows, so memory is bounded by the sketches.
+
+    Row checks can be given as `expressions`, a dictionary of keys to a boolean
+    narwhals expression (true for passing rows) and a number of failing rows to
+    sample. Failing rows are counted in the same query as other metrics, given
+    as "failing_count_{key}", and only if any fail, a sample of them is
+    collected as "failing_rows_{key}".
+
+    If a `plan` is given (see `Plan`), only its exact (column, metric) pairs
+    are calculated, in place of every metric for every column.
+
+    If a list of `spans` is given (see `wimsey.instrumentation.record`), spans
+    are recorded for building queries ("plan"), collecting them ("collect"),
+    and where needed, sketching ("sketches") and sampling failing rows
+    ("failing_rows").
+
     Note this code is adapted from polars own descrip function.
     """
-    if not df.columns:
+    if plan is not None:
+        columns, metrics = plan.columns, plan.metrics
+    schema_only = (plan is not None or bool(metrics)) and set(metrics or []) <= {"type"}
+    if schema_only and not expressions:
+        return _describe_schema(df, columns)
+    if column_batch_size is not None:
+        description = _describe_in_batches(
+            df, columns, metrics, column_batch_size, workers, expressions, plan, spans
+        )
+    else:
+        with record("plan", spans):
+            query, finish = _describe_query(df, columns, metrics, expressions, plan)
+        with record("collect", spans):
+            description = {} if query is None else finish(_first_row(_collect(query)))
+    if description and set(metrics or []) & set(_SKETCH_METRICS):
+        with record("sketches", spans):
+            description |= _describe_required_sketches(
+                df, columns, metrics, plan, sketch_error
+            )
+    if description and expressions:
+        with record("failing_rows", spans):
+            description |= _failing_rows(df, expressions, description)
+    return description
+
+
+@nw.narwhalify
+def describe_schema(
+    df: FrameT,
+    columns: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the column names and types given by `describe`, using only the
+    dataframe's schema, so without running any query over the data. For lazy
+    frames, such as a polars scan of parquet files, only metadata is read.
+    """
+    return _describe_schema(df, columns)
+
+
+def _describe_schema(
+    df: nw.DataFrame | nw.LazyFrame,
+    columns: list[str] | None = None,
+) -> dict[str, Any]:
+    """Internal function, see `describe_schema`"""
+    schema = df.collect_schema()
+    if not schema:
         return {}
-    columns = columns or df.columns
-    columns_to_check = [i for i in columns if i in df.columns]
-    metrics = metrics or [
-        "mean",
-        "std",
-        "min",
-        "max",
-        "type",
-        "count",
-        "null",
-        "null_percentage",
-        "length",
+    columns_to_check = [i for i in (columns or list(schema)) if i in schema]
+    return {"columns": "_^&^_".join(schema)} | {
+        f"type_{c}": str(schema[c]) for c in columns_to_check
+    }
+
+
+@dataclass(frozen=True)
+class Plan:
+    """
+    The exact (column, metric) pairs `describe` should calculate, using a column
+    of None for dataframe level metrics, such as "length". Column names are
+    always given.
+
+    Plans can be inspected before being carried out, `aggregations` gives the
+    aggregations that will be calculated, which are shared between metrics where
+    possible, for instance, null percentages and null counts sharing the same
+    aggregation, and length being calculated once for all columns.
+    """
+
+    pairs: frozenset[tuple[str | None, str]]
+
+    @classmethod
+    def from_columns_and_metrics(cls, columns: list[str], metrics: list[str]) -> "Plan":
+        """
+        Build plan calculating every metric for every column, where "null" is
+        shorthand for counts, null counts and null percentages.
+        """
+        pairs: set[tuple[str | None, str]] = set()
+        for metric in metrics:
+            if metric == "length":
+                pairs.add((None, "length"))
+            elif metric in ("null", "null_count", "null_percentage"):
+                pairs |= {
+                    (c, i)
+                    for c in columns
+                    for i in ("count", "null_count", "null_percentage")
+                }
+            else:
+                pairs |= {(c, metric) for c in columns}
+        return cls(frozenset(pairs))
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns with at least one metric in plan"""
+        return sorted({c for c, _ in self.pairs if c is not None})
+
+    @property
+    def metrics(self) -> list[str]:
+        """Metrics calculated for at least one column (or dataframe) in plan"""
+        return sorted({m for _, m in self.pairs})
+
+    def aggregations(self, schema: dict[str, Any] | None = None) -> list[str]:
+        """
+        Names of aggregations calculated for plan, given a dataframe schema. If no
+        schema is given, all columns are assumed to be numeric.
+        """
+        return list(_plan_expressions(self, schema)[0])
+
+    def __len__(self) -> int:
+        return len(self.aggregations())
+
+
+def _plan_expressions(
+    plan: Plan,
+    schema: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], list[str]]:
+    """
+    Internal function, build the aggregations needed to carry out plan, along
+    with the metrics known without any aggregation (such as types), and the
+    names of every metric in the output. Sketch metrics aren't included, see
+    `_describe_sketches`.
+    """
+    all_columns = list(schema) if schema is not None else plan.columns
+    by_metric: dict[str, list[str]] = {}
+    for column in all_columns:
+        for metric in ("mean", "std", "min", "max", "type", "count", "null_count"):
+            if (column, metric) in plan.pairs:
+                by_metric.setdefault(metric, []).append(column)
+        if (column, "null_percentage") in plan.pairs:
+            by_metric.setdefault("null_percentage", []).append(column)
+    counted = set(by_metric.get("count", []))
+    null_counted = [
+        c
+        for c in all_columns
+        if c in by_metric.get("null_count", []) + by_metric.get("null_percentage", [])
     ]
+    length_required = (None, "length") in plan.pairs or bool(
+        by_metric.get("null_percentage") or counted.intersection(null_counted)
+    )
+
+    # Constants are only added once the single row of metrics is collected, as
+    # adding them as columns makes some backends (such as dask) broadcast them
+    # to the length of the whole dataframe, and pandas fragment its frame
+    aggregations: dict[str, Any] = {}
+    constants: dict[str, Any] = {"columns": "_^&^_".join(all_columns)}
+    names: list[str] = ["columns"]
+    for metric in ("mean", "std", "min", "max"):
+        for c in by_metric.get(metric, []):
+            if schema is None or schema[c].is_numeric():
+                aggregations[f"{metric}_{c}"] = getattr(nw.col(c), metric)()
+            else:
+                constants[f"{metric}_{c}"] = None
+            names.append(f"{metric}_{c}")
+    for c in by_metric.get("type", []):
+        constants[f"type_{c}"] = str(schema[c]) if schema else None
+        names.append(f"type_{c}")
+    for c in by_metric.get("count", []):
+        aggregations[f"count_{c}"] = nw.col(c).count()
+        names.append(f"count_{c}")
+    if length_required:
+        aggregations[_GROUP_LENGTH] = nw.len()
+
+    # Null counts are derived from counts and length where both are already
+    # being calculated (see `_finish_description`), rather than adding
+    # another aggregation
+    for c in null_counted:
+        if c not in counted:
+            aggregations[f"null_count_{c}"] = nw.col(c).null_count()
+    names += [f"null_count_{c}" for c in by_metric.get("null_count", [])]
+    names += [f"null_percentage_{c}" for c in by_metric.get("null_percentage", [])]
+    if (None, "length") in plan.pairs:
+        names.append("length")
+    return aggregations, constants, names
+
 
-    # Determine which columns should get std/mean/percentile statistics
-    stat_cols = {c for c, dt in df.schema.items() if dt.is_numeric()}
+def _finish_description(
+    row: dict[str, Any], constants: dict[str, Any], names: list[str]
+) -> dict[str, Any]:
+    """
+    Internal function, build a description from the collected row of
+    aggregations, adding constants and the metrics derived from aggregations,
+    see `_plan_expressions`.
+    """
+    values = row | constants
+    length = row.get(_GROUP_LENGTH)
+    description: dict[str, Any] = {}
+    for name in names:
+        if name in values:
+            description[name] = values[name]
+        elif name == "length":
+            description[name] = length
+        elif name.startswith("null_count_"):
+            description[name] = length - row[f"count_{name[11:]}"]
+        elif name.startswith("null_percentage_"):
+            column = name[16:]
+            null_count = row.get(f"null_count_{column}")
+            if null_count is None:
+                null_count = length - row[f"count_{column}"]
+            description[name] = null_count / length if length else math.nan
+    return description
+
+
+def _describe_query(
+    df: nw.DataFrame | nw.LazyFrame,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: Plan | None = None,
+) -> tuple[
+    nw.DataFrame | nw.LazyFrame | None, Callable[[dict[str, Any]], dict[str, Any]]
+]:
+    """
+    Internal function, build the single row dataframe of aggregations needed
+    by `describe`, without collecting it, along with a function to turn its
+    collected row into a description. The dataframe is None for dataframes
+    without any columns.
+    """
+    schema = df.collect_schema()
+    if not schema:
+        return None, dict
+    if plan is None:
+        columns_to_check = [i for i in (columns or list(schema)) if i in schema]
+        plan = Plan.from_columns_and_metrics(
+            columns_to_check, metrics or _DEFAULT_METRICS
+        )
+    else:
+        plan = Plan(frozenset(i for i in plan.pairs if i[0] is None or i[0] in schema))
+    aggregations, constants, names = _plan_expressions(plan, schema)
+    for key, (expression, _) in (expressions or {}).items():
+        aggregations[f"failing_count_{key}"] = (~expression).sum()
+        names.append(f"failing_count_{key}")
+    query = df.select(
+        *[v.alias(k) for k, v in aggregations.items()]
+        or [nw.len().alias(_GROUP_LENGTH)]
+    )
+    return query, partial(_finish_description, constants=constants, names=names)
+
+
+def _column_sketches(
+    df: nw.DataFrame | nw.LazyFrame,
+    columns: list[str] | None,
+    metrics: list[str],
+    sketch_error: float | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Internal function, build quantile and distinct count sketches of columns
+    as required by metrics, see `_sketch_columns`.
+    """
+    return _sketch_columns(
+        df, {i: columns for i in _SKETCH_METRICS if i in metrics}, sketch_error
+    )
 
-    required_exprs: list = [
-        nw.lit("_^&^_".join(df.columns)).alias("columns"),
+
+def _sketch_columns(
+    df: nw.DataFrame | nw.LazyFrame,
+    required: dict[str, list[str] | None],
+    sketch_error: float | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Internal function, build the sketches of each column required, given as a
+    dictionary of sketch metric to columns (or None for every column), in a
+    single pass over bounded batches of rows (see `_batches`). Quantiles are
+    only sketched for numeric columns, and are None otherwise.
+
+    Rather than adding every value in python, each batch is sorted by the
+    backend, and only the values a sketch would keep are added (see
+    `wimsey.sketches.KLLSketch.update_sorted`). Distinct count sketches are
+    only given each batch's unique values, hashed at once with numpy for
+    integers and floats.
+    """
+    error = sketch_error if sketch_error is not None else sketches.DEFAULT_ERROR
+    schema = df.collect_schema()
+    column_sketches: dict[str, dict[str, Any]] = {}
+    for metric, columns in required.items():
+        for column in [i for i in (columns or list(schema)) if i in schema]:
+            column_sketches.setdefault(column, {})[metric] = (
+                sketches.HyperLogLog(error=error)
+                if metric == "distinct_count"
+                else (
+                    sketches.KLLSketch(error=error)
+                    if schema[column].is_numeric()
+                    else None
+                )
+            )
+    sketched = [
+        c for c, v in column_sketches.items() if any(i is not None for i in v.values())
     ]
-    post_exprs: list = []
-    if "mean" in metrics:
-        required_exprs += [
-            (nw.col(c).mean() if c in stat_cols else nw.lit(None)).alias(f"mean_{c}")
-            for c in columns_to_check
-        ]
-    if "std" in metrics:
-        required_exprs += [
-            (nw.col(c).std() if c in stat_cols else nw.lit(None)).alias(f"std_{c}")
-            for c in columns_to_check
-        ]
-    if "min" in metrics:
-        required_exprs += [
-            (nw.col(c).min() if c in stat_cols else nw.lit(None)).alias(f"min_{c}")
-            for c in columns_to_check
+    for batch in _batches(df, sketched) if sketched else []:
+        for column in sketched:
+            quantiles = column_sketches[column].get("quantiles")
+            if quantiles is not None:
+                # Comparing a value with itself is false for NaN and null for
+                # nulls, so keeps values a quantile sketch would add
+                values_to_add = batch.filter(nw.col(column) == nw.col(column))[column]
+                level = quantiles.compaction_level(len(values_to_add))
+                step = 2**level
+                quantiles.update_sorted(
+                    values_to_add.sort().gather_every(step, offset=step // 2).to_list(),
+                    len(values_to_add),
+                    level,
+                )
+            distinct_count = column_sketches[column].get("distinct_count")
+            if distinct_count is not None:
+                unique = batch[column].drop_nulls().unique()
+                if get_numpy() is not None and isinstance(unique.dtype, _HASHABLE):
+                    distinct_count.update_numeric(unique.to_numpy())
+                else:
+                    distinct_count.update(unique.to_list())
+    return column_sketches
+
+
+def _batches(
+    df: nw.DataFrame | nw.LazyFrame, columns: list[str]
+) -> Iterator[nw.DataFrame]:
+    """
+    Internal function, iterate over eager frames of columns, of at most
+    `_SKETCH_CHUNK_SIZE` rows each. Dask frames are computed a partition at a
+    time, other lazy frames are collected once, selecting only columns.
+    """
+    selected = df.select(columns)
+    native = nw.to_native(selected)
+    frames: Iterable[nw.DataFrame] = (
+        (nw.from_native(i.compute(), eager_only=True) for i in native.partitions)
+        if is_dask_dataframe(native)
+        else [_collect(selected)]
+    )
+    for frame in frames:
+        for start in range(0, len(frame), _SKETCH_CHUNK_SIZE):
+            yield frame[start : start + _SKETCH_CHUNK_SIZE]
+
+
+def _describe_required_sketches(
+    df: nw.DataFrame | nw.LazyFrame,
+    columns: list[str] | None,
+    metrics: list[str] | None,
+    plan: Plan | None = None,
+    sketch_error: float | None = None,
+) -> dict[str, Any]:
+    """
+    Internal function, describe the approximate metrics required by columns
+    and metrics, or by plan if given, see `_describe_sketches`.
+    """
+    if plan is None:
+        return _describe_sketches(
+            df,
+            {i: columns for i in _SKETCH_METRICS if i in (metrics or [])},
+            sketch_error,
+        )
+    return _describe_sketches(
+        df,
+        {
+            metric: [c for c, m in plan.pairs if m == metric and c is not None]
+            for metric in _SKETCH_METRICS
+            if metric in plan.metrics
+        },
+        sketch_error,
+    )
+
+
+def _describe_sketches(
+    df: nw.DataFrame | nw.LazyFrame,
+    required: dict[str, list[str] | None],
+    sketch_error: float | None = None,
+) -> dict[str, Any]:
+    """
+    Internal function, describe approximate metrics required, as a dictionary
+    of sketch metric to columns (see `_sketch_columns`), giving the quantile
+    sketch itself (so that any quantile can be tested), and the estimate of
+    the distinct count sketch.
+    """
+    description: dict[str, Any] = {}
+    for column, column_sketches in _sketch_columns(df, required, sketch_error).items():
+        for metric, sketch in column_sketches.items():
+            description[f"{metric}_{column}"] = (
+                sketch.estimate() if metric == "distinct_count" else sketch
+            )
+    return description
+
+
+def _describe_in_batches(
+    df: nw.DataFrame | nw.LazyFrame,
+    columns: list[str] | None,
+    metrics: list[str] | None,
+    column_batch_size: int,
+    workers: int | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: Plan | None = None,
+    spans: list[span] | None = None,
+) -> dict[str, Any]:
+    """
+    Internal function, describe dataframe with one query per batch of
+    `column_batch_size` columns, merging the results. Row check expressions
+    and dataframe level metrics are calculated alongside the first batch.
+    """
+    schema = df.collect_schema()
+    columns = plan.columns if plan is not None else columns or list(schema)
+    columns_to_check = [i for i in columns if i in schema]
+    if len(columns_to_check) <= column_batch_size:
+        with record("plan", spans):
+            query, finish = _describe_query(df, columns, metrics, expressions, plan)
+        with record("collect", spans):
+            return {} if query is None else finish(_first_row(_collect(query)))
+    if plan is None:
+        plan = Plan.from_columns_and_metrics(
+            columns_to_check, metrics or _DEFAULT_METRICS
+        )
+    batches = [
+        columns_to_check[i : i + column_batch_size]
+        for i in range(0, len(columns_to_check), column_batch_size)
+    ]
+    batch_plans = [
+        Plan(
+            frozenset(
+                j for j in plan.pairs if j[0] in batch or (j[0] is None and i == 0)
+            )
+        )
+        for i, batch in enumerate(batches)
+    ]
+    batch_expressions = [expressions] + [None] * (len(batches) - 1)
+    native = nw.to_native(df)
+    frames: list
+    # Every batch has columns, so every query is given (rather than None)
+    if is_polars_dataframe(native) or is_polars_lazyframe(native):
+        with record("plan", spans, batches=len(batches)):
+            queries = [
+                _describe_query(df.lazy(), expressions=i, plan=j)
+                for i, j in zip(batch_expressions, batch_plans)
+            ]
+        with record("collect", spans, batches=len(batches)):
+            frames = get_polars().collect_all(
+                [nw.to_native(i) for i, _ in queries]  # type: ignore[arg-type]
+            )
+    elif is_dask_dataframe(native):
+        with record("plan", spans, batches=len(batches)):
+            queries = [
+                _describe_query(df, expressions=i, plan=j)
+                for i, j in zip(batch_expressions, batch_plans)
+            ]
+        with record("collect", spans, batches=len(batches)):
+            frames = list(
+                get_dask().compute(
+                    *[nw.to_native(i) for i, _ in queries]  # type: ignore[arg-type]
+                )
+            )
+    else:
+        with record("plan", spans, batches=len(batches)):
+            with ThreadPoolExecutor(max_workers=workers or 1) as executor:
+                queries = list(
+                    executor.map(
+                        lambda i, j: _describe_query(df, expressions=i, plan=j),
+                        batch_expressions,
+                        batch_plans,
+                    )
+                )
+        with record("collect", spans, batches=len(batches)):
+            frames = [_collect(i) for i, _ in queries]  # type: ignore[arg-type]
+    description: dict[str, Any] = {}
+    for frame, (_, finish) in zip(frames, queries):
+        description |= finish(_first_row(nw.from_native(frame, eager_only=True)))
+    return description
+
+
+def _failing_rows(
+    df: nw.DataFrame | nw.LazyFrame,
+    expressions: dict[str, tuple[Any, int]],
+    description: dict[str, Any],
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Internal function, collect up to the requested number of failing rows for
+    each row check, only querying the data for checks with failures.
+    """
+    samples: dict[str, list[dict[str, Any]]] = {}
+    for key, (expression, sample_size) in expressions.items():
+        if sample_size and description.get(f"failing_count_{key}"):
+            failing = _collect(df.filter(~expression).head(sample_size))
+            samples[f"failing_rows_{key}"] = failing.rows(named=True)
+    return samples
+
+
+def describe_columnar(
+    df: FrameT,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    column_batch_size: int | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same metrics as `describe`, but with per-column metrics held in
+    a dictionary per metric, keyed by column name, such as:
+
+    `{"columns": ["a", "b"], "length": 3, "mean": {"a": 1.3, "b": None}}`
+    """
+    return _columnar(describe(df, columns, metrics, column_batch_size, workers))
+
+
+def _columnar(description: dict[str, Any]) -> dict[str, Any]:
+    """Internal function, convert output of `describe` into a columnar form"""
+    if not description:
+        return {}
+    all_columns: list[str] = description["columns"].split("_^&^_")
+    columnar: dict[str, Any] = {"columns": all_columns}
+    if "length" in description:
+        columnar["length"] = description["length"]
+    for metric in _COLUMN_METRICS:
+        values = {
+            c: description[f"{metric}_{c}"]
+            for c in all_columns
+            if f"{metric}_{c}" in description
+        }
+        if values:
+            columnar[metric] = values
+    return columnar
+
+
+def _first_row(df: nw.DataFrame) -> dict[str, Any]:
+    """Internal function, return the first row of dataframe as a dictionary"""
+    return {k: v[0] for k, v in df.to_dict(as_series=False).items()}
+
+
+def _collect(df: nw.DataFrame | nw.LazyFrame) -> nw.DataFrame:
+    """
+    Internal function, collect a lazy frame if given one, using polars' streaming
+    engine where possible, so that memory is bounded by the query result rather
+    than the size of the frame.
+    """
+    if not isinstance(df, nw.LazyFrame):
+        return df
+    native = nw.to_native(df)
+    if is_polars_lazyframe(native):
+        return nw.from_native(native.collect(streaming=True), eager_only=True)
+    return df.collect()
+
+
+def _group_filter(by: list[str], key: tuple) -> Any:
+    """Internal function, expression selecting rows of the group with key"""
+    return reduce(
+        operator.and_,
+        [
+            nw.col(c).is_null() if value is None else nw.col(c) == value
+            for c, value in zip(by, key)
+        ],
+    )
+
+
+def _describe_groups(
+    df: nw.DataFrame | nw.LazyFrame,
+    by: list[str],
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    sketch_error: float | None = None,
+) -> list[tuple[tuple, dict[str, Any]]]:
+    """
+    Internal function, equivalent to calling `describe` on each group of `by`,
+    but carried out as a single group_by aggregation. Returns a list of group
+    keys and their descriptions, sorted by key.
+
+    Row check `expressions` are counted within the same aggregation, but
+    sketch metrics, and samples of failing rows, need a query per group (and
+    for failing rows, only groups with failures).
+    """
+    schema = df.collect_schema()
+    value_columns = [i for i in schema if i not in by]
+    columns_to_check = [i for i in (columns or value_columns) if i in value_columns]
+    by_to_check = [i for i in by if columns is None or i in columns]
+    metrics = metrics or _DEFAULT_METRICS
+    stat_cols = [c for c in columns_to_check if schema[c].is_numeric()]
+    counts_required = any(
+        i in metrics
+        for i in ("count", "null", "null_count", "null_percentage", "length")
+    )
+    nulls_required = any(
+        i in metrics for i in ("null", "null_count", "null_percentage", "length")
+    )
+
+    # null_count isn't a supported group_by aggregation across all backends, so
+    # it's derived from the group length and non-null count instead
+    aggregations: list = [nw.len().alias(_GROUP_LENGTH)]
+    for metric in ("mean", "std", "min", "max"):
+        if metric in metrics:
+            aggregations += [
+                getattr(nw.col(c), metric)().alias(f"{metric}_{c}") for c in stat_cols
+            ]
+    if counts_required:
+        aggregations += [
+            nw.col(c).count().alias(f"count_{c}") for c in columns_to_check
         ]
-    if "max" in metrics:
-        required_exprs += [
-            (nw.col(c).max() if c in stat_cols else nw.lit(None)).alias(f"max_{c}")
-            for c in columns_to_check
+    aggregated = df
+    if expressions:
+        # Only plain column aggregations are supported within group_by, so
+        # whether each row fails is calculated as a column first
+        aggregated = df.with_columns(
+            [
+                (~expression).cast(nw.Int64).alias(f"{_FAILING}{key}")
+                for key, (expression, _) in expressions.items()
+            ]
+        )
+        aggregations += [
+            nw.col(f"{_FAILING}{key}").sum().alias(f"failing_count_{key}")
+            for key in expressions
         ]
+    grouped = _collect(aggregated.group_by(*by).agg(*aggregations).sort(*by))
+    rows: dict[str, list] = grouped.to_dict(as_series=False)
+
+    column_string = "_^&^_".join(value_columns)
+    descriptions: list[tuple[tuple, dict[str, Any]]] = []
+    for i, length in enumerate(rows[_GROUP_LENGTH]):
+        description: dict[str, Any] = {"columns": column_string}
+        for metric in ("mean", "std", "min", "max"):
+            if metric in metrics:
+                description |= {
+                    f"{metric}_{c}": (
+                        rows[f"{metric}_{c}"][i] if c in stat_cols else None
+                    )
+                    for c in columns_to_check
+                }
+        if "type" in metrics:
+            description |= {f"type_{c}": str(schema[c]) for c in columns_to_check}
+        if counts_required:
+            description |= {
+                f"count_{c}": rows[f"count_{c}"][i] for c in columns_to_check
+            }
+        if nulls_required:
+            description |= {
+                f"null_count_{c}": length - rows[f"count_{c}"][i]
+                for c in columns_to_check
+            }
+            description |= {
+                f"null_percentage_{c}": (length - rows[f"count_{c}"][i]) / length
+                for c in columns_to_check
+            }
+            description["length"] = length
+        description |= {
+            f"failing_count_{key}": rows[f"failing_count_{key}"][i]
+            for key in expressions or {}
+        }
+        # Pandas gives null keys as NaN, normalised to None as other backends
+        key = tuple(None if _is_missing(rows[c][i]) else rows[c][i] for c in by)
+        for column, value in zip(by, key):
+            if column in by_to_check:
+                description |= _describe_constant(
+                    column, value, length, schema[column], metrics
+                )
+        descriptions.append((key, description))
+    sketch_metrics = [i for i in _SKETCH_METRICS if i in metrics]
+    if sketch_metrics or expressions:
+        for key, description in descriptions:
+            group = df.filter(_group_filter(by, key))
+            if sketch_metrics:
+                description |= _describe_sketches(
+                    group,
+                    {i: columns_to_check + by_to_check for i in sketch_metrics},
+                    sketch_error,
+                )
+            if expressions:
+                description |= _failing_rows(group, expressions, description)
+    return descriptions
+
+
+def _describe_constant(
+    column: str, value: Any, length: int, dtype: Any, metrics: list[str]
+) -> dict[str, Any]:
+    """
+    Internal function, describe a column of narwhals dtype holding only value
+    (or only nulls if None) for length rows, as `describe` would, such as a
+    group column within its group.
+    """
+    numeric = value is not None and dtype.is_numeric()
+    count = 0 if value is None else length
+    description: dict[str, Any] = {}
+    for metric in ("min", "max"):
+        if metric in metrics:
+            description[f"{metric}_{column}"] = value if numeric else None
+    if "mean" in metrics:
+        description[f"mean_{column}"] = float(value) if numeric else None
+    if "std" in metrics:
+        description[f"std_{column}"] = 0.0 if numeric and count > 1 else None
     if "type" in metrics:
-        required_exprs += [
-            nw.lit(str(df.schema[c])).alias(f"type_{c}") for c in columns_to_check
-        ]
-    if (
-        "count" in metrics
-        or "null" in metrics
-        or "length" in metrics
-        or "null_percentage" in metrics
+        description[f"type_{column}"] = str(dtype)
+    if any(
+        i in metrics
+        for i in ("count", "null", "null_count", "null_percentage", "length")
     ):
-        required_exprs += [nw.col(*columns_to_check).count().name.prefix("count_")]
-    if "null" in metrics or "length" in metrics or "null_percentage" in metrics:
-        required_exprs += [
-            nw.col(*columns_to_check).null_count().name.prefix("null_count_")
-        ]
-        post_exprs += [
-            (
-                nw.col(f"null_count_{c}")
-                / (nw.col(f"count_{c}") + nw.col(f"null_count_{c}"))
-            ).alias(f"null_percentage_{c}")
-            for c in columns_to_check
-        ]
-        post_exprs += [
-            (
-                nw.col(f"count_{columns_to_check[0]}")
-                + nw.col(f"null_count_{columns_to_check[0]}")
-            ).alias("length")
-        ]
-    df_metrics = df.select(
-        *required_exprs,
-    ).with_columns(*post_exprs)
-    try:
-        return {k: v[0] for k, v in df_metrics.to_dict(as_series=False).items()}  # type: ignore[union-attr]
-    except AttributeError:
-        return {
-            k: v[0]
-            for k, v in df_metrics.collect().to_dict(as_series=False).items()  # type: ignore[union-attr]
-        }
+        description[f"count_{column}"] = count
+    if any(i in metrics for i in ("null", "null_count", "null_percentage", "length")):
+        description[f"null_count_{column}"] = length - count
+        description[f"null_percentage_{column}"] = (length - count) / length
+    return description
 
 
 def profile_from_sampling(
@@ -101,14 +800,484 @@ def profile_from_sampling(
     samples: int = 100,
     n: int | None = None,
     fraction: int | None = None,
+    batched: bool = True,
 ) -> list[dict[str, float]]:
+    """
+    Take `samples` samples with replacement from dataframe, and return a list
+    of their descriptions.
+
+    By default, for eager dataframes where numpy is installed, samples are
+    never built as dataframes, instead, the values of each column are gathered
+    by row index and described with numpy, see `_bootstrap_describes`. Setting
+    `batched` to False will sample and describe each sample individually.
+    """
+    if n is None and fraction is None:
+        msg = "Samples should be given a size, as either n or fraction"
+        raise ValueError(msg)
+    frame = nw.from_native(df, eager_only=True, strict=False)
+    if batched and isinstance(frame, nw.DataFrame) and frame.columns and len(frame):
+        if n is None and fraction is not None:
+            n = int(len(frame) * fraction)
+        if n is not None and n > 0:
+            descriptions = _bootstrap_describes(frame, samples, n)
+            if descriptions is not None:
+                return descriptions
     return [
         describe(df.sample(n=n, fraction=fraction, with_replacement=True))
         for _ in range(samples)
     ]
 
 
+def _bootstrap_describes(
+    frame: nw.DataFrame, samples: int, n: int
+) -> list[dict[str, Any]] | None:
+    """
+    Internal function, give the same descriptions as `describe` of `samples`
+    samples of n rows, drawn with replacement from frame, without building the
+    samples as dataframes. Row indexes are drawn for blocks of samples at once
+    (of up to `_BOOTSTRAP_BLOCK_SIZE` rows in total), and the values of numeric
+    columns (and validity of columns with nulls) at them reduced with numpy,
+    so memory is bounded by the block. Returns None where numpy isn't installed.
+
+    Where fewer rows are drawn in total than frame holds, they're gathered by
+    the backend, a block at a time, otherwise columns are converted to numpy
+    once and gathered from, so time is bounded by whichever is fewer.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    schema = frame.schema
+    plan = Plan.from_columns_and_metrics(list(schema), _DEFAULT_METRICS)
+    aggregations, constants, names = _plan_expressions(plan, schema)
+    numeric = [c for c in schema if schema[c].is_numeric()]
+    nulls = [c for c in schema if frame[c].null_count()]
+    projected = None
+    if samples * n < len(frame):
+        # Only null flags are needed of other columns, which are far cheaper
+        # to gather than, say, strings
+        projected = frame.select(
+            *[
+                nw.col(c) if c in numeric else nw.col(c).is_null()
+                for c in schema
+                if c in numeric or c in nulls
+            ]
+        )
+    else:
+        values = {c: frame[c].to_numpy() for c in numeric}
+        valid = {c: ~frame[c].is_null().to_numpy() for c in nulls}
+    rng = np.random.default_rng()
+    block = max(_BOOTSTRAP_BLOCK_SIZE // n, 1)
+    rows: list[dict[str, Any]] = []
+    for start in range(0, samples, block):
+        size = min(block, samples - start)
+        indexes = rng.integers(0, len(frame), (size, n))
+        if projected is None:
+            block_values = {c: values[c][indexes] for c in numeric}
+            block_valid = {c: valid[c][indexes] for c in nulls}
+        else:
+            gathered = projected[indexes.ravel()]  # type: ignore[call-overload]
+            block_values = {c: gathered[c].to_numpy().reshape(size, n) for c in numeric}
+            block_valid = {
+                c: ~(gathered[c].is_null() if c in block_values else gathered[c])
+                .to_numpy()
+                .reshape(size, n)
+                for c in nulls
+            }
+        stats: dict[str, list] = {_GROUP_LENGTH: [n] * size}
+        for c in schema:
+            is_valid = block_valid.get(c)
+            count = np.full(size, n) if is_valid is None else is_valid.sum(1)
+            stats[f"count_{c}"] = count.tolist()
+            stats[f"null_count_{c}"] = (n - count).tolist()
+            if c in block_values:
+                stats |= _bootstrap_stats(
+                    np,
+                    c,
+                    block_values[c],
+                    is_valid,
+                    count,
+                    isinstance(schema[c], _INTEGER_TYPES),
+                )
+        rows += [dict(zip(stats, i)) for i in zip(*stats.values())]
+    return [
+        _finish_description({k: row[k] for k in aggregations}, constants, names)
+        for row in rows
+    ]
+
+
+def _bootstrap_stats(
+    np: Any,
+    column: str,
+    gathered: Any,
+    is_valid: Any,
+    count: Any,
+    integer: bool,
+) -> dict[str, list]:
+    """
+    Internal function, calculate the mean, standard deviation, minimum and
+    maximum of each row of a 2D array of samples of a column's values, where
+    `is_valid` marks non-null values (or is None if every value is). Metrics
+    with too few values to calculate are None, as with `describe`.
+    """
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        # Nulls gathered from a float array are nan, ignored by nanmin/nanmax
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if is_valid is None:
+            minimum = gathered.min(axis=1)
+            maximum = gathered.max(axis=1)
+        else:
+            minimum = np.nanmin(gathered, axis=1)
+            maximum = np.nanmax(gathered, axis=1)
+            gathered = np.where(is_valid, gathered, 0)
+        mean = gathered.sum(axis=1, dtype=np.float64) / count
+        deviations = gathered - mean[:, None]
+        if is_valid is not None:
+            deviations = np.where(is_valid, deviations, 0)
+        std = np.sqrt(np.einsum("ij,ij->i", deviations, deviations) / (count - 1))
+    any_values = (count > 0).tolist()
+    # Integer columns with nulls are gathered as floats
+    as_value: Callable = int if integer else lambda i: i
+    return {
+        f"mean_{column}": _where(mean.tolist(), any_values),
+        f"std_{column}": _where(std.tolist(), (count > 1).tolist()),
+        f"min_{column}": _where(minimum.tolist(), any_values, as_value),
+        f"max_{column}": _where(maximum.tolist(), any_values, as_value),
+    }
+
+
+def _where(values: list, defined: list[bool], convert: Callable = lambda i: i) -> list:
+    """Internal function, convert values, replacing any not defined with None"""
+    return [convert(i) if j else None for i, j in zip(values, defined)]
+
+
 def profile_from_samples(
-    samples: list[FrameT],
+    samples: Iterable[FrameT],
 ) -> list[dict[str, float]]:
     return [describe(i) for i in samples]
+
+
+def _as_frame(chunk: Any) -> Any:
+    """
+    Internal function, convert a chunk of data into something narwhals accepts,
+    currently only needed for pyarrow record batches.
+    """
+    pa = get_pyarrow()
+    if pa is not None and isinstance(chunk, pa.RecordBatch):
+        return pa.Table.from_batches([chunk])
+    return chunk
+
+
+def _is_missing(value: Any) -> bool:
+    """Internal function, checks for both None and NaN values"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _to_python(value: Any) -> Any:
+    """Internal function, convert numpy-like scalars into python values"""
+    if _is_missing(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def partial_describe(
+    df: FrameT,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    sketch_error: float | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs a mergeable description of dataframe, holding counts, extremes, mean
+    and sum of squared differences from the mean per column, as well as any
+    quantile or distinct count sketches required, and failing row counts and
+    samples for any row check expressions. Partial descriptions of separate
+    chunks of data can be combined with `merge_partial_describes`, and turned
+    into the same output as `describe` with `finalise_partial_describe`.
+    """
+    metrics = metrics or _DEFAULT_METRICS
+    required = set(metrics) - set(_SKETCH_METRICS) | {"type", "count", "null", "length"}
+    if "std" in required:
+        required.add("mean")
+    description = describe(
+        _as_frame(df),
+        columns=columns,
+        metrics=list(required),
+        expressions=expressions,
+    )
+    if not description:
+        return {
+            "columns": [],
+            "metrics": list(metrics),
+            "length": 0,
+            "stats": {},
+            "failing": {},
+        }
+    all_columns = description["columns"].split("_^&^_")
+    stats: dict[str, dict[str, Any]] = {}
+    for column in [i for i in all_columns if f"type_{i}" in description]:
+        count = int(description[f"count_{column}"])
+        column_stats: dict[str, Any] = {
+            "type": description[f"type_{column}"],
+            "count": count,
+            "null_count": int(description[f"null_count_{column}"]),
+        }
+        for metric in ("min", "max", "mean"):
+            if metric in required:
+                column_stats[metric] = _to_python(description[f"{metric}_{column}"])
+        if "std" in required:
+            std = _to_python(description[f"std_{column}"])
+            column_stats["m2"] = (
+                std**2 * (count - 1) if std is not None and count > 1 else 0.0
+            )
+        stats[column] = column_stats
+    if set(metrics) & set(_SKETCH_METRICS):
+        column_sketches = _column_sketches(
+            nw.from_native(_as_frame(df)), list(stats), metrics, sketch_error
+        )
+        for column, column_sketch in column_sketches.items():
+            stats[column] |= {
+                k: v.to_dict() if v is not None else None
+                for k, v in column_sketch.items()
+            }
+    failing: dict[str, dict[str, Any]] = {
+        key: {
+            "count": int(description[f"failing_count_{key}"]),
+            "rows": description.get(f"failing_rows_{key}", []),
+            "sample_size": sample_size,
+        }
+        for key, (_, sample_size) in (expressions or {}).items()
+    }
+    return {
+        "columns": all_columns,
+        "metrics": list(metrics),
+        "length": int(description["length"]),
+        "stats": stats,
+        "failing": failing,
+    }
+
+
+def _merge_column_stats(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+    """
+    Internal function, merge statistics for a single column, using Chan's
+    parallel algorithm for the mean and sum of squared differences.
+    """
+    count = left["count"] + right["count"]
+    merged: dict[str, Any] = {
+        "type": left["type"],
+        "count": count,
+        "null_count": left["null_count"] + right["null_count"],
+    }
+    if "min" in left:
+        values = [i for i in (left["min"], right["min"]) if i is not None]
+        merged["min"] = min(values) if values else None
+    if "max" in left:
+        values = [i for i in (left["max"], right["max"]) if i is not None]
+        merged["max"] = max(values) if values else None
+    if "mean" in left:
+        if left["count"] == 0 or left["mean"] is None:
+            merged["mean"] = right["mean"]
+            merged["m2"] = right.get("m2")
+        elif right["count"] == 0 or right["mean"] is None:
+            merged["mean"] = left["mean"]
+            merged["m2"] = left.get("m2")
+        else:
+            delta = right["mean"] - left["mean"]
+            merged["mean"] = left["mean"] + delta * right["count"] / count
+            if "m2" in left:
+                merged["m2"] = (
+                    left["m2"]
+                    + right["m2"]
+                    + delta**2 * left["count"] * right["count"] / count
+                )
+        if "m2" not in left:
+            merged.pop("m2", None)
+    # Sketches are only kept if both sides have them, as a sketch of part of
+    # the data would be misleading
+    if "quantiles" in left and "quantiles" in right:
+        sketch_dicts = [i for i in (left["quantiles"], right["quantiles"]) if i]
+        merged["quantiles"] = (
+            reduce(
+                sketches.KLLSketch.merge,
+                map(sketches.KLLSketch.from_dict, sketch_dicts),
+            ).to_dict()
+            if sketch_dicts
+            else None
+        )
+    if "distinct_count" in left and "distinct_count" in right:
+        merged["distinct_count"] = (
+            sketches.HyperLogLog.from_dict(left["distinct_count"])
+            .merge(sketches.HyperLogLog.from_dict(right["distinct_count"]))
+            .to_dict()
+        )
+    return merged
+
+
+def merge_partial_describes(
+    left: dict[str, Any],
+    right: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Combine two partial descriptions (see `partial_describe`) into a single
+    partial description of both sets of data.
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    for column in left["stats"].keys() | right["stats"].keys():
+        if column not in right["stats"]:
+            stats[column] = left["stats"][column]
+        elif column not in left["stats"]:
+            stats[column] = right["stats"][column]
+        else:
+            stats[column] = _merge_column_stats(
+                left["stats"][column], right["stats"][column]
+            )
+    failing: dict[str, dict[str, Any]] = {}
+    left_failing, right_failing = left.get("failing", {}), right.get("failing", {})
+    for key in left_failing.keys() & right_failing.keys():
+        sample_size = right_failing[key]["sample_size"]
+        failing[key] = {
+            "count": left_failing[key]["count"] + right_failing[key]["count"],
+            "rows": (left_failing[key]["rows"] + right_failing[key]["rows"])[
+                :sample_size
+            ],
+            "sample_size": sample_size,
+        }
+    return {
+        "columns": left["columns"] or right["columns"],
+        "metrics": left["metrics"],
+        "length": left["length"] + right["length"],
+        "stats": {
+            i: stats[i] for i in left["columns"] + right["columns"] if i in stats
+        },
+        "failing": failing,
+    }
+
+
+def finalise_partial_describe(
+    partial: dict[str, Any],
+    metrics: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Convert a partial description (see `partial_describe`) into the same form
+    of dictionary given by `describe`.
+    """
+    if not partial["columns"]:
+        return {}
+    metrics = metrics or partial["metrics"]
+    stats: dict[str, dict[str, Any]] = partial["stats"]
+    description: dict[str, Any] = {"columns": "_^&^_".join(partial["columns"])}
+    for metric in ("mean", "std", "min", "max"):
+        if metric not in metrics:
+            continue
+        for column, column_stats in stats.items():
+            if metric == "std":
+                count = column_stats["count"]
+                value = (
+                    math.sqrt(column_stats["m2"] / (count - 1))
+                    if column_stats.get("mean") is not None and count > 1
+                    else None
+                )
+            else:
+                value = column_stats.get(metric)
+            description[f"{metric}_{column}"] = value
+    if "quantiles" in metrics:
+        description |= {
+            f"quantiles_{c}": (
+                sketches.KLLSketch.from_dict(i["quantiles"])
+                if i.get("quantiles")
+                else None
+            )
+            for c, i in stats.items()
+        }
+    if "distinct_count" in metrics:
+        description |= {
+            f"distinct_count_{c}": (
+                sketches.HyperLogLog.from_dict(i["distinct_count"]).estimate()
+                if i.get("distinct_count")
+                else None
+            )
+            for c, i in stats.items()
+        }
+    if "type" in metrics:
+        description |= {f"type_{c}": i["type"] for c, i in stats.items()}
+    if any(
+        i in metrics
+        for i in ("count", "null", "null_count", "null_percentage", "length")
+    ):
+        description |= {f"count_{c}": i["count"] for c, i in stats.items()}
+    if any(i in metrics for i in ("null", "null_count", "null_percentage", "length")):
+        length = partial["length"]
+        description |= {f"null_count_{c}": i["null_count"] for c, i in stats.items()}
+        description |= {
+            f"null_percentage_{c}": i["null_count"] / length if length else None
+            for c, i in stats.items()
+        }
+        description["length"] = length
+    for key, failing in partial.get("failing", {}).items():
+        description[f"failing_count_{key}"] = failing["count"]
+        if failing["sample_size"]:
+            description[f"failing_rows_{key}"] = failing["rows"]
+    return description
+
+
+def parallel_partial_describe(
+    df: FrameT,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    workers: int = 4,
+    processes: bool = False,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same partial description as `partial_describe`, but for eager
+    dataframes, splits the dataframe into row partitions, which are described
+    concurrently and then merged. By default a thread pool is used, set
+    `processes` to True to use a process pool instead (note row check
+    expressions can't be sent to other processes).
+    """
+    frame = nw.from_native(_as_frame(df), eager_only=True, strict=False)
+    if not isinstance(frame, nw.DataFrame) or workers < 2 or len(frame) < workers:
+        return partial_describe(
+            df, columns=columns, metrics=metrics, expressions=expressions
+        )
+    size = math.ceil(len(frame) / workers)
+    partitions = [nw.to_native(frame[i : i + size]) for i in range(0, len(frame), size)]
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers=workers) as executor:
+        partials = list(
+            executor.map(
+                partial_describe,
+                partitions,
+                repeat(columns),
+                repeat(metrics),
+                repeat(None),
+                repeat(expressions),
+            )
+        )
+    return reduce(merge_partial_describes, partials)
+
+
+def parallel_describe(
+    df: FrameT,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    workers: int = 4,
+    processes: bool = False,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same dictionary as `describe`, but for eager dataframes, splits
+    the dataframe into row partitions, which are described concurrently and
+    then merged. By default a thread pool is used, set `processes` to True to
+    use a process pool instead.
+
+    Lazy dataframes, or dataframes with fewer rows than workers, are described
+    as normal.
+    """
+    frame = nw.from_native(df, eager_only=True, strict=False)
+    if not isinstance(frame, nw.DataFrame) or workers < 2 or len(frame) < workers:
+        return describe(df, columns=columns, metrics=metrics, expressions=expressions)
+    partial = parallel_partial_describe(
+        df, columns, metrics, workers, processes, expressions
+    )
+    return finalise_partial_describe(partial, metrics)
@@ -1,59 +1,460 @@
-from typing import Callable, Any
+from time import perf_counter
+from typing import Callable, Any, Iterable, Iterator
 from dataclasses import dataclass
 
-from narwhals.typing import FrameT
+import narwhals.stable.v1 as nw
+from narwhals.dependencies import get_polars, is_polars_dataframe, is_polars_lazyframe
+from narwhals.stable.v1.typing import FrameT
 
-from wimsey.dataframe import describe
-from wimsey.tests import result
-from wimsey.config import read_config, collect_tests
+from wimsey.dataframe import (
+    Plan,
+    _DEFAULT_METRICS,
+    _SKETCH_METRICS,
+    _describe_groups,
+    _describe_query,
+    _describe_required_sketches,
+    _failing_rows,
+    _first_row,
+    describe,
+    describe_schema,
+    finalise_partial_describe,
+    merge_partial_describes,
+    parallel_describe,
+    parallel_partial_describe,
+    partial_describe,
+)
+from wimsey.tests import result, result_table
+from wimsey.config import Contract, compile_contract
+from wimsey import arrow, parquet, sampling, sql, vectorise
+from wimsey.instrumentation import record, span
+from wimsey.state import read_state, write_state
 
 
 @dataclass
 class final_result:
+    """
+    Results of testing a dataframe. If testing was instrumented, `spans` holds
+    the timings of each phase of testing, and `counts` the number of tests,
+    columns and expressions processed.
+    """
+
     success: bool
-    results: list[result]
+    results: result_table
+    spans: list[span] | None = None
+    counts: dict[str, int] | None = None
+
+
+@dataclass
+class batch_result:
+    """
+    Results of testing multiple dataframes. Timings are given in seconds, per
+    dataframe timings exclude `shared_time`, spent collecting all polars
+    dataframes concurrently.
+    """
+
+    success: bool
+    results: dict[str, final_result]
+    timings: dict[str, float]
+    shared_time: float
+    total_time: float
 
 
 class DataValidationException(Exception):
     ...
 
 
-def _as_set(val: Any) -> set:
+def run_all_tests(
+    df: FrameT,
+    tests: list[Callable[[Any], result]] | Contract,
+    workers: int | None = None,
+    column_batch_size: int | None = None,
+    fail_fast: bool = False,
+    storage_options: dict | None = None,
+    spans: list[span] | None = None,
+) -> final_result:
+    contract = tests if isinstance(tests, Contract) else Contract.from_tests(tests)
+    df = _open_source(df, storage_options)
+    if fail_fast:
+        return _run_tests_fail_fast(
+            df, contract, workers, column_batch_size, storage_options, spans
+        )
+    return _describe_and_evaluate(
+        df, contract, workers, column_batch_size, storage_options, spans
+    )
+
+
+def _open_source(df: Any, storage_options: dict | None = None) -> Any:
     """
-    Internal function, if val is none, return empty set,
-    otherwise return set of just val
+    Internal function, open paths to parquet files as a pyarrow dataset, so
+    they're only listed once, and read arrow streams (which can only be read
+    once) into a pyarrow table.
     """
-    return {val} if val is not None else set()
+    if isinstance(df, str):
+        if not parquet.is_parquet_source(df, storage_options):
+            msg = (
+                f"It looks like {df} isn't a parquet file or folder, paths "
+                "given in place of a dataframe should be to parquet data"
+            )
+            raise ValueError(msg)
+        return parquet._dataset(df, storage_options)
+    if arrow.is_arrow_source(df):
+        return arrow.to_table(df)
+    return df
 
 
-def run_all_tests(df: FrameT, tests: list[Callable[[Any], result]]) -> final_result:
-    columns: set[str] | None = set()
-    metrics: set[str] | None = set()
-    for test in tests:
-        try:
-            metrics |= test.required_metrics
-            columns |= _as_set(test.keywords.get("column"))
-            columns |= _as_set(test.keywords.get("other_column"))
-        except AttributeError:
-            columns = None  # fall back to calculating everything
-            metrics = None
-            break
-    description: dict[str, Any] = describe(
+def _backend_name(df: Any) -> str:
+    """Internal function, name of the library a dataframe (or source) is from"""
+    if parquet.is_parquet_source(df):
+        return "parquet"
+    if sql.is_sql_source(df):
+        return "sql"
+    return type(df).__module__.split(".")[0]
+
+
+def _counts(contract: Contract) -> dict[str, int]:
+    """
+    Internal function, count the tests, columns and expressions (aggregations
+    and row checks) needed for a contract, where known.
+    """
+    counts = {"tests": len(contract.tests)}
+    if contract.columns is not None:
+        counts["columns"] = len(contract.columns)
+    if contract.plan is not None:
+        counts["expressions"] = len(contract.plan) + len(contract.expressions or {})
+    return counts
+
+
+def _describe_and_evaluate(
+    df: FrameT,
+    contract: Contract,
+    workers: int | None = None,
+    column_batch_size: int | None = None,
+    storage_options: dict | None = None,
+    spans: list[span] | None = None,
+    **span_attributes: Any,
+) -> final_result:
+    """
+    Internal function, describe dataframe and evaluate contract's tests against
+    the description, recording spans for each if a list of spans is given.
+    """
+    with record(
+        "describe",
+        spans,
+        backend=_backend_name(df),
+        **_counts(contract),
+        **span_attributes,
+    ):
+        description = _describe(
+            df,
+            contract.columns,
+            contract.metrics,
+            workers,
+            column_batch_size,
+            storage_options,
+            contract.expressions,
+            contract.plan,
+            spans,
+        )
+    with record("evaluate", spans, tests=len(contract.tests), **span_attributes):
+        return _evaluate_tests(contract, description)
+
+
+def _describe(
+    df: FrameT,
+    columns: list[str] | None,
+    metrics: list[str] | None,
+    workers: int | None = None,
+    column_batch_size: int | None = None,
+    storage_options: dict | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: Plan | None = None,
+    spans: list[span] | None = None,
+) -> dict[str, Any]:
+    """
+    Internal function, describe dataframe, using only its schema if no metrics
+    beyond column types are needed, or across row partitions if workers are
+    given. Parquet paths and datasets are described from their metadata (or
+    schema alone), SQL tables with a single query, and arrow tables with
+    `pyarrow.compute`.
+    Otherwise, only the exact metrics in `plan` are calculated, if given, and
+    spans recorded for each phase of describing, see `describe`.
+    """
+    if sql.is_sql_source(df):
+        return sql.describe(
+            df, columns=columns, metrics=metrics, expressions=expressions, plan=plan
+        )
+    schema_only = metrics is not None and set(metrics) <= {"type"} and not expressions
+    if parquet.is_parquet_source(df):
+        if schema_only:
+            return parquet.describe_schema(
+                df, columns=columns, storage_options=storage_options
+            )
+        return parquet.describe(
+            df,
+            columns=columns,
+            metrics=metrics,
+            storage_options=storage_options,
+            expressions=expressions,
+        )
+    if schema_only:
+        return describe_schema(df, columns=columns)
+    if arrow.is_arrow_source(df) and not workers and column_batch_size is None:
+        return arrow.describe(
+            df, columns=columns, metrics=metrics, expressions=expressions, plan=plan
+        )
+    if workers:
+        return parallel_describe(
+            df,
+            columns=columns,
+            metrics=metrics,
+            workers=workers,
+            expressions=expressions,
+        )
+    return describe(
         df,
-        columns=list(columns),
-        metrics=list(metrics),
+        columns=columns,
+        metrics=metrics,
+        column_batch_size=column_batch_size,
+        expressions=expressions,
+        plan=plan,
+        spans=spans,
     )
-    results: list[result] = []
-    for i_test in tests:
-        results.append(i_test(description))
-    return final_result(
-        success=all(i.success for i in results),
-        results=results,
+
+
+def _run_tests_fail_fast(
+    df: FrameT,
+    contract: Contract,
+    workers: int | None = None,
+    column_batch_size: int | None = None,
+    storage_options: dict | None = None,
+    spans: list[span] | None = None,
+) -> final_result:
+    """
+    Internal function, evaluate tests in stages ordered by the cost of their
+    metrics (see `Contract.stages`), stopping after the first stage with a
+    failure, so later metrics are never calculated.
+    """
+    results = result_table()
+    for i, stage in enumerate(contract.stages()):
+        stage_result = _describe_and_evaluate(
+            df, stage, workers, column_batch_size, storage_options, spans, stage=i
+        )
+        results += stage_result.results
+        if not stage_result.success:
+            break
+    return final_result(success=results.success, results=results)
+
+
+def _evaluate_tests(
+    tests: list[Callable[[Any], result]] | Contract, description: dict[str, Any]
+) -> final_result:
+    """
+    Internal function, evaluate tests against a given description, all at once
+    for range-style tests of a compiled contract.
+    """
+    if isinstance(tests, Contract) and tests.range_checks is not None:
+        results = vectorise.evaluate(tests.tests, tests.range_checks, description)
+    else:
+        test_list = tests.tests if isinstance(tests, Contract) else tests
+        results = result_table.from_results(i(description) for i in test_list)
+    return final_result(success=results.success, results=results)
+
+
+def _test_sampled(
+    df: FrameT,
+    contract: Contract,
+    sample: int | float,
+    confidence: float = 0.95,
+    escalate: bool = True,
+    workers: int | None = None,
+    column_batch_size: int | None = None,
+    fail_fast: bool = False,
+    storage_options: dict | None = None,
+    spans: list[span] | None = None,
+    seed: int | None = None,
+) -> final_result:
+    """
+    Internal function, evaluate tests that can be against a sample of the
+    dataframe, and all others (along with the row count) against the full
+    dataframe, see `wimsey.sampling`.
+    """
+    full, sampled = sampling.split_contract(contract)
+    if not sampled:
+        return run_all_tests(
+            df,
+            contract,
+            workers=workers,
+            column_batch_size=column_batch_size,
+            fail_fast=fail_fast,
+            storage_options=storage_options,
+            spans=spans,
+        )
+    with record("describe", spans, backend=_backend_name(df), **_counts(full)):
+        description = _describe(
+            df,
+            full.columns,
+            full.metrics,
+            workers,
+            column_batch_size,
+            storage_options,
+            full.expressions,
+            full.plan,
+        )
+    with record("evaluate", spans, tests=len(full.tests)):
+        full_result = _evaluate_tests(full, description)
+    if fail_fast and not full_result.success:
+        return full_result
+    full_results = iter(full_result.results)
+    with record("sample", spans, tests=len(sampled)):
+        sampled_results = iter(
+            sampling.test_sample(
+                df,
+                sampled,
+                description["length"],
+                sample,
+                confidence,
+                escalate,
+                seed,
+            )
+        )
+    results = result_table.from_results(
+        next(sampled_results) if sampling.is_sampled(i) else next(full_results)
+        for i in contract.tests
+    )
+    return final_result(success=results.success, results=results)
+
+
+def _test_groups(
+    df: FrameT,
+    contract: Contract,
+    by: list[str],
+    spans: list[span] | None = None,
+) -> final_result:
+    """
+    Internal function, describe every group of `by` in a single aggregation,
+    and evaluate tests against each group's description.
+    """
+    frame = nw.from_native(df)
+    schema = frame.collect_schema()
+    with record(
+        "describe", spans, backend=_backend_name(df), by=len(by), **_counts(contract)
+    ) as attributes:
+        groups = _describe_groups(
+            frame, by, contract.columns, contract.metrics, contract.expressions
+        )
+        attributes["groups"] = len(groups)
+    # Group columns are held constant within groups, so aren't described, but
+    # should still be seen by column and type tests
+    shared = {"columns": "_^&^_".join(schema.names())} | {
+        f"type_{c}": str(schema[c]) for c in by
+    }
+    tables: list[dict[str, list]] = []
+    with record("evaluate", spans, tests=len(contract.tests) * len(groups)):
+        for key, description in groups:
+            columns = _evaluate_tests(contract, description | shared).results.columns
+            tables.append(columns | {"group": [key] * len(columns["name"])})
+    results = result_table(
+        {k: [i for table in tables for i in table[k]] for k in tables[0]}
+        if tables
+        else None
     )
+    return final_result(success=results.success, results=results)
+
+
+def _test_with_state(
+    df: FrameT,
+    contract: Contract,
+    state: str,
+    storage_options: dict | None = None,
+    workers: int | None = None,
+    spans: list[span] | None = None,
+) -> final_result:
+    """
+    Internal function, describe only the given dataframe, merging it into the
+    persisted state of previously tested data, and evaluate tests against the
+    combination. State is only updated if tests pass.
+    """
+    # All cheap metrics are kept in state, so that contracts can change over
+    # time, but sketches are only kept if needed
+    metrics = _DEFAULT_METRICS + [
+        i for i in contract.metrics or [] if i in _SKETCH_METRICS
+    ]
+    with record("describe", spans, backend=_backend_name(df), **_counts(contract)):
+        partial = (
+            parallel_partial_describe(
+                df, metrics=metrics, workers=workers, expressions=contract.expressions
+            )
+            if workers
+            else partial_describe(df, metrics=metrics, expressions=contract.expressions)
+        )
+    with record("read_state", spans):
+        previous = read_state(state, storage_options=storage_options)
+    if previous is not None:
+        _check_state_sketches(previous, partial, state)
+        partial = merge_partial_describes(previous, partial)
+    with record("evaluate", spans, tests=len(contract.tests)):
+        results = _evaluate_tests(
+            contract, finalise_partial_describe(partial, contract.metrics)
+        )
+    if results.success:
+        with record("write_state", spans):
+            write_state(state, partial, storage_options=storage_options)
+    return results
+
+
+def _check_state_sketches(
+    previous: dict[str, Any], partial: dict[str, Any], state: str
+) -> None:
+    """
+    Internal function, raise if partial sketches a column that previous state
+    holds without a sketch, as data already tested can't be sketched, and a
+    sketch of only the latest data would be misleading.
+    """
+    missing = [
+        f"{metric} of {column}"
+        for column, column_stats in partial["stats"].items()
+        for metric in _SKETCH_METRICS
+        if metric in column_stats
+        and metric not in previous["stats"].get(column, {metric: None})
+    ]
+    if missing:
+        msg = (
+            f"The state file at {state} has no sketches ({', '.join(missing)}) "
+            "of previously tested data, as it was saved before tests needing "
+            "them were added to the contract. Removing it will reset the state, "
+            "but require the full dataset to be tested again."
+        )
+        raise ValueError(msg)
+
+
+def _raise_on_failure(results: final_result) -> None:
+    """Internal function, raise a DataValidationException for failed results"""
+    if not results.success:
+        failures: list[str] = [
+            f"{i.name}{'' if i.group is None else f' of group {i.group}'} "
+            f"(unexpected: {i.unexpected}"
+            f"{', inconclusive' if i.inconclusive else ''})"
+            for i in results.results.failures()
+        ]
+        newline = "\n - "
+        msg = f"At least one test failed:\n - {newline.join(failures)}"
+        raise DataValidationException(msg)
 
 
 def test(
-    df: FrameT, contract: str | list[dict] | dict, storage_options: dict | None = None
+    df: FrameT,
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+    workers: int | None = None,
+    state: str | None = None,
+    column_batch_size: int | None = None,
+    fail_fast: bool = False,
+    instrument: bool = False,
+    sample: int | float | None = None,
+    confidence: float = 0.95,
+    escalate: bool = True,
+    group_by: str | list[str] | None = None,
+    seed: int | None = None,
 ) -> final_result:
     """
     Carry out tests on dataframe and return results. This will *not* raise
@@ -63,17 +464,127 @@ def test(
 
     If you want to halt processing in the event of a data contract failure,
     see `validate` function.
+
+    Contracts given as paths are cached once parsed, if you are testing many
+    dataframes against the same contract, see `compile_contract` to parse it
+    upfront.
+
+    For large eager dataframes, `workers` can be given to split the dataframe
+    into row partitions described concurrently in a thread pool.
+
+    For append-only datasets, `state` can be given as a path to a json file
+    holding metrics of previously tested data. Only `df` (the newly appended
+    data) will be described, and tests are carried out against the combination
+    of it and the previous state. If tests pass, the state file is updated.
+
+    For very wide dataframes, `column_batch_size` will split the columns being
+    tested into groups, described by separate smaller queries.
+
+    If `fail_fast` is True, tests will be carried out in order of cost, those
+    needing only the schema (such as columns and types) first, then row count,
+    then everything else, stopping as soon as a group of tests fails. Results
+    will only be given for tests that have been carried out.
+
+    As well as dataframes, `df` can be a path to a parquet file or folder (or a
+    pyarrow dataset), in which case metrics will be read from parquet metadata
+    wherever possible, using `storage_options` for remote files. It can also be
+    a `wimsey.sql.Table`, in which case metrics are calculated by the database.
+
+    If `instrument` is True, the wall time, cpu time and peak (python) memory
+    of each phase of testing is recorded, and given as `spans` on the result,
+    along with `counts` of tests, columns and expressions processed. Spans are
+    also passed to any hook set with `wimsey.instrumentation.set_span_hook`.
+
+    For very large dataframes, `sample` can be given as a number of rows (or a
+    fraction of rows, as a float) to evaluate `mean_should`, `std_should` and
+    `null_percentage_should` tests against a random sample, see
+    `wimsey.sampling`. These results carry a `confidence_interval` at the given
+    `confidence`, passing if it's entirely within bounds, failing if it's
+    entirely outside, and otherwise being marked `inconclusive`. If `escalate`
+    is True, inconclusive tests are retried against larger samples, up to the
+    full dataframe. Other tests are evaluated against the full dataframe. Give
+    a `seed` to draw the same sample every time.
+
+    If `group_by` is given as a column (or list of columns), every test is
+    evaluated against each group of the dataframe, described together in a
+    single group_by aggregation. Results are given for every test and group,
+    with the group's key held in their `group` field.
     """
-    tests = (
-        read_config(path=contract, storage_options=storage_options)
-        if isinstance(contract, str)
-        else collect_tests(contract)
-    )
-    return run_all_tests(df, tests)
+    df = _open_source(df, storage_options)
+    if sample is not None and state is not None:
+        msg = "Testing a sample can't be combined with testing against state"
+        raise ValueError(msg)
+    if group_by is not None and (
+        state is not None
+        or sample is not None
+        or parquet.is_parquet_source(df)
+        or sql.is_sql_source(df)
+    ):
+        msg = (
+            "Testing groups needs a dataframe, and can't be combined with "
+            "testing against state or a sample"
+        )
+        raise ValueError(msg)
+    if state is not None and sql.is_sql_source(df):
+        msg = "Testing against state needs a dataframe, rather than a SQL table"
+        raise ValueError(msg)
+    spans: list[span] | None = [] if instrument else None
+    with record("compile_contract", spans):
+        compiled = compile_contract(contract, storage_options)
+    if state is not None:
+        results = _test_with_state(df, compiled, state, storage_options, workers, spans)
+    elif group_by is not None:
+        results = _test_groups(
+            df, compiled, [group_by] if isinstance(group_by, str) else group_by, spans
+        )
+    elif (
+        sample is not None
+        and not parquet.is_parquet_source(df)
+        and not sql.is_sql_source(df)
+    ):
+        results = _test_sampled(
+            df,
+            compiled,
+            sample,
+            confidence,
+            escalate,
+            workers,
+            column_batch_size,
+            fail_fast,
+            storage_options,
+            spans,
+            seed,
+        )
+    else:
+        results = run_all_tests(
+            df,
+            compiled,
+            workers=workers,
+            column_batch_size=column_batch_size,
+            fail_fast=fail_fast,
+            storage_options=storage_options,
+            spans=spans,
+        )
+    if instrument:
+        results.spans = spans
+        results.counts = _counts(compiled)
+    return results
 
 
 def validate(
-    df: FrameT, contract: str | list[dict] | dict, storage_options: dict | None = None
+    df: FrameT,
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+    workers: int | None = None,
+    state: str | None = None,
+    column_batch_size: int | None = None,
+    fail_fast: bool = False,
+    instrument: bool = False,
+    sample: int | float | None = None,
+    confidence: float = 0.95,
+    escalate: bool = True,
+    group_by: str | list[str] | None = None,
+    seed: int | None = None,
 ) -> FrameT:
     """
     Carry out tests on dataframe, returning original dataframe if tests are
@@ -83,14 +594,178 @@ def validate(
         df=df,
         contract=contract,
         storage_options=storage_options,
+        workers=workers,
+        state=state,
+        column_batch_size=column_batch_size,
+        fail_fast=fail_fast,
+        instrument=instrument,
+        sample=sample,
+        confidence=confidence,
+        escalate=escalate,
+        group_by=group_by,
+        seed=seed,
     )
-    if not results.success:
-        failures: list[str] = [
-            f"{i.name} (unexpected: {i.unexpected})"
-            for i in results.results
-            if not i.success
-        ]
-        newline = "\n - "
-        msg = f"At least one test failed:\n - {newline.join(failures)}"
-        raise DataValidationException(msg)
+    _raise_on_failure(results)
     return df
+
+
+def _stream_partial_describes(
+    chunks: Iterable[FrameT], contract: Contract
+) -> Iterator[dict[str, Any]]:
+    """
+    Internal function, yield partial descriptions of all data seen so far after
+    each chunk.
+    """
+    merged: dict[str, Any] | None = None
+    for chunk in chunks:
+        partial = partial_describe(
+            chunk,
+            columns=contract.columns,
+            metrics=contract.metrics,
+            expressions=contract.expressions,
+        )
+        merged = partial if merged is None else merge_partial_describes(merged, partial)
+        yield merged
+
+
+def iter_test_stream(
+    chunks: Iterable[FrameT],
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+) -> Iterator[final_result]:
+    """
+    Carry out tests on a stream of dataframes, such as pyarrow record batches,
+    yielding results for all data seen so far after each chunk.
+
+    Only a small mergeable summary of the data is held between chunks, so memory
+    use doesn't grow with the total size of the stream.
+    """
+    compiled = compile_contract(contract, storage_options)
+    for partial in _stream_partial_describes(chunks, compiled):
+        yield _evaluate_tests(
+            compiled, finalise_partial_describe(partial, compiled.metrics)
+        )
+
+
+def test_stream(
+    chunks: Iterable[FrameT],
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+) -> final_result:
+    """
+    Carry out tests on a stream of dataframes, such as pyarrow record batches,
+    as if they were one single dataframe. Tests are evaluated once all chunks
+    have been consumed, see `iter_test_stream` to evaluate after every chunk.
+
+    Only a small mergeable summary of the data is held between chunks, so memory
+    use doesn't grow with the total size of the stream.
+    """
+    compiled = compile_contract(contract, storage_options)
+    partial: dict[str, Any] | None = None
+    for partial in _stream_partial_describes(chunks, compiled):
+        pass
+    if partial is None:
+        msg = "Unable to test stream, no chunks were given"
+        raise ValueError(msg)
+    return _evaluate_tests(
+        compiled, finalise_partial_describe(partial, compiled.metrics)
+    )
+
+
+def validate_stream(
+    chunks: Iterable[FrameT],
+    contract: str | list[dict] | dict | Contract,
+    storage_options: dict | None = None,
+) -> None:
+    """
+    Carry out tests on a stream of dataframes, as if they were one single
+    dataframe, raising a DataValidationException in case of failure.
+    """
+    results = test_stream(
+        chunks=chunks,
+        contract=contract,
+        storage_options=storage_options,
+    )
+    _raise_on_failure(results)
+
+
+def test_many(
+    frames: dict[str, tuple[FrameT, str | list[dict] | dict | Contract]],
+    storage_options: dict | None = None,
+) -> batch_result:
+    """
+    Carry out tests on multiple dataframes, given as a dictionary of names to
+    dataframe and contract pairs, returning a 'batch_result' object, holding
+    the 'final_result' for each name.
+
+    Polars dataframes are described together, so that their queries share
+    polars' thread pool and run concurrently, rather than one after another.
+    """
+    start = perf_counter()
+    contracts: dict[str, Contract] = {}
+    descriptions: dict[str, dict[str, Any]] = {}
+    polars_queries: dict[str, Any] = {}
+    finishes: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {}
+    timings: dict[str, float] = {}
+    for name, (df, contract) in frames.items():
+        table_start = perf_counter()
+        contracts[name] = compile_contract(contract, storage_options)
+        if is_polars_dataframe(df) or is_polars_lazyframe(df):
+            query, finishes[name] = _describe_query(
+                nw.from_native(df.lazy()),
+                columns=contracts[name].columns,
+                metrics=contracts[name].metrics,
+                expressions=contracts[name].expressions,
+                plan=contracts[name].plan,
+            )
+            if query is None:
+                descriptions[name] = {}
+            else:
+                polars_queries[name] = nw.to_native(query)
+        elif arrow.is_arrow_source(df):
+            descriptions[name] = arrow.describe(
+                df,
+                columns=contracts[name].columns,
+                metrics=contracts[name].metrics,
+                expressions=contracts[name].expressions,
+                plan=contracts[name].plan,
+            )
+        else:
+            descriptions[name] = describe(
+                df,
+                columns=contracts[name].columns,
+                metrics=contracts[name].metrics,
+                expressions=contracts[name].expressions,
+                plan=contracts[name].plan,
+            )
+        timings[name] = perf_counter() - table_start
+    shared_start = perf_counter()
+    if polars_queries:
+        collected = get_polars().collect_all(list(polars_queries.values()))
+        for name, df_metrics in zip(polars_queries, collected):
+            descriptions[name] = finishes[name](
+                _first_row(nw.from_native(df_metrics, eager_only=True))
+            ) | _describe_required_sketches(
+                nw.from_native(frames[name][0]),
+                contracts[name].columns,
+                contracts[name].metrics,
+                contracts[name].plan,
+            )
+            expressions = contracts[name].expressions
+            if expressions:
+                descriptions[name] |= _failing_rows(
+                    nw.from_native(frames[name][0]), expressions, descriptions[name]
+                )
+    shared_time = perf_counter() - shared_start
+    results: dict[str, final_result] = {}
+    for name, contract in contracts.items():
+        table_start = perf_counter()
+        results[name] = _evaluate_tests(contract, descriptions[name])
+        timings[name] += perf_counter() - table_start
+    return batch_result(
+        success=all(i.success for i in results.values()),
+        results=results,
+        timings=timings,
+        shared_time=shared_time,
+        total_time=perf_counter() - start,
+    )
@@ -0,0 +1,140 @@
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+
+@dataclass
+class span:
+    """
+    Timing of a single phase of testing, such as compiling a contract or
+    describing a dataframe. Start and end times are given in nanoseconds since
+    the epoch, wall and cpu times in seconds, and peak memory in bytes allocated
+    by python (so not including memory allocated by, say, polars).
+
+    Peak memory is process-wide, so includes allocations by other threads, and
+    where spans overlap (such as concurrent `wimsey.aio` tests), it's the peak
+    since the earliest overlapping span began. It's None if tracemalloc was
+    already started outside of wimsey, so as not to interfere with it.
+    """
+
+    name: str
+    start_time: int
+    end_time: int
+    wall_time: float
+    cpu_time: float
+    peak_memory: int | None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+def _no_op(recorded: span) -> None: ...
+
+
+_span_hook: Callable[[span], None] = _no_op
+# Spans being recorded while wimsey has tracemalloc started, so that it's only
+# stopped once the last of them ends
+_tracing_lock = threading.Lock()
+_tracing_spans: int = 0
+
+
+def _start_tracing() -> bool:
+    """
+    Internal function, start tracing memory (unless started outside of wimsey),
+    giving whether this span's memory is traced.
+    """
+    global _tracing_spans
+    with _tracing_lock:
+        if _tracing_spans == 0:
+            if tracemalloc.is_tracing():
+                return False
+            tracemalloc.start()
+        _tracing_spans += 1
+        return True
+
+
+def _stop_tracing() -> int:
+    """Internal function, give peak memory traced, stopping after the last span"""
+    global _tracing_spans
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1]
+        _tracing_spans -= 1
+        if _tracing_spans == 0:
+            tracemalloc.stop()
+        return peak
+
+
+def set_span_hook(hook: Callable[[span], None] | None) -> None:
+    """
+    Set a callback to be given every span recorded while instrumenting tests,
+    for instance to export spans to a tracing system. None will remove the
+    current hook.
+    """
+    global _span_hook
+    _span_hook = hook or _no_op
+
+
+@contextmanager
+def record(
+    name: str, spans: list[span] | None, **attributes: Any
+) -> Iterator[dict[str, Any]]:
+    """
+    Record a span for the duration of the context, appending it to spans and
+    passing it to the span hook. Yields the span's attributes, so more can be
+    added within the context. If spans is None, nothing is recorded.
+
+    Memory is traced from the start of the first of any overlapping spans, and
+    stopped at the end of the last of them, see `span`.
+    """
+    if spans is None:
+        yield attributes
+        return
+    traced = _start_tracing()
+    start_time = time.time_ns()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield attributes
+    finally:
+        recorded = span(
+            name=name,
+            start_time=start_time,
+            end_time=time.time_ns(),
+            wall_time=time.perf_counter() - wall_start,
+            cpu_time=time.process_time() - cpu_start,
+            peak_memory=_stop_tracing() if traced else None,
+            attributes=attributes,
+        )
+        spans.append(recorded)
+        _span_hook(recorded)
+
+
+def opentelemetry_hook(tracer: Any) -> Callable[[span], None]:
+    """
+    Build a span hook exporting spans to an OpenTelemetry tracer, for use with
+    `set_span_hook`, such as:
+
+    `set_span_hook(opentelemetry_hook(trace.get_tracer("wimsey")))`
+    """
+
+    def hook(recorded: span) -> None:
+        exported = tracer.start_span(
+            f"wimsey.{recorded.name}", start_time=recorded.start_time
+        )
+        exported.set_attributes(
+            {"wimsey.cpu_time": recorded.cpu_time}
+            | (
+                {"wimsey.peak_memory": recorded.peak_memory}
+                if recorded.peak_memory is not None
+                else {}
+            )
+            | {
+                f"wimsey.{k}": v
+                for k, v in recorded.attributes.items()
+                if isinstance(v, (bool, int, float, str))
+            }
+        )
+        exported.end(end_time=recorded.end_time)
+
+    return hook
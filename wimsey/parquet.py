@@ -0,0 +1,216 @@
+import sys
+from typing import Any
+
+import narwhals.stable.v1 as nw
+
+from wimsey.dataframe import (
+    _DEFAULT_METRICS,
+    _describe_schema,
+    _merge_column_stats,
+    finalise_partial_describe,
+    merge_partial_describes,
+    partial_describe,
+)
+
+_PARQUET_SUFFIXES: tuple[str, ...] = (".parquet", ".parq", ".pq")
+
+
+def is_parquet_source(source: Any, storage_options: dict | None = None) -> bool:
+    """
+    Check whether source is to be described using parquet metadata rather than
+    as a dataframe, that's either a pyarrow dataset, or a path to a parquet file,
+    a glob of parquet files (such as "data/*.parquet") or a folder containing
+    parquet files.
+    """
+    if isinstance(source, str):
+        if source.rstrip("/").lower().endswith(_PARQUET_SUFFIXES):
+            return True
+        return _is_parquet_folder(source, storage_options)
+    dataset = sys.modules.get("pyarrow.dataset")
+    return dataset is not None and isinstance(source, dataset.Dataset)
+
+
+def _is_parquet_folder(path: str, storage_options: dict | None = None) -> bool:
+    """Internal function, check whether path is a folder holding parquet files"""
+    import fsspec  # type: ignore[import-untyped]
+
+    fs, fs_path = fsspec.core.url_to_fs(path, **(storage_options or {}))
+    return fs.isdir(fs_path) and any(
+        i.lower().endswith(_PARQUET_SUFFIXES) for i in fs.find(fs_path)
+    )
+
+
+def _dataset(source: Any, storage_options: dict | None = None) -> Any:
+    """Internal function, open source as a pyarrow dataset"""
+    try:
+        import pyarrow.dataset as ds  # type: ignore[import-untyped]
+    except ImportError as exception:
+        msg = (
+            "It looks like you're trying to test a parquet file or dataset. "
+            "This is supported but requires an additional install of pyarrow "
+            "(`pip install pyarrow`)"
+        )
+        raise ImportError(msg) from exception
+    if isinstance(source, ds.Dataset):
+        return source
+    import fsspec
+
+    fs, path = fsspec.core.url_to_fs(source, **(storage_options or {}))
+    if fsspec.core.has_magic(path):
+        return ds.dataset(sorted(fs.glob(path)), filesystem=fs, format="parquet")
+    return ds.dataset(path, filesystem=fs, format="parquet")
+
+
+def describe_schema(
+    source: Any,
+    columns: list[str] | None = None,
+    storage_options: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the column names and types given by `describe` for a parquet path
+    or pyarrow dataset, from the dataset's schema alone, so without reading
+    any row group, or the footers of every file.
+    """
+    dataset = _dataset(source, storage_options)
+    return _describe_schema(
+        nw.from_native(dataset.schema.empty_table(), eager_only=True), columns
+    )
+
+
+def describe(
+    source: Any,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    storage_options: dict | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same dictionary as `wimsey.dataframe.describe` for a parquet
+    path or pyarrow dataset, using row group statistics from parquet footers
+    wherever possible.
+
+    Row count, null counts and numeric minimums and maximums are read from
+    statistics. Row groups without statistics for a column are scanned, as are
+    columns where mean, standard deviation, quantiles or distinct counts are
+    required, reading only the columns needed. Row check `expressions` (see
+    `wimsey.dataframe.describe`) are evaluated over a scan of all columns
+    being tested.
+    """
+    dataset = _dataset(source, storage_options)
+    schema = nw.from_native(dataset.schema.empty_table(), eager_only=True).schema
+    all_columns = list(schema)
+    if not all_columns:
+        return {}
+    columns_to_check = [i for i in (columns or all_columns) if i in schema]
+    # An empty list of metrics (say, of a contract of only columns_should
+    # tests) needs nothing beyond the schema, rather than every metric
+    metrics = _DEFAULT_METRICS if metrics is None else metrics
+    stat_cols = [c for c in columns_to_check if schema[c].is_numeric()]
+    extremes = [i for i in ("min", "max") if i in metrics]
+
+    length = 0
+    stats: dict[str, dict[str, Any]] = {
+        c: {"type": str(schema[c]), "count": 0, "null_count": 0}
+        | {i: None for i in (extremes if c in stat_cols else [])}
+        for c in columns_to_check
+    }
+    fragments = dataset.get_fragments() if set(metrics) - {"type"} else []
+    for fragment in fragments:
+        metadata = fragment.metadata
+        for row_group_id in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_id)
+            length += row_group.num_rows
+            chunks = {
+                row_group.column(i).path_in_schema: row_group.column(i)
+                for i in range(row_group.num_columns)
+            }
+            for column in columns_to_check:
+                chunk_stats = _row_group_stats(
+                    chunks.get(column),
+                    row_group.num_rows,
+                    extremes if column in stat_cols else [],
+                )
+                if chunk_stats is None:
+                    chunk_stats = partial_describe(
+                        fragment.subset(row_group_ids=[row_group_id]).to_table(
+                            columns=[column]
+                        ),
+                        metrics=extremes or ["count"],
+                    )["stats"][column]
+                    chunk_stats = {k: chunk_stats[k] for k in stats[column]}
+                stats[column] = _merge_column_stats(stats[column], chunk_stats)
+
+    scan_metrics = [
+        i for i in ("mean", "std", "quantiles", "distinct_count") if i in metrics
+    ]
+    scan_columns = (
+        columns_to_check
+        if "distinct_count" in metrics or expressions
+        else stat_cols if scan_metrics else []
+    )
+    scanned: dict[str, Any] | None = None
+    if scan_columns:
+        for batch in dataset.to_batches(columns=scan_columns):
+            partial = partial_describe(
+                batch, metrics=scan_metrics or ["count"], expressions=expressions
+            )
+            scanned = (
+                partial
+                if scanned is None
+                else merge_partial_describes(scanned, partial)
+            )
+        for column in scan_columns:
+            column_stats = scanned["stats"][column] if scanned else {}
+            if column in stat_cols and ("mean" in metrics or "std" in metrics):
+                stats[column]["mean"] = column_stats.get("mean")
+                stats[column]["m2"] = column_stats.get("m2", 0.0)
+            for metric in ("quantiles", "distinct_count"):
+                if metric in metrics:
+                    stats[column][metric] = column_stats.get(metric)
+
+    return finalise_partial_describe(
+        {
+            "columns": all_columns,
+            "metrics": metrics,
+            "length": length,
+            "stats": stats,
+            "failing": (
+                scanned["failing"]
+                if scanned
+                else {
+                    key: {"count": 0, "rows": [], "sample_size": sample_size}
+                    for key, (_, sample_size) in (expressions or {}).items()
+                }
+            ),
+        },
+        metrics,
+    )
+
+
+def _row_group_stats(
+    chunk: Any,
+    num_rows: int,
+    extremes: list[str],
+) -> dict[str, Any] | None:
+    """
+    Internal function, convert parquet column chunk statistics into the same
+    form as `partial_describe` statistics, or None if statistics are missing.
+    """
+    if chunk is None or not chunk.is_stats_set:
+        return None
+    statistics = chunk.statistics
+    if not statistics.has_null_count:
+        return None
+    null_count = statistics.null_count
+    chunk_stats: dict[str, Any] = {
+        "count": num_rows - null_count,
+        "null_count": null_count,
+    }
+    if extremes:
+        if statistics.has_min_max:
+            chunk_stats |= {"min": statistics.min, "max": statistics.max}
+        elif null_count == num_rows:
+            chunk_stats |= {"min": None, "max": None}
+        else:
+            return None
+    return {k: chunk_stats[k] for k in ["count", "null_count"] + extremes}
@@ -1,13 +1,26 @@
 import json
+import math
 from enum import Enum, auto
-from typing import Iterable
+from operator import itemgetter
+from typing import Any, Iterable
 from statistics import stdev
 
-import fsspec
 from narwhals.stable.v1.typing import FrameT
 
 from wimsey.dataframe import profile_from_sampling, profile_from_samples
 
+# Integers beyond this can't be held exactly as floats
+_MAX_EXACT_INT: int = 2**53
+# Multiplier splitting a float into two halves of its bits, see `_split`
+_SPLITTER: float = 2.0**27 + 1
+# Standard deviations closer than this (relative to their value) to halfway
+# between two floats are left to `statistics.stdev`, see `_stdevs`
+_STDEV_TOLERANCE: float = 2.0**-70
+# Smallest variance and largest value for which `_stdevs` can't underflow or
+# overflow
+_MIN_STDEV_VARIANCE: float = 2.0**-900
+_MAX_STDEV_VALUE: float = 2.0**450
+
 
 class _StarterTestStatus(Enum):
     """Internal class to mark out column consistency for use"""
@@ -94,6 +107,8 @@ def _save_starter_tests(
         contents = yaml.dump(tests)
     else:
         contents = json.dumps(tests)
+    import fsspec  # type: ignore[import-untyped]
+
     with fsspec.open(path, mode="wt", **storage_options) as file:
         file.write(contents)
 
@@ -127,7 +142,7 @@ def starter_tests_from_sampling(
 def _starter_tests_from_sample_describes(
     samples: list[dict],
     margin: float = 1,
-) -> dict:
+) -> list[dict]:
     """
     Internal function doing the main body of work for building out tests once sample
     describes have been taken.
@@ -173,35 +188,219 @@ def _update_column_starter_test(starter: dict, sample: dict) -> dict:
     return starter
 
 
+def _column_values(samples: list[dict], keys: list[str]) -> list[tuple]:
+    """
+    Internal function, gather the values of each key across sample describes,
+    giving one tuple of values (in sample order) per key.
+    """
+    if not samples:
+        return [() for _ in keys]
+    getter = itemgetter(*keys)
+    rows = [getter(i) for i in samples]
+    if len(keys) == 1:
+        return [tuple(rows)]
+    return list(zip(*rows))
+
+
+def _stat_starter_test(
+    stat: str,
+    column: str,
+    maximum: Any,
+    minimum: Any,
+    absolute_margin: float,
+) -> dict:
+    """Internal function to build a statistical starter test for one column"""
+    if absolute_margin == 0:
+        return {
+            "column": column,
+            "test": f"{stat}_should",
+            "be_exactly": maximum,
+        }
+    return {
+        "column": column,
+        "test": f"{stat}_should",
+        "be_less_than_or_equal_to": maximum + absolute_margin,
+        "be_greater_than_or_equal_to": minimum - absolute_margin,
+    }
+
+
+def _column_spreads(
+    column_values: list[tuple], margin: float
+) -> dict[int, tuple[int, int, float]]:
+    """
+    Internal function, calculate the spread of values for every column that
+    can be held exactly in a float array (only ints, floats and None, with at
+    least two values), all at once. Gives the index of each column's maximum
+    and minimum value, and its margin (standard deviation times `margin`).
+    Other columns are left out, to be calculated one by one.
+
+    Standard deviations are rounded exactly as `statistics.stdev` rounds them
+    (see `_stdevs`), so margins match those of columns calculated one by one
+    to the last bit.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return {}
+    indexes = [
+        index
+        for index, values in enumerate(column_values)
+        if set(map(type, values)) <= {int, float, type(None)}
+        and len(values) - values.count(None) >= 2
+    ]
+    if not indexes:
+        return {}
+    # None becomes nan, so actual nan values (which python's max and min treat
+    # differently) and integers too large for a float are checked for after
+    array = np.array([column_values[i] for i in indexes], dtype=np.float64)
+    nones = np.array([column_values[i].count(None) for i in indexes])
+    with np.errstate(all="ignore"):
+        exact = (np.isnan(array).sum(axis=1) == nones) & ~(
+            np.abs(array) > _MAX_EXACT_INT
+        ).any(axis=1)
+    maximums = np.nanargmax(array, axis=1).tolist()
+    minimums = np.nanargmin(array, axis=1).tolist()
+    # Standard deviation is only zero when all values are equal, so only needs
+    # calculating for columns where they aren't
+    equal = np.nanmax(array, axis=1) == np.nanmin(array, axis=1)
+    stdevs = np.zeros(len(indexes))
+    unequal = exact & ~equal
+    stdevs[unequal] = _stdevs(np, array[unequal])
+    return {
+        index: (
+            maximum,
+            minimum,
+            (
+                stdev([i for i in column_values[index] if i is not None]) * margin
+                if math.isnan(column_stdev)
+                else column_stdev * margin
+            ),
+        )
+        for index, maximum, minimum, column_stdev, is_exact in zip(
+            indexes, maximums, minimums, stdevs.tolist(), exact.tolist()
+        )
+        if is_exact
+    }
+
+
+def _stdevs(np: Any, array: Any) -> Any:
+    """
+    Internal function, sample standard deviations of the rows of a 2D float
+    array, with nan for missing values, and at least two differing values in
+    each row, all at once.
+
+    `statistics.stdev` gives the square root of the exact variance, correctly
+    rounded. Here sums are carried as a float and its rounding error (giving
+    around a hundred bits), and a row's standard deviation is only given if
+    it's far enough from halfway between two floats for its rounding to be
+    certain, and nan otherwise, to be calculated by `statistics.stdev`.
+    """
+    with np.errstate(all="ignore"):
+        valid = ~np.isnan(array)
+        count = valid.sum(axis=1).astype(np.float64)
+        # Deviations from an approximate mean are held exactly, as a float and
+        # its rounding error
+        high, low = _two_sum(array, -np.nanmean(array, axis=1)[:, None])
+        high = np.where(valid, high, 0.0)
+        low = np.where(valid, low, 0.0)
+        squared_high, squared_low = _two_product(high, high)
+        squared_low += 2 * high * low + low * low
+        sum_high = sum_low = squares_high = squares_low = np.zeros(len(array))
+        for i in range(array.shape[1]):
+            sum_high, error = _two_sum(sum_high, high[:, i])
+            sum_low = sum_low + error + low[:, i]
+            squares_high, error = _two_sum(squares_high, squared_high[:, i])
+            squares_low = squares_low + error + squared_low[:, i]
+        # count * (count - 1) * variance = count * sum of squares - sum ** 2
+        scaled_high, scaled_low = _two_product(squares_high, count)
+        scaled_low += squares_low * count
+        sum_squared_high, sum_squared_low = _two_product(sum_high, sum_high)
+        sum_squared_low += 2 * sum_high * sum_low
+        difference_high, error = _two_sum(scaled_high, -sum_squared_high)
+        difference_high, difference_low = _two_sum(
+            difference_high, error + scaled_low - sum_squared_low
+        )
+        divisor = count * (count - 1)
+        variance_high = difference_high / divisor
+        product, error = _two_product(variance_high, divisor)
+        variance_low = ((difference_high - product) - error + difference_low) / divisor
+        # A newton step from the root of the high part gives the root's error
+        root = np.sqrt(variance_high)
+        product, error = _two_product(root, root)
+        correction = ((variance_high - product) - error + variance_low) / (2 * root)
+        stdevs = root + correction
+        offset = (root - stdevs) + correction
+        gap = np.where(
+            offset < 0,
+            stdevs - np.nextafter(stdevs, 0),
+            np.nextafter(stdevs, np.inf) - stdevs,
+        )
+        certain = (
+            (gap / 2 - np.abs(offset) > _STDEV_TOLERANCE * stdevs)
+            & (variance_high >= _MIN_STDEV_VARIANCE)
+            & (np.nanmax(np.abs(array), axis=1) <= _MAX_STDEV_VALUE)
+        )
+    return np.where(certain, stdevs, np.nan)
+
+
+def _two_sum(a: Any, b: Any) -> tuple[Any, Any]:
+    """Internal function, sum of floats (or arrays) and its exact rounding error"""
+    total = a + b
+    b_part = total - a
+    return total, (a - (total - b_part)) + (b - b_part)
+
+
+def _two_product(a: Any, b: Any) -> tuple[Any, Any]:
+    """Internal function, product of floats (or arrays) and its exact rounding error"""
+    product = a * b
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    return product, (
+        ((a_high * b_high - product) + a_high * b_low + a_low * b_high) + a_low * b_low
+    )
+
+
+def _split(a: Any) -> tuple[Any, Any]:
+    """Internal function, split floats into their high and low 26 bits"""
+    scaled = _SPLITTER * a
+    high = scaled - (scaled - a)
+    return high, a - high
+
+
 def _stat_starter_tests(
     stat: str,
     samples: list[dict],
     columns: list[str],
     margin: float,
 ) -> list[dict]:
-    """Internal function to build statistical starter tests from sample describes"""
+    """
+    Internal function to build statistical starter tests from sample describes.
+
+    Where numpy is installed, the spread of values across samples is calculated
+    for all numeric columns at once, as a 2D array of columns by samples.
+    """
+    column_values = _column_values(samples, [f"{stat}_{i}" for i in columns])
+    spreads = _column_spreads(column_values, margin)
     tests: list[dict] = []
-    for column in columns:
-        values = [
-            i[f"{stat}_{column}"] for i in samples if i[f"{stat}_{column}"] is not None
-        ]
-        if len(values) == 0:
+    for index, column in enumerate(columns):
+        if index in spreads:
+            maximum, minimum, absolute_margin = spreads[index]
+            values = column_values[index]
+            tests.append(
+                _stat_starter_test(
+                    stat, column, values[maximum], values[minimum], absolute_margin
+                )
+            )
             continue
-        absolute_margin = stdev(values) * margin
-        if absolute_margin == 0:
-            test = {
-                "column": column,
-                "test": f"{stat}_should",
-                "be_exactly": max(values),
-            }
-        else:
-            test = {
-                "column": column,
-                "test": f"{stat}_should",
-                "be_less_than_or_equal_to": max(values) + absolute_margin,
-                "be_greater_than_or_equal_to": min(values) - absolute_margin,
-            }
-        tests.append(test)
+        present = [i for i in column_values[index] if i is not None]
+        if len(present) == 0:
+            continue
+        absolute_margin = stdev(present) * margin
+        tests.append(
+            _stat_starter_test(
+                stat, column, max(present), min(present), absolute_margin
+            )
+        )
     return tests
 
 
@@ -211,9 +410,10 @@ def _type_starter_tests(
 ) -> list[dict]:
     """Internal function to build 'column x should be type y' tests from sample describes"""
     tests: list[dict] = []
-    for column in columns:
-        types = set(i[f"type_{column}"] for i in samples)
-        test = {"column": column, "test": "type_should"}
+    column_types = _column_values(samples, [f"type_{i}" for i in columns])
+    for column, values in zip(columns, column_types):
+        types = set(values)
+        test: dict = {"column": column, "test": "type_should"}
         if len(types) == 1:
             test |= {"be": list(types)[0]}
         else:
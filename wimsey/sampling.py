@@ -0,0 +1,306 @@
+"""
+Testing against a sample of a dataframe, for tests of metrics that can be
+estimated, with a confidence interval, from a uniform sample.
+
+Only `mean_should`, `std_should` and `null_percentage_should` tests are
+evaluated against a sample. Each passes if its whole confidence interval is
+within bounds, fails if none of it is, and is otherwise inconclusive. Every
+other test (including `row_count_should`, for which only the row count is
+calculated) is evaluated against the full dataframe as normal.
+"""
+
+import math
+import random
+from dataclasses import replace
+from statistics import NormalDist
+from typing import Any, Callable
+
+import narwhals.stable.v1 as nw
+from narwhals.dependencies import is_dask_dataframe
+from narwhals.stable.v1.typing import FrameT
+
+from wimsey.config import Contract
+from wimsey.dataframe import Plan, _collect, _first_row, describe
+from wimsey.tests import result
+
+SAMPLED_METRICS: tuple[str, ...] = ("mean", "std", "null_percentage")
+ESCALATION_FACTOR: int = 10
+
+
+def is_sampled(test: Callable) -> bool:
+    """Check whether test can be evaluated against a sample"""
+    range_check = getattr(test, "range_check", None)
+    if range_check is None or range_check[1] != "value":
+        return False
+    return getattr(test, "required_metrics", set()) <= set(SAMPLED_METRICS)
+
+
+def sample_size(sample: int | float, population: int) -> int:
+    """
+    Give the number of rows to sample from a population of rows, where sample
+    is either a number of rows, or a fraction of the population.
+    """
+    if isinstance(sample, float):
+        if not 0 < sample <= 1:
+            msg = "A sample given as a fraction should be between 0 and 1"
+            raise ValueError(msg)
+        return max(math.ceil(population * sample), 1)
+    if sample < 1:
+        msg = "A sample given as a number of rows should be at least 1"
+        raise ValueError(msg)
+    return sample
+
+
+def _sample(
+    df: nw.DataFrame | nw.LazyFrame, size: int, population: int, seed: int | None
+) -> nw.DataFrame:
+    """
+    Internal function, take a uniform random sample of around size rows. Lazy
+    polars frames can't be sampled without reading every row, so instead every
+    nth row is taken from a random offset. Samples of lazy frames are collected,
+    as they're small, and needed for more than one query.
+    """
+    if isinstance(df, nw.DataFrame):
+        return df.sample(n=size, seed=seed)
+    native = nw.to_native(df)
+    if is_dask_dataframe(native):
+        sampled = native.sample(frac=size / population, random_state=seed)
+        return nw.from_native(sampled.compute(), eager_only=True)
+    step = max(population // size, 1)
+    return _collect(df.gather_every(step, offset=random.Random(seed).randrange(step)))
+
+
+def _metric_and_column(test: Callable) -> tuple[str, str]:
+    """Internal function, give the single metric and column of a sampled test"""
+    (metric,) = getattr(test, "required_metrics")
+    return metric, getattr(test, "keywords")["column"]
+
+
+def _fourth_moments(df: nw.DataFrame, means: dict[str, float]) -> dict[str, float]:
+    """
+    Internal function, calculate the fourth central moment of columns, needed
+    for the standard error of their standard deviation.
+    """
+    if not means:
+        return {}
+    deviations = {
+        c: (nw.col(c) - mean) * (nw.col(c) - mean) for c, mean in means.items()
+    }
+    return _first_row(
+        df.select([(i * i).mean().alias(c) for c, i in deviations.items()])
+    )
+
+
+def _finite_population_correction(size: int, population: int) -> float:
+    """Internal function, scale standard errors when sampling without replacement"""
+    if population <= 1 or size >= population:
+        return 0.0
+    return math.sqrt((population - size) / (population - 1))
+
+
+def _interval(
+    metric: str,
+    column: str,
+    description: dict[str, Any],
+    moments: dict[str, float],
+    population: int,
+    z: float,
+) -> tuple[float | None, tuple[float, float] | None]:
+    """
+    Internal function, give an estimate of the metric for column from a sample
+    description, and its confidence interval, or None if there isn't enough
+    data for one.
+    """
+    size = description["length"]
+    count = description[f"count_{column}"]
+    correction = _finite_population_correction(size, population)
+    if metric == "null_percentage":
+        # Wilson score interval, which behaves better than a normal
+        # approximation for proportions near 0 or 1
+        if size == 0:
+            return None, None
+        estimate = description[f"null_percentage_{column}"]
+        scale = 1 + z**2 / size
+        centre = (estimate + z**2 / (2 * size)) / scale
+        spread = (
+            z
+            * math.sqrt(estimate * (1 - estimate) / size + z**2 / (4 * size**2))
+            / scale
+            * correction
+        )
+        return estimate, (max(centre - spread, 0.0), min(centre + spread, 1.0))
+    estimate = description[f"{metric}_{column}"]
+    std = description[f"std_{column}"]
+    if estimate is None or std is None or count < 4:
+        return estimate, None
+    if metric == "mean":
+        spread = z * std / math.sqrt(count) * correction
+        return estimate, (estimate - spread, estimate + spread)
+    if std == 0:
+        return estimate, (0.0, 0.0) if correction == 0 else None
+    # Asymptotic variance of the sample variance, which unlike the chi-squared
+    # interval, doesn't assume normally distributed data
+    variance = (moments[column] - std**4 * (count - 3) / (count - 1)) / count
+    spread = z * math.sqrt(max(variance, 0.0)) / (2 * std) * correction
+    return estimate, (max(estimate - spread, 0.0), estimate + spread)
+
+
+def _outcome(keywords: dict[str, Any], low: float, high: float) -> bool | None:
+    """
+    Internal function, give whether every value within an interval is within
+    the bounds of a test (True), no value is (False), or neither (None).
+    """
+    exactly = keywords.get("be_exactly")
+    lower = [
+        (keywords.get("be_greater_than"), True),
+        (keywords.get("be_greater_than_or_equal_to"), False),
+    ]
+    upper = [
+        (keywords.get("be_less_than"), True),
+        (keywords.get("be_less_than_or_equal_to"), False),
+    ]
+    if exactly is not None:
+        lower.append((exactly, False))
+        upper.append((exactly, False))
+    all_within = all(
+        bound is None or (low > bound if strict else low >= bound)
+        for bound, strict in lower
+    ) and all(
+        bound is None or (high < bound if strict else high <= bound)
+        for bound, strict in upper
+    )
+    if all_within:
+        return True
+    none_within = any(
+        bound is not None and (high <= bound if strict else high < bound)
+        for bound, strict in lower
+    ) or any(
+        bound is not None and (low >= bound if strict else low > bound)
+        for bound, strict in upper
+    )
+    return False if none_within else None
+
+
+def _evaluate_sampled(
+    tests: list[Callable],
+    description: dict[str, Any],
+    moments: dict[str, float],
+    population: int,
+    confidence: float,
+) -> list[result]:
+    """Internal function, evaluate tests against a sample's description"""
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    results: list[result] = []
+    for test in tests:
+        metric, column = _metric_and_column(test)
+        estimate, interval = _interval(
+            metric, column, description, moments, population, z
+        )
+        outcome = (
+            None if interval is None else _outcome(getattr(test, "keywords"), *interval)
+        )
+        results.append(
+            result(
+                name=getattr(test, "range_check")[0],
+                success=bool(outcome),
+                unexpected=estimate if not outcome else None,
+                confidence_interval=interval,
+                inconclusive=outcome is None,
+            )
+        )
+    return results
+
+
+def test_sample(
+    df: FrameT,
+    tests: list[Callable],
+    population: int,
+    sample: int | float,
+    confidence: float = 0.95,
+    escalate: bool = True,
+    seed: int | None = None,
+) -> list[result]:
+    """
+    Evaluate tests (which must all be `is_sampled`) against a sample of df,
+    which has `population` rows, see `wimsey.execution.test`.
+
+    If `escalate` is True, inconclusive tests are evaluated again against a
+    sample `ESCALATION_FACTOR` times larger, and so on, until a sample would
+    be as large as the dataframe itself, when they're evaluated against the
+    full dataframe.
+    """
+    frame = nw.from_native(df)
+    size = sample_size(sample, population)
+    results: dict[int, result] = {}
+    remaining = list(enumerate(tests))
+    while remaining:
+        remaining_tests = [i for _, i in remaining]
+        if size >= population:
+            description = describe(frame, plan=_plan(remaining_tests, full=True))
+            for (position, test), test_result in zip(
+                remaining, [i(description) for i in remaining_tests]
+            ):
+                results[position] = test_result
+            break
+        sampled = _sample(frame, size, population, seed)
+        description = describe(sampled, plan=_plan(remaining_tests))
+        stds = {
+            column
+            for metric, column in map(_metric_and_column, remaining_tests)
+            if metric == "std"
+        }
+        moments = _fourth_moments(
+            sampled,
+            {
+                c: description[f"mean_{c}"]
+                for c in stds
+                if description[f"mean_{c}"] is not None
+            },
+        )
+        sample_results = _evaluate_sampled(
+            remaining_tests, description, moments, population, confidence
+        )
+        next_remaining = []
+        for (position, test), test_result in zip(remaining, sample_results):
+            results[position] = test_result
+            if test_result.inconclusive and escalate:
+                next_remaining.append((position, test))
+        remaining = next_remaining
+        size *= ESCALATION_FACTOR
+    return [results[i] for i in range(len(tests))]
+
+
+def _plan(tests: list[Callable], full: bool = False) -> Plan:
+    """
+    Internal function, plan the metrics needed to evaluate tests against a
+    sample (or if `full`, just the metrics needed for the whole dataframe).
+    """
+    pairs: set[tuple[str | None, str]] = {(None, "length")}
+    for test in tests:
+        metric, column = _metric_and_column(test)
+        pairs.add((column, metric))
+        if metric == "null_percentage":
+            pairs |= {(column, "count"), (column, "null_count")}
+        if not full:
+            pairs |= {(column, "count"), (column, "mean"), (column, "std")}
+    return Plan(frozenset(pairs))
+
+
+def split_contract(contract: Contract) -> tuple[Contract, list[Callable]]:
+    """
+    Split a contract into tests evaluated against the full dataframe, and tests
+    evaluated against a sample. The full contract always calculates row count,
+    needed to size samples.
+    """
+    sampled = [i for i in contract.tests if is_sampled(i)]
+    full = Contract.from_tests([i for i in contract.tests if not is_sampled(i)])
+    if full.plan is None:
+        return full, sampled
+    return (
+        replace(
+            full,
+            metrics=sorted(set(full.metrics or []) | {"length"}),
+            plan=Plan(full.plan.pairs | {(None, "length")}),
+        ),
+        sampled,
+    )
@@ -0,0 +1,242 @@
+import base64
+import math
+import random
+import struct
+from hashlib import blake2b
+from typing import Any, Iterable
+
+DEFAULT_ERROR: float = 0.01
+_MASK_64: int = (1 << 64) - 1
+
+
+class KLLSketch:
+    """
+    Mergeable sketch for approximate quantiles of numeric values, using a
+    fixed amount of memory regardless of how many values are added.
+
+    Error is given as the approximate normalised rank error, so with an error of
+    0.01, the median given may be anywhere between the 49th and 51st percentile.
+    """
+
+    def __init__(self, error: float = DEFAULT_ERROR, seed: int | None = None) -> None:
+        self.error = error
+        self.k = max(math.ceil(1.65 / error), 8)
+        self.count = 0
+        self.levels: list[list[float]] = [[]]
+        self._random = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(math.ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _compress(self) -> None:
+        """
+        Halve any levels over capacity, promoting every other item to the level
+        above, until all levels are within capacity.
+        """
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) < self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            items = sorted(self.levels[level])
+            self.levels[level] = [items.pop()] if len(items) % 2 else []
+            offset = self._random.randint(0, 1)
+            self.levels[level + 1] += items[offset::2]
+            # Adding a level lowers the capacity of those below it
+            level = 0 if level + 2 == len(self.levels) else level + 1
+
+    def update(self, values: Iterable[Any]) -> "KLLSketch":
+        """
+        Add values to sketch, ignoring nulls and NaNs. Values are compacted
+        once all have been added, so should be given in chunks of bounded size.
+        """
+        values = [i for i in values if i is not None and i == i]
+        self.count += len(values)
+        self.levels[0] += values
+        self._compress()
+        return self
+
+    def compaction_level(self, count: int) -> int:
+        """
+        Give the lowest level at which count values fit within the sketch,
+        keeping only every 2**level-th of them, see `update_sorted`.
+        """
+        level = 0
+        while count > (self.k - 1) * 2**level:
+            level += 1
+        return level
+
+    def update_sorted(
+        self, items: Iterable[Any], count: int, level: int
+    ) -> "KLLSketch":
+        """
+        Add count values, given only as every 2**level-th of them in sorted
+        order, without nulls or NaNs, as compacting them would leave them. This
+        lets values sorted by a dataframe backend be sketched, reading just the
+        items kept into python.
+        """
+        while len(self.levels) <= level:
+            self.levels.append([])
+        self.levels[level] += list(items)
+        self.count += count
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Combine with another sketch, as if all values were added to one"""
+        merged = KLLSketch(error=max(self.error, other.error))
+        merged.count = self.count + other.count
+        merged.levels = [
+            (self.levels[i] if i < len(self.levels) else [])
+            + (other.levels[i] if i < len(other.levels) else [])
+            for i in range(max(len(self.levels), len(other.levels)))
+        ]
+        merged._compress()
+        return merged
+
+    def quantile(self, quantile: float) -> Any:
+        """Approximate value at quantile (between 0 and 1), None if empty"""
+        weighted = sorted(
+            (value, 2**level)
+            for level, items in enumerate(self.levels)
+            for value in items
+        )
+        if not weighted:
+            return None
+        target = quantile * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"error": self.error, "count": self.count, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "KLLSketch":
+        sketch = cls(error=data["error"])
+        sketch.count = data["count"]
+        sketch.levels = [list(i) for i in data["levels"]]
+        return sketch
+
+
+class HyperLogLog:
+    """
+    Mergeable sketch for approximate distinct counts, using a fixed amount of
+    memory regardless of how many values are added. Nulls are not counted.
+
+    Error is given as the approximate relative standard error of the estimate.
+    """
+
+    def __init__(self, error: float = DEFAULT_ERROR) -> None:
+        self.error = error
+        self.precision = min(max(math.ceil(math.log2((1.04 / error) ** 2)), 4), 18)
+        self.registers = bytearray(1 << self.precision)
+
+    def update(self, values: Iterable[Any]) -> "HyperLogLog":
+        """Add values to sketch, ignoring nulls"""
+        precision = self.precision
+        remaining_bits = 64 - precision
+        mask = (1 << remaining_bits) - 1
+        registers = self.registers
+        try:
+            # Adding a value more than once has no effect, so only unique values
+            # need to be hashed
+            values = set(values)
+        except TypeError:
+            pass
+        for value in values:
+            if value is None:
+                continue
+            hashed = _hash(value)
+            index = hashed >> remaining_bits
+            rank = remaining_bits - (hashed & mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+        return self
+
+    def update_numeric(self, values: Any) -> "HyperLogLog":
+        """
+        Add a numpy array of integers or floats to sketch, hashing every value
+        at once, as `update` would one at a time.
+        """
+        import numpy as np
+
+        remaining_bits = 64 - self.precision
+        with np.errstate(over="ignore"):
+            hashed = _mix_array(
+                np, np.unique(values).astype(np.float64).view(np.uint64)
+            )
+        index = (hashed >> np.uint64(remaining_bits)).astype(np.intp)
+        remainder = hashed & np.uint64((1 << remaining_bits) - 1)
+        # Exact bit length, halving the bits searched at each step
+        bit_length = np.zeros(len(remainder), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            above = remainder >= np.uint64(1 << shift)
+            bit_length += above * np.uint8(shift)
+            remainder = np.where(above, remainder >> np.uint64(shift), remainder)
+        bit_length += remainder > 0
+        registers = np.frombuffer(self.registers, dtype=np.uint8)
+        np.maximum.at(registers, index, remaining_bits - bit_length + 1)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Combine with another sketch, as if all values were added to one"""
+        if self.precision != other.precision:
+            msg = "Unable to merge distinct count sketches with different errors"
+            raise ValueError(msg)
+        merged = HyperLogLog(error=self.error)
+        merged.registers = bytearray(map(max, self.registers, other.registers))
+        return merged
+
+    def estimate(self) -> int:
+        """Approximate number of distinct values added"""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size**2 / sum(2.0**-i for i in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "error": self.error,
+            "registers": base64.b64encode(self.registers).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(error=data["error"])
+        sketch.registers = bytearray(base64.b64decode(data["registers"]))
+        return sketch
+
+
+def _hash(value: Any) -> int:
+    """
+    Internal function, 64 bit hash of value for `HyperLogLog`. Integers and
+    floats are hashed by the bits of their float value (so 1 and 1.0 are the
+    same value), so can also be hashed at once by `_mix_array`.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _mix(int.from_bytes(struct.pack("<d", value), "little"))
+    return int.from_bytes(blake2b(str(value).encode(), digest_size=8).digest(), "big")
+
+
+def _mix(bits: int) -> int:
+    """Internal function, splitmix64 finaliser, spreading bits across the hash"""
+    bits = ((bits ^ (bits >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    bits = ((bits ^ (bits >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return bits ^ (bits >> 31)
+
+
+def _mix_array(np: Any, bits: Any) -> Any:
+    """Internal function, `_mix` of a numpy array of unsigned 64 bit integers"""
+    bits = (bits ^ (bits >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    bits = (bits ^ (bits >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return bits ^ (bits >> np.uint64(31))
@@ -0,0 +1,356 @@
+"""
+Describing tables where they live, in a database, by compiling the metrics a
+contract needs into a single SQL aggregate query, run over any DB-API
+connection (such as DuckDB, sqlite3 or psycopg).
+
+Tables are given as a `Table` of a connection and either a table name or a
+query, and can be passed to `wimsey.test` or `wimsey.validate` in place of a
+dataframe:
+
+```python
+wimsey.validate(sql.Table(connection, "sales"), "sales-checks.yaml")
+```
+
+Metrics use `COUNT`, `AVG`, `STDDEV_SAMP`, `MIN` and `MAX`, which most
+databases support (sqlite3 has no `STDDEV_SAMP`, but one can be registered with
+`create_aggregate`). Column types are read from the catalog for named tables,
+or from the type codes of the cursor's description for queries, and given as
+narwhals type names where known. Row checks can't be expressed in SQL, so
+aren't supported.
+"""
+
+import math
+import sys
+from dataclasses import dataclass
+from typing import Any, TypeGuard
+
+from wimsey import sketches
+from wimsey.dataframe import Plan, _DEFAULT_METRICS, _SKETCH_CHUNK_SIZE
+
+# SQL types, as named by DuckDB (and mostly the SQL standard), as narwhals types
+_TYPES: dict[str, str] = {
+    "TINYINT": "Int8",
+    "INT1": "Int8",
+    "SMALLINT": "Int16",
+    "INT2": "Int16",
+    "INTEGER": "Int32",
+    "INT": "Int32",
+    "INT4": "Int32",
+    "BIGINT": "Int64",
+    "INT8": "Int64",
+    "UTINYINT": "UInt8",
+    "USMALLINT": "UInt16",
+    "UINTEGER": "UInt32",
+    "UBIGINT": "UInt64",
+    "REAL": "Float32",
+    "FLOAT": "Float32",
+    "FLOAT4": "Float32",
+    "DOUBLE": "Float64",
+    "DOUBLE PRECISION": "Float64",
+    "FLOAT8": "Float64",
+    "DECIMAL": "Decimal",
+    "NUMERIC": "Decimal",
+    "VARCHAR": "String",
+    "CHARACTER VARYING": "String",
+    "CHAR": "String",
+    "CHARACTER": "String",
+    "TEXT": "String",
+    "STRING": "String",
+    "BOOLEAN": "Boolean",
+    "BOOL": "Boolean",
+    "DATE": "Date",
+    "TIMESTAMP": "Datetime",
+    "DATETIME": "Datetime",
+    "TIMESTAMP WITH TIME ZONE": "Datetime",
+    "TIMESTAMPTZ": "Datetime",
+    "INTERVAL": "Duration",
+}
+# Sqlite's storage classes, which are always 64 bit
+_SQLITE_TYPES: dict[str, str] = {"INTEGER": "Int64", "REAL": "Float64"}
+# DB-API type objects, which drivers such as psycopg give type codes of, where
+# they don't give type names, only string types have a narwhals equivalent
+_DBAPI_TYPES: dict[str, str] = {
+    "STRING": "String",
+    "NUMBER": "NUMBER",
+    "DATETIME": "DATETIME",
+    "BINARY": "BINARY",
+    "ROWID": "ROWID",
+}
+_NUMERIC_TYPES: set[str] = {
+    "NUMBER",
+    "Int8",
+    "Int16",
+    "Int32",
+    "Int64",
+    "UInt8",
+    "UInt16",
+    "UInt32",
+    "UInt64",
+    "Float32",
+    "Float64",
+    "Decimal",
+}
+_AGGREGATES: dict[str, str] = {
+    "mean": "AVG({})",
+    "std": "STDDEV_SAMP({})",
+    "min": "MIN({})",
+    "max": "MAX({})",
+    "distinct_count": "COUNT(DISTINCT {})",
+}
+_COUNTS: tuple[str, ...] = ("count", "null_count", "null_percentage")
+_COUNT: str = "__wimsey_count__"
+
+
+@dataclass(frozen=True)
+class Table:
+    """
+    A table on a DB-API connection, given as either a table `name` (which may
+    be qualified with a schema, as "schema.table") or a `query`.
+    """
+
+    connection: Any
+    name: str | None = None
+    query: str | None = None
+
+    def __post_init__(self) -> None:
+        if (self.name is None) == (self.query is None):
+            msg = "A SQL table should be given as either a name or a query"
+            raise ValueError(msg)
+
+
+def is_sql_source(source: Any) -> TypeGuard[Table]:
+    """Check whether source is a `Table` to be described with SQL"""
+    return isinstance(source, Table)
+
+
+def _quote(identifier: str) -> str:
+    """Internal function, quote an identifier as standard SQL"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    """Internal function, quote a string literal as standard SQL"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _from_clause(table: Table) -> str:
+    """Internal function, the relation to select from for table"""
+    if table.name is None:
+        return f"({table.query}) AS {_quote('__wimsey_query__')}"
+    return ".".join(_quote(i) for i in table.name.split("."))
+
+
+def _execute(connection: Any, query: str) -> Any:
+    """Internal function, execute query on a new cursor"""
+    cursor = connection.cursor()
+    cursor.execute(query)
+    return cursor
+
+
+def _is_sqlite(connection: Any) -> bool:
+    """Internal function, check whether connection is a sqlite3 connection"""
+    sqlite3 = sys.modules.get("sqlite3")
+    return sqlite3 is not None and isinstance(connection, sqlite3.Connection)
+
+
+def _type_name(sql_type: str | None, sqlite: bool) -> str | None:
+    """
+    Internal function, convert a SQL type name into a narwhals type name, or
+    give it as it is if there's no equivalent.
+    """
+    if not sql_type or sql_type.upper() == "NULL":
+        # Sqlite's typeof gives the type of a value rather than its column
+        return None
+    base = sql_type.upper().split("(")[0].strip()
+    if sqlite and base in _SQLITE_TYPES:
+        return _SQLITE_TYPES[base]
+    return _TYPES.get(base, sql_type)
+
+
+def _columns(table: Table) -> list[tuple]:
+    """
+    Internal function, the cursor description of table's columns, without
+    reading any rows
+    """
+    cursor = _execute(table.connection, f"SELECT * FROM {_from_clause(table)} LIMIT 0")
+    return list(cursor.description)
+
+
+def _type_code_name(connection: Any, type_code: Any) -> str | None:
+    """
+    Internal function, convert the type code of a cursor description into a
+    narwhals type name, where a driver gives type names (as DuckDB does), or
+    the name of the DB-API type object it matches otherwise.
+    """
+    if type_code is None:
+        return None
+    if not isinstance(type_code, int):
+        return _type_name(str(type_code), False)
+    module = sys.modules.get(type(connection).__module__.split(".")[0])
+    for name, type_name in _DBAPI_TYPES.items():
+        if getattr(module, name, None) == type_code:
+            return type_name
+    return None
+
+
+def _catalog_types(table: Table, sqlite: bool) -> dict[str, str]:
+    """
+    Internal function, the types of a named table's columns from the catalog,
+    sqlite's `pragma_table_info` or the standard `information_schema`. Tables
+    without a schema are looked up in `current_schema()`. Returns an empty
+    dictionary for queries, or where the catalog can't be read.
+    """
+    if table.name is None:
+        return {}
+    *schema, name = table.name.split(".")
+    if sqlite:
+        query = f"SELECT name, type FROM pragma_table_info({_literal(name)})"
+    else:
+        query = (
+            "SELECT column_name, data_type FROM information_schema.columns "
+            f"WHERE table_name = {_literal(name)} AND table_schema = "
+            + (_literal(schema[-1]) if schema else "current_schema()")
+        )
+    try:
+        return dict(_execute(table.connection, query).fetchall())
+    except Exception:
+        return {}
+
+
+def _types(
+    table: Table, columns: list[str], description: list[tuple]
+) -> dict[str, str | None]:
+    """
+    Internal function, the types of columns, from the catalog for named tables,
+    or the type codes of the cursor `description` (see `_columns`) otherwise.
+
+    Sqlite gives no type codes, so types of queries are read with `typeof` over
+    the first row, and are only known for columns with a value in it.
+    """
+    if not columns:
+        return {}
+    sqlite = _is_sqlite(table.connection)
+    catalog = _catalog_types(table, sqlite)
+    if all(c in catalog for c in columns):
+        return {c: _type_name(catalog[c], sqlite) for c in columns}
+    if sqlite:
+        row = _execute(
+            table.connection,
+            f"SELECT {', '.join(f'typeof({_quote(c)})' for c in columns)} "
+            f"FROM {_from_clause(table)} LIMIT 1",
+        ).fetchone() or [None] * len(columns)
+        return {c: _type_name(i, sqlite) for c, i in zip(columns, row)}
+    type_codes = {i[0]: i[1] for i in description}
+    return {
+        c: (
+            _type_name(catalog[c], sqlite)
+            if c in catalog
+            else _type_code_name(table.connection, type_codes.get(c))
+        )
+        for c in columns
+    }
+
+
+def _quantiles(
+    table: Table, column: str, sketch_error: float | None = None
+) -> sketches.KLLSketch:
+    """
+    Internal function, sketch the quantiles of a column, reading its values in
+    chunks, so memory is bounded by the sketch rather than the table.
+    """
+    sketch = sketches.KLLSketch(
+        error=sketch_error if sketch_error is not None else sketches.DEFAULT_ERROR
+    )
+    cursor = _execute(
+        table.connection,
+        f"SELECT {_quote(column)} FROM {_from_clause(table)} "
+        f"WHERE {_quote(column)} IS NOT NULL",
+    )
+    while rows := cursor.fetchmany(_SKETCH_CHUNK_SIZE):
+        sketch.update([i[0] for i in rows])
+    return sketch
+
+
+def describe(
+    source: Table,
+    columns: list[str] | None = None,
+    metrics: list[str] | None = None,
+    sketch_error: float | None = None,
+    expressions: dict[str, tuple[Any, int]] | None = None,
+    plan: Plan | None = None,
+) -> dict[str, Any]:
+    """
+    Outputs the same dictionary as `wimsey.dataframe.describe` for a `Table`,
+    calculating every metric in a single aggregate query, apart from quantile
+    sketches, which read the values of each column required. Distinct counts
+    are calculated exactly.
+
+    Mean, standard deviation, minimum and maximum are only calculated for
+    numeric columns, and are None for others, as with dataframes.
+    """
+    if expressions:
+        msg = (
+            "Row checks (such as values_should) can't be carried out by SQL, "
+            "to test them, read the table as a dataframe"
+        )
+        raise ValueError(msg)
+    column_description = _columns(source)
+    all_columns = [i[0] for i in column_description]
+    if not all_columns:
+        return {}
+    if plan is None:
+        columns_to_check = [i for i in (columns or all_columns) if i in all_columns]
+        plan = Plan.from_columns_and_metrics(
+            columns_to_check, metrics or _DEFAULT_METRICS
+        )
+    else:
+        plan = Plan(
+            frozenset(i for i in plan.pairs if i[0] is None or i[0] in all_columns)
+        )
+    types = _types(source, plan.columns, column_description)
+
+    # Counts, null counts and null percentages are all derived from the count
+    # of non-null values and the row count, so share an aggregation
+    counted = sorted({c for c, m in plan.pairs if c is not None and m in _COUNTS})
+    selected: dict[str, str] = {"length": "COUNT(*)"} | {
+        f"{_COUNT}{c}": f"COUNT({_quote(c)})" for c in counted
+    }
+    description: dict[str, Any] = {"columns": "_^&^_".join(all_columns)}
+    for column, metric in sorted(plan.pairs, key=lambda i: (i[1], i[0] or "")):
+        if column is None or metric in _COUNTS or metric == "quantiles":
+            continue
+        key = f"{metric}_{column}"
+        if metric == "type":
+            description[key] = types[column]
+        elif metric == "distinct_count" or types[column] in _NUMERIC_TYPES:
+            selected[key] = _AGGREGATES[metric].format(_quote(column))
+        else:
+            description[key] = None
+    values: dict[str, Any] = {"length": None}
+    if len(selected) > 1 or (None, "length") in plan.pairs:
+        row = _execute(
+            source.connection,
+            f"SELECT {', '.join(selected.values())} FROM {_from_clause(source)}",
+        ).fetchone()
+        values = dict(zip(selected, row))
+    length = values.pop("length")
+    for column, metric in plan.pairs:
+        key = f"{metric}_{column}"
+        if metric in _COUNTS:
+            count = values[f"{_COUNT}{column}"]
+            if metric == "count":
+                description[key] = count
+            elif metric == "null_count":
+                description[key] = length - count
+            else:
+                description[key] = (length - count) / length if length else math.nan
+        elif metric == "quantiles" and column is not None:
+            description[key] = (
+                _quantiles(source, column, sketch_error)
+                if types[column] in _NUMERIC_TYPES
+                else None
+            )
+    description |= {k: v for k, v in values.items() if not k.startswith(_COUNT)}
+    if (None, "length") in plan.pairs:
+        description["length"] = length
+    return description
@@ -0,0 +1,42 @@
+import json
+from typing import Any
+
+
+def read_state(path: str, storage_options: dict | None = None) -> dict[str, Any] | None:
+    """
+    Read a persisted partial description (see `wimsey.dataframe.partial_describe`)
+    from a json sidecar file, returning None if no state has been saved yet.
+    """
+    import fsspec  # type: ignore[import-untyped]
+
+    storage_options_dict: dict = storage_options or {}
+    fs, fs_path = fsspec.core.url_to_fs(path, **storage_options_dict)
+    if not fs.exists(fs_path):
+        return None
+    with fs.open(fs_path, "rt") as file:
+        state = json.load(file)
+    if not isinstance(state, dict) or "stats" not in state:
+        msg = (
+            f"It looks like the state file at {path} isn't a valid Wimsey "
+            "state file, if it's been corrupted, removing it will reset the "
+            "state, but require the full dataset to be tested again."
+        )
+        raise ValueError(msg)
+    return state
+
+
+def write_state(
+    path: str,
+    state: dict[str, Any],
+    storage_options: dict | None = None,
+) -> None:
+    """
+    Save a partial description (see `wimsey.dataframe.partial_describe`) as a
+    json sidecar file. Values json can't hold, such as dates in samples of
+    failing rows, are saved as strings.
+    """
+    import fsspec
+
+    storage_options_dict: dict = storage_options or {}
+    with fsspec.open(path, "wt", **storage_options_dict) as file:
+        file.write(json.dumps(state, default=str))
@@ -1,13 +1,185 @@
-from functools import partial
-from typing import Any, Callable
-from dataclasses import dataclass
+import json
+import operator
+from collections.abc import Iterable, Iterator, Sequence
+from functools import partial, reduce
+from hashlib import blake2b
+from itertools import compress
+from typing import Any, Callable, overload
+from dataclasses import dataclass, fields
 
+import narwhals.stable.v1 as nw
 
-@dataclass
+
+@dataclass(slots=True)
 class result:
     name: str
     success: bool
     unexpected: Any = None
+    failing_count: int | None = None
+    failing_rows: list[dict] | None = None
+    confidence_interval: tuple[float, float] | None = None
+    inconclusive: bool = False
+    group: tuple | None = None
+
+
+_RESULT_FIELDS: tuple[str, ...] = tuple(i.name for i in fields(result))
+_RESULT_DEFAULTS: dict[str, Any] = {i.name: i.default for i in fields(result)}
+
+
+class result_table(Sequence[result]):
+    """
+    Results of many tests, behaving as a read-only list of `result` objects.
+
+    Results are held either as records, or as one list per field of `result`
+    (such as from vectorised evaluation), each only built from the other when
+    first needed, so filtering failures or exporting with `to_dict` or
+    `to_arrow` needn't build any `result` objects.
+    """
+
+    __slots__ = ("_records", "_columns")
+
+    def __init__(
+        self,
+        columns: dict[str, list] | None = None,
+        records: list[result] | None = None,
+    ) -> None:
+        self._records: list[result] | None = records
+        self._columns: dict[str, list] | None = None
+        if columns is not None or records is None:
+            columns = columns or {}
+            length = len(columns.get("name", []))
+            self._columns = {
+                i: columns.get(i, [_RESULT_DEFAULTS[i]] * length)
+                for i in _RESULT_FIELDS
+            }
+
+    @classmethod
+    def from_results(cls, results: Iterable[result]) -> "result_table":
+        return cls(records=list(results))
+
+    @property
+    def columns(self) -> dict[str, list]:
+        """Results as a dictionary of field names to lists of values"""
+        if self._columns is None:
+            rows = map(operator.attrgetter(*_RESULT_FIELDS), self._records or [])
+            transposed = list(map(list, zip(*rows))) or [[] for _ in _RESULT_FIELDS]
+            self._columns = dict(zip(_RESULT_FIELDS, transposed))
+        return self._columns
+
+    @property
+    def records(self) -> list[result]:
+        """Results as a list of `result` objects"""
+        if self._records is None:
+            self._records = list(map(result, *self.columns.values()))
+        return self._records
+
+    def __len__(self) -> int:
+        if self._records is not None:
+            return len(self._records)
+        return len(self.columns["name"])
+
+    @overload
+    def __getitem__(self, index: int) -> result: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "result_table": ...
+
+    def __getitem__(self, index: int | slice) -> "result | result_table":
+        if isinstance(index, slice):
+            if self._records is not None:
+                return result_table(records=self._records[index])
+            return result_table({k: v[index] for k, v in self.columns.items()})
+        return self.records[index]
+
+    def __iter__(self) -> Iterator[result]:
+        return iter(self.records)
+
+    def __add__(self, other: Iterable[result]) -> "result_table":
+        if self._records is not None and not isinstance(other, result_table):
+            return result_table(records=self._records + list(other))
+        other_table = (
+            other if isinstance(other, result_table) else self.from_results(other)
+        )
+        return result_table(
+            {k: v + other_table.columns[k] for k, v in self.columns.items()}
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return self.records == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"result_table({self.records!r})"
+
+    @property
+    def success(self) -> bool:
+        """True if every test passed"""
+        if self._records is not None:
+            return all(i.success for i in self._records)
+        return all(self.columns["success"])
+
+    def failures(self) -> "result_table":
+        """Results of only the tests that failed"""
+        if self._records is not None:
+            return result_table(records=[i for i in self._records if not i.success])
+        failed = [not i for i in self.columns["success"]]
+        return result_table(
+            {k: list(compress(v, failed)) for k, v in self.columns.items()}
+        )
+
+    def to_dict(self) -> dict[str, list]:
+        """Export results as a dictionary of field names to lists of values"""
+        return {k: list(v) for k, v in self.columns.items()}
+
+    def to_arrow(self) -> Any:
+        """
+        Export results as a pyarrow table. As unexpected values can be of any
+        type, they're given as strings, failing rows and groups as json strings,
+        and confidence intervals as separate lower and upper columns.
+        """
+        try:
+            import pyarrow as pa  # type: ignore[import-untyped]
+        except ImportError as exception:
+            msg = (
+                "Exporting results to arrow requires an additional install of "
+                "pyarrow (`pip install pyarrow`)"
+            )
+            raise ImportError(msg) from exception
+        columns = self.columns
+        intervals = columns["confidence_interval"]
+        return pa.table(
+            {
+                "name": pa.array(columns["name"], pa.string()),
+                "success": pa.array(columns["success"], pa.bool_()),
+                "unexpected": pa.array(
+                    [None if i is None else str(i) for i in columns["unexpected"]],
+                    pa.string(),
+                ),
+                "failing_count": pa.array(columns["failing_count"], pa.int64()),
+                "failing_rows": pa.array(
+                    [
+                        None if i is None else json.dumps(i, default=str)
+                        for i in columns["failing_rows"]
+                    ],
+                    pa.string(),
+                ),
+                "confidence_lower": pa.array(
+                    [None if i is None else i[0] for i in intervals], pa.float64()
+                ),
+                "confidence_upper": pa.array(
+                    [None if i is None else i[1] for i in intervals], pa.float64()
+                ),
+                "inconclusive": pa.array(columns["inconclusive"], pa.bool_()),
+                "group": pa.array(
+                    [
+                        None if i is None else json.dumps(list(i), default=str)
+                        for i in columns["group"]
+                    ],
+                    pa.string(),
+                ),
+            }
+        )
 
 
 def _range_check(metric: str) -> Callable:
@@ -15,7 +187,8 @@ def _range_check(metric: str) -> Callable:
     Factory function for generated tests of the form "x should be within range"
 
     Tests are also factories in themselves, they'll generate functions to take
-    only a "describe" object.
+    only a "describe" object. These carry a `range_check` attribute, so many can
+    be evaluated at once (see `wimsey.vectorise`).
     """
 
     def should(
@@ -65,7 +238,12 @@ def _range_check(metric: str) -> Callable:
             be_greater_than=be_greater_than,
             be_greater_than_or_equal_to=be_greater_than_or_equal_to,
         )
-        return_partial.required_metrics = {metric}
+        return_partial.required_metrics = {metric}  # type: ignore[attr-defined]
+        return_partial.range_check = (  # type: ignore[attr-defined]
+            f"{metric}-of-{column}",
+            "value",
+            (f"{metric}_{column}",),
+        )
         return return_partial
 
     should_be_partial.__doc__ = should_be_partial.__doc__.replace("{metric}", metric)
@@ -117,8 +295,10 @@ def row_count_should(
         be_less_than_or_equal_to=be_less_than_or_equal_to,
         be_greater_than=be_greater_than,
         be_greater_than_or_equal_to=be_greater_than_or_equal_to,
+        be_exactly=be_exactly,
     )
-    should_be_partial.required_metrics = {"length"}
+    should_be_partial.required_metrics = {"length"}  # type: ignore[attr-defined]
+    should_be_partial.range_check = ("row-count", "value", ("length",))  # type: ignore[attr-defined]
     return should_be_partial
 
 
@@ -159,7 +339,7 @@ def columns_should(
         )
 
     should_have_partial = partial(should_have, have=have, not_have=not_have, be=be)
-    should_have_partial.required_metrics = set()
+    should_have_partial.required_metrics = set()  # type: ignore[attr-defined]
     return should_have_partial
 
 
@@ -214,7 +394,7 @@ def type_should(
         not_be=not_be,
         be_one_of=be_one_of,
     )
-    should_be_partial.required_metrics = {"type"}
+    should_be_partial.required_metrics = {"type"}  # type: ignore[attr-defined]
     return should_be_partial
 
 
@@ -249,7 +429,7 @@ def average_difference_from_other_column_should(
         within designated bounds.
         """
         checks: list[bool] = []
-        difference = description[f"mean_{column}"] = description[f"mean_{other_column}"]
+        difference = description[f"mean_{column}"] - description[f"mean_{other_column}"]
         if be_exactly is not None:
             checks.append(difference == be_exactly)
         if be_less_than is not None:
@@ -276,7 +456,12 @@ def average_difference_from_other_column_should(
         be_greater_than=be_greater_than,
         be_greater_than_or_equal_to=be_greater_than_or_equal_to,
     )
-    should_partial.required_metrics = {"mean"}
+    should_partial.required_metrics = {"mean"}  # type: ignore[attr-defined]
+    should_partial.range_check = (  # type: ignore[attr-defined]
+        f"average-difference-from-{column}-to-{other_column}",
+        "difference",
+        (f"mean_{column}", f"mean_{other_column}"),
+    )
     return should_partial
 
 
@@ -340,7 +525,264 @@ def average_ratio_to_other_column_should(
         be_greater_than=be_greater_than,
         be_greater_than_or_equal_to=be_greater_than_or_equal_to,
     )
-    should_partial.required_metrics = {"mean"}
+    should_partial.required_metrics = {"mean"}  # type: ignore[attr-defined]
+    should_partial.range_check = (  # type: ignore[attr-defined]
+        f"average-ratio-between-{column}-and-{other_column}",
+        "ratio",
+        (f"mean_{column}", f"mean_{other_column}"),
+    )
+    return should_partial
+
+
+def quantile_should(
+    column: str,
+    quantile: float = 0.5,
+    be_exactly: float | int | None = None,
+    be_less_than: float | int | None = None,
+    be_less_than_or_equal_to: float | int | None = None,
+    be_greater_than: float | int | None = None,
+    be_greater_than_or_equal_to: float | int | None = None,
+    **kwargs,
+) -> Callable:
+    """
+    Test that the approximate value of column at quantile (between 0 and 1,
+    defaulting to the median) is within designated bounds.
+    """
+
+    def should(
+        description: dict,
+        column: str,
+        quantile: float,
+        be_exactly: float | int | None = None,
+        be_less_than: float | int | None = None,
+        be_less_than_or_equal_to: float | int | None = None,
+        be_greater_than: float | int | None = None,
+        be_greater_than_or_equal_to: float | int | None = None,
+        **kwargs,
+    ) -> result:
+        """
+        Test that the approximate value of column at quantile (between 0 and 1,
+        defaulting to the median) is within designated bounds.
+        """
+        sketch = description[f"quantiles_{column}"]
+        # Non-numeric columns aren't sketched, and empty sketches give None,
+        # neither have a value at quantile to pass
+        value = sketch.quantile(quantile) if sketch is not None else None
+        if value is None:
+            return result(name=f"quantile-{quantile}-of-{column}", success=False)
+        checks: list[bool] = []
+        if be_exactly is not None:
+            checks.append(value == be_exactly)
+        if be_less_than is not None:
+            checks.append(value < be_less_than)
+        if be_less_than_or_equal_to is not None:
+            checks.append(value <= be_less_than_or_equal_to)
+        if be_greater_than is not None:
+            checks.append(value > be_greater_than)
+        if be_greater_than_or_equal_to is not None:
+            checks.append(value >= be_greater_than_or_equal_to)
+        return result(
+            name=f"quantile-{quantile}-of-{column}",
+            success=all(checks),
+            unexpected=value if not all(checks) else None,
+        )
+
+    should_partial = partial(
+        should,
+        column=column,
+        quantile=quantile,
+        be_exactly=be_exactly,
+        be_less_than=be_less_than,
+        be_less_than_or_equal_to=be_less_than_or_equal_to,
+        be_greater_than=be_greater_than,
+        be_greater_than_or_equal_to=be_greater_than_or_equal_to,
+    )
+    should_partial.required_metrics = {"quantiles"}  # type: ignore[attr-defined]
+    return should_partial
+
+
+def _row_check_key(name: str, keywords: dict[str, Any]) -> str:
+    """
+    Internal function, give a short key identifying a row check by its test name
+    and keywords, so that identical checks are only calculated once.
+    """
+    signature = repr((name, sorted(keywords.items())))
+    return blake2b(signature.encode(), digest_size=8).hexdigest()
+
+
+def _passes(value: Any, checks: list[Any], not_be_null: bool) -> Any:
+    """
+    Internal function, combine row checks of value into a single expression,
+    true for rows that pass. Null values pass unless `not_be_null` is given.
+    """
+    # Null checks come first, as some backends (such as pandas) give nulls
+    # rather than booleans for checks of null values
+    is_null = value.is_null()
+    if checks:
+        combined = reduce(operator.and_, checks)
+        return ~is_null & combined if not_be_null else is_null | combined
+    return ~is_null if not_be_null else is_null | ~is_null
+
+
+def _bounds_checks(
+    value: Any,
+    be_exactly: float | int | None = None,
+    be_less_than: float | int | None = None,
+    be_less_than_or_equal_to: float | int | None = None,
+    be_greater_than: float | int | None = None,
+    be_greater_than_or_equal_to: float | int | None = None,
+) -> list[Any]:
+    """Internal function, row check expressions for bounds of value"""
+    checks: list[Any] = []
+    if be_exactly is not None:
+        checks.append(value == be_exactly)
+    if be_less_than is not None:
+        checks.append(value < be_less_than)
+    if be_less_than_or_equal_to is not None:
+        checks.append(value <= be_less_than_or_equal_to)
+    if be_greater_than is not None:
+        checks.append(value > be_greater_than)
+    if be_greater_than_or_equal_to is not None:
+        checks.append(value >= be_greater_than_or_equal_to)
+    return checks
+
+
+def _row_check_should(
+    description: dict,
+    key: str,
+    name: str,
+    max_failing_fraction: float = 0.0,
+    sample_failing_rows: int = 0,
+    **kwargs,
+) -> result:
+    """
+    Test that the fraction of rows failing a row check is no more than
+    `max_failing_fraction`, giving up to `sample_failing_rows` failing rows
+    (identical checks share a sample, so there may be more in description)
+    """
+    failing_count = int(description[f"failing_count_{key}"])
+    length = description["length"]
+    success = (failing_count / length if length else 0.0) <= max_failing_fraction
+    failing_rows = (
+        description.get(f"failing_rows_{key}") if sample_failing_rows else None
+    )
+    return result(
+        name=name,
+        success=success,
+        unexpected=failing_count if not success else None,
+        failing_count=failing_count,
+        failing_rows=failing_rows[:sample_failing_rows] if failing_rows else None,
+    )
+
+
+def values_should(
+    column: str,
+    be_one_of: list | None = None,
+    not_be_one_of: list | None = None,
+    match_regex: str | None = None,
+    be_exactly: float | int | None = None,
+    be_less_than: float | int | None = None,
+    be_less_than_or_equal_to: float | int | None = None,
+    be_greater_than: float | int | None = None,
+    be_greater_than_or_equal_to: float | int | None = None,
+    not_be_null: bool = False,
+    max_failing_fraction: float = 0.0,
+    sample_failing_rows: int = 0,
+    **kwargs,
+) -> Callable:
+    """
+    Test that every value in column passes designated checks, null values will
+    only fail if not_be_null is true. Up to max_failing_fraction of rows are
+    allowed to fail, and up to sample_failing_rows failing rows will be given.
+    """
+    keywords = {
+        "be_one_of": be_one_of,
+        "not_be_one_of": not_be_one_of,
+        "match_regex": match_regex,
+        "be_exactly": be_exactly,
+        "be_less_than": be_less_than,
+        "be_less_than_or_equal_to": be_less_than_or_equal_to,
+        "be_greater_than": be_greater_than,
+        "be_greater_than_or_equal_to": be_greater_than_or_equal_to,
+        "not_be_null": not_be_null,
+    }
+    value = nw.col(column)
+    checks: list[Any] = _bounds_checks(
+        value,
+        be_exactly=be_exactly,
+        be_less_than=be_less_than,
+        be_less_than_or_equal_to=be_less_than_or_equal_to,
+        be_greater_than=be_greater_than,
+        be_greater_than_or_equal_to=be_greater_than_or_equal_to,
+    )
+    if be_one_of is not None:
+        checks.append(value.is_in(be_one_of))
+    if not_be_one_of is not None:
+        checks.append(~value.is_in(not_be_one_of))
+    if match_regex is not None:
+        checks.append(value.str.contains(match_regex))
+    key = _row_check_key("values_should", {"column": column} | keywords)
+    should_partial = partial(
+        _row_check_should,
+        key=key,
+        name=f"values-of-{column}",
+        column=column,
+        max_failing_fraction=max_failing_fraction,
+        sample_failing_rows=sample_failing_rows,
+    )
+    should_partial.required_metrics = {"length"}  # type: ignore[attr-defined]
+    should_partial.required_expressions = {  # type: ignore[attr-defined]
+        key: (_passes(value, checks, not_be_null), sample_failing_rows)
+    }
+    return should_partial
+
+
+def difference_from_other_column_should(
+    column: str,
+    other_column: str,
+    be_exactly: float | int | None = None,
+    be_less_than: float | int | None = None,
+    be_less_than_or_equal_to: float | int | None = None,
+    be_greater_than: float | int | None = None,
+    be_greater_than_or_equal_to: float | int | None = None,
+    max_failing_fraction: float = 0.0,
+    sample_failing_rows: int = 0,
+    **kwargs,
+) -> Callable:
+    """
+    Test that, for every row, the difference between column and other column
+    is within designated bounds, rows where either is null will pass. Up to
+    max_failing_fraction of rows are allowed to fail, and up to
+    sample_failing_rows failing rows will be given.
+    """
+    bounds = {
+        "be_exactly": be_exactly,
+        "be_less_than": be_less_than,
+        "be_less_than_or_equal_to": be_less_than_or_equal_to,
+        "be_greater_than": be_greater_than,
+        "be_greater_than_or_equal_to": be_greater_than_or_equal_to,
+    }
+    difference = nw.col(column) - nw.col(other_column)
+    key = _row_check_key(
+        "difference_from_other_column_should",
+        {"column": column, "other_column": other_column} | bounds,
+    )
+    should_partial = partial(
+        _row_check_should,
+        key=key,
+        name=f"difference-from-{column}-to-{other_column}",
+        column=column,
+        other_column=other_column,
+        max_failing_fraction=max_failing_fraction,
+        sample_failing_rows=sample_failing_rows,
+    )
+    should_partial.required_metrics = {"length"}  # type: ignore[attr-defined]
+    should_partial.required_expressions = {  # type: ignore[attr-defined]
+        key: (
+            _passes(difference, _bounds_checks(difference, **bounds), False),
+            sample_failing_rows,
+        )
+    }
     return should_partial
 
 
@@ -354,6 +796,10 @@ possible_tests: dict[str, Callable] = {
     "null_percentage_should": (
         null_percentage_should := _range_check("null_percentage")
     ),
+    "distinct_count_should": (distinct_count_should := _range_check("distinct_count")),
+    "quantile_should": quantile_should,
+    "values_should": values_should,
+    "difference_from_other_column_should": difference_from_other_column_should,
     "columns_should": columns_should,
     "type_should": type_should,
     "row_count_should": row_count_should,
@@ -0,0 +1,209 @@
+"""
+Evaluation of many range-style tests at once, as arrays of values and bounds.
+
+Range-style tests (such as `max_should` or `row_count_should`) carry a
+`range_check` attribute, giving their result name, how their value is
+calculated ("value", "difference" or "ratio") and the description keys it's
+calculated from. These are compiled once per contract, then evaluated with a
+handful of numpy comparisons rather than a python call per test.
+
+Results match those of calling each test, any test whose value or bounds can't
+be compared exactly as floats (such as strings, nulls, or very large integers)
+is simply called instead, as is every test if numpy isn't installed.
+"""
+
+from dataclasses import dataclass
+from numbers import Integral
+from operator import itemgetter
+from typing import Any, Callable
+
+from wimsey.tests import result, result_table
+
+_BOUNDS: tuple[str, ...] = (
+    "be_exactly",
+    "be_less_than",
+    "be_less_than_or_equal_to",
+    "be_greater_than",
+    "be_greater_than_or_equal_to",
+)
+# Integers beyond this can't be converted to floats (or subtracted) exactly
+_MAX_EXACT_INT: int = 2**52
+_OPERATIONS: tuple[str, ...] = ("value", "difference", "ratio")
+
+
+@dataclass(frozen=True)
+class RangeChecks:
+    """
+    Range-style tests of a contract, compiled to arrays. `positions` gives the
+    index of each within the contract's tests, and bounds are held as an array
+    of values alongside an array of whether each bound was given.
+    """
+
+    positions: list[int]
+    names: list[str]
+    operations: Any
+    keys: list[str]
+    other_keys: list[str]
+    bounds: Any
+    given: Any
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def _is_exact(value: Any) -> bool:
+    """
+    Internal function, check whether a value compares the same as a python
+    number and as a numpy float.
+    """
+    if isinstance(value, float):
+        return True
+    if isinstance(value, Integral):
+        return -_MAX_EXACT_INT <= int(value) <= _MAX_EXACT_INT
+    return False
+
+
+def compile_range_checks(tests: list[Callable]) -> RangeChecks | None:
+    """
+    Compile range-style tests to arrays for evaluation with `evaluate`, giving
+    None if there are none, or numpy isn't installed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    positions: list[int] = []
+    names: list[str] = []
+    operations: list[int] = []
+    keys: list[str] = []
+    other_keys: list[str] = []
+    bounds: list[list[float]] = []
+    given: list[list[bool]] = []
+    for position, test in enumerate(tests):
+        range_check = getattr(test, "range_check", None)
+        if range_check is None:
+            continue
+        test_bounds = [test.keywords.get(i) for i in _BOUNDS]  # type: ignore[attr-defined]
+        if not all(i is None or _is_exact(i) for i in test_bounds):
+            continue
+        name, operation, test_keys = range_check
+        positions.append(position)
+        names.append(name)
+        operations.append(_OPERATIONS.index(operation))
+        keys.append(test_keys[0])
+        other_keys.append(test_keys[-1])
+        bounds.append([0.0 if i is None else float(i) for i in test_bounds])
+        given.append([i is not None for i in test_bounds])
+    if not positions:
+        return None
+    return RangeChecks(
+        positions=positions,
+        names=names,
+        operations=np.array(operations, dtype=np.int8),
+        keys=keys,
+        other_keys=other_keys,
+        bounds=np.array(bounds, dtype=np.float64).T,
+        given=np.array(given, dtype=np.bool_).T,
+    )
+
+
+def _lookup(keys: list[str], description: dict[str, Any]) -> list[Any]:
+    """Internal function, look up many keys of description at once"""
+    if len(keys) == 1:
+        return [description[keys[0]]]
+    return list(itemgetter(*keys)(description))
+
+
+def _unexpected(operation: int, value: Any, other: Any) -> Any:
+    """Internal function, calculate the value of a test as its test would"""
+    if operation == 1:
+        return value - other
+    if operation == 2:
+        return value / other
+    return value
+
+
+def evaluate(
+    tests: list[Callable],
+    range_checks: RangeChecks,
+    description: dict[str, Any],
+) -> result_table:
+    """
+    Evaluate tests against description, comparing all range-style tests at once,
+    and calling the rest (or any that can't be compared exactly) one by one.
+    """
+    import numpy as np
+
+    values = _lookup(range_checks.keys, description)
+    others = _lookup(range_checks.other_keys, description)
+    operations = range_checks.operations
+    if set(map(type, values)) | set(map(type, others)) <= {float, int, bool}:
+        value_array = np.array(values, np.float64)
+        other_array = np.array(others, np.float64)
+        # Large floats would compare exactly too, but it's quicker to leave
+        # them (along with nan and infinity) to the test than to check types
+        exact = (np.abs(value_array) <= _MAX_EXACT_INT) & (
+            np.abs(other_array) <= _MAX_EXACT_INT
+        )
+    else:
+        exact = np.fromiter(
+            (_is_exact(i) and _is_exact(j) for i, j in zip(values, others)),
+            dtype=np.bool_,
+            count=len(values),
+        )
+        value_array = np.array(
+            [i if j else 0.0 for i, j in zip(values, exact)], np.float64
+        )
+        other_array = np.array(
+            [i if j else 1.0 for i, j in zip(others, exact)], np.float64
+        )
+    # Division by zero raises an exception in python, so is left to the test
+    exact &= (operations != 2) | (other_array != 0)
+    with np.errstate(all="ignore"):
+        calculated = np.where(
+            operations == 1,
+            value_array - other_array,
+            np.where(operations == 2, value_array / other_array, value_array),
+        )
+        bounds, given = range_checks.bounds, range_checks.given
+        success = (
+            (~given[0] | (calculated == bounds[0]))
+            & (~given[1] | (calculated < bounds[1]))
+            & (~given[2] | (calculated <= bounds[2]))
+            & (~given[3] | (calculated > bounds[3]))
+            & (~given[4] | (calculated >= bounds[4]))
+        )
+
+    size = len(tests)
+    columns: dict[str, list] = {
+        "name": [None] * size,
+        "success": [None] * size,
+        "unexpected": [None] * size,
+        "failing_count": [None] * size,
+        "failing_rows": [None] * size,
+    }
+    vectorised = [False] * size
+    if len(range_checks) == size and exact.all():
+        # Every test is range-style, so positions are just 0 to size
+        columns["name"] = list(range_checks.names)
+        columns["success"] = success.tolist()
+        vectorised = [True] * size
+    else:
+        for i in np.flatnonzero(exact).tolist():
+            position = range_checks.positions[i]
+            vectorised[position] = True
+            columns["name"][position] = range_checks.names[i]
+            columns["success"][position] = bool(success[i])
+    for i in np.flatnonzero(exact & ~success).tolist():
+        columns["unexpected"][range_checks.positions[i]] = _unexpected(
+            int(operations[i]), values[i], others[i]
+        )
+    if all(vectorised):
+        return result_table(columns)
+    for position, test in enumerate(tests):
+        if vectorised[position]:
+            continue
+        test_result = test(description)
+        for field_name, column in columns.items():
+            column[position] = getattr(test_result, field_name)
+    return result_table(columns)